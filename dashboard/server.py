@@ -1,15 +1,41 @@
 """Percept Dashboard API Server — port 8960 (SQLite-backed)"""
-import hashlib, hmac, os, re, json, time, datetime, uuid, secrets
+import asyncio, hashlib, hmac, os, re, time, uuid, secrets
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, Query, Request
-from fastapi.responses import FileResponse, JSONResponse, HTMLResponse, RedirectResponse
-import uvicorn, httpx
+from fastapi.responses import (FileResponse, JSONResponse, HTMLResponse, RedirectResponse, Response,
+                               StreamingResponse)
+import orjson, uvicorn, httpx
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.database import PerceptDB
 
-app = FastAPI(title="Percept Dashboard API")
+
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson — much faster on large export/analytics payloads."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the vector store once per process instead of once per search request."""
+    app.state.vs, app.state.vs_error = None, None
+    try:
+        from src.vector_store import PerceptVectorStore
+        app.state.vs = await asyncio.to_thread(PerceptVectorStore)
+    except Exception as e:
+        app.state.vs_error = str(e)
+    yield
+    await _http_client.aclose()
+
+
+app = FastAPI(title="Percept Dashboard API", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Use relative paths from dashboard directory
 BASE = Path(__file__).resolve().parent.parent
@@ -20,6 +46,10 @@ START_TIME = time.time()
 
 db = PerceptDB(str(DATA / "percept.db"))
 
+# Shared client so /api/health polls reuse a keep-alive connection to the receiver
+# (closed in lifespan)
+_http_client = httpx.AsyncClient(timeout=2, limits=httpx.Limits(max_keepalive_connections=4))
+
 # --- Auth helpers ---
 _COOKIE_NAME = "percept_session"
 _COOKIE_SECRET = secrets.token_hex(32)  # rotates on restart (intentional)
@@ -69,6 +99,35 @@ def _auth_redirect_or_401(request: Request):
     return RedirectResponse("/login", status_code=302)
 
 
+# --- Response cache (polled aggregate endpoints) ---
+
+_CACHE_TTL_S = 10
+_response_cache: dict[str, tuple[float, int, bytes, str]] = {}  # key -> (expires, data_version, body, etag)
+_cache_lock = asyncio.Lock()
+
+
+async def _cached_json(request: Request, key: str, build) -> Response:
+    """Serve build() through a short TTL cache with ETag / 304 support.
+
+    Entries expire after _CACHE_TTL_S or as soon as this process writes to the DB
+    (db.data_version changes), whichever comes first.
+    """
+    now = time.monotonic()
+    async with _cache_lock:
+        hit = _response_cache.get(key)
+        if hit and hit[0] > now and hit[1] == db.data_version:
+            _, _, body, etag = hit
+        else:
+            version = db.data_version
+            body = orjson.dumps(build(), option=_ORJSON_OPTS)
+            etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+            _response_cache[key] = (now + _CACHE_TTL_S, version, body, etag)
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={_CACHE_TTL_S}"}
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
 # --- Login/Logout routes ---
 
 LOGIN_HTML = """<!DOCTYPE html>
@@ -149,11 +208,10 @@ async def health():
     percept_ok = False
     percept_data = {}
     try:
-        async with httpx.AsyncClient(timeout=2) as c:
-            r = await c.get("http://localhost:8900/health")
-            if r.status_code == 200:
-                percept_ok = True
-                percept_data = r.json()
+        r = await _http_client.get("http://localhost:8900/health")
+        if r.status_code == 200:
+            percept_ok = True
+            percept_data = r.json()
     except:
         pass
     # DB status
@@ -213,7 +271,7 @@ async def speakers():
 async def contacts():
     contacts_file = DATA / "contacts.json"
     if contacts_file.exists():
-        return json.loads(contacts_file.read_text())
+        return orjson.loads(contacts_file.read_bytes())
     return {}
 
 # --- Address Book API Endpoints ---
@@ -294,44 +352,83 @@ async def actions(status: str = None, limit: int = 50):
     return db.get_actions(status=status, limit=limit)
 
 
+# (inode, size, newline count, last bytes) of LIVE_TXT at the last poll, so
+# the line count only has to scan bytes appended since then
+_live_count: tuple[int, int, int, bytes] = (0, 0, 0, b"")
+
+
+def _count_live_newlines(f, st) -> int:
+    """Count newlines in LIVE_TXT, scanning only what was appended since the last call."""
+    global _live_count
+    ino, size, count, marker = _live_count
+    if st.st_ino == ino and size <= st.st_size:
+        f.seek(size - len(marker))
+        if f.read(len(marker)) != marker:
+            size = 0  # rewritten in place
+    else:
+        size = 0  # rotated or truncated
+    if size == 0:
+        count = 0
+    # Stop at st_size: bytes appended after the fstat are counted on the next poll
+    f.seek(size)
+    remaining = st.st_size - size
+    while remaining > 0 and (chunk := f.read(min(1 << 20, remaining))):
+        count += chunk.count(b"\n")
+        remaining -= len(chunk)
+    marker_start = max(0, st.st_size - 64)
+    f.seek(marker_start)
+    _live_count = (st.st_ino, st.st_size, count, f.read(st.st_size - marker_start))
+    return count
+
+
+def _tail_live(max_lines: int = 100) -> dict:
+    """Read the last max_lines of LIVE_TXT by seeking from the end."""
+    with LIVE_TXT.open("rb") as f:
+        st = os.fstat(f.fileno())
+        window = 64_000
+        while True:
+            start = max(0, st.st_size - window)
+            f.seek(start)
+            chunk = f.read(st.st_size - start)
+            if start == 0 or chunk.count(b"\n") > max_lines:
+                break
+            window *= 4
+        if start > 0:
+            chunk = chunk[chunk.index(b"\n") + 1:]  # drop the partial first line
+        lines = chunk.decode("utf-8", "replace").strip().split("\n")[-max_lines:]
+        total = _count_live_newlines(f, st)
+        if st.st_size and not chunk.endswith(b"\n"):
+            total += 1
+    return {"lines": lines, "total_lines": total}
+
+
 @app.get("/api/live")
 async def live():
     if LIVE_TXT.exists():
-        text = LIVE_TXT.read_text(errors="replace")
-        lines = text.strip().split("\n")[-100:]
-        return {"lines": lines, "total_lines": len(text.strip().split("\n"))}
+        return _tail_live()
     return {"lines": [], "total_lines": 0}
 
 
 @app.get("/api/analytics")
-async def analytics(period: str = "all"):
-    today = db.get_analytics("today")
-    week = db.get_analytics("week")
-    month = db.get_analytics("month")
-    all_time = db.get_analytics("all")
-    speaker_stats = db.get_speaker_stats()
-
-    # Segments per hour today
-    today_convs = db.get_conversations(date=datetime.datetime.now().strftime("%Y-%m-%d"), limit=500)
-    seg_per_hour = {}
-    for c in today_convs:
-        ts = c.get("timestamp", 0)
-        h = datetime.datetime.fromtimestamp(ts).strftime("%H") if ts else "00"
-        seg_per_hour[h] = seg_per_hour.get(h, 0) + (c.get("segment_count") or 0)
-
-    speaker_words = {s["id"]: s["total_words"] for s in speaker_stats}
+async def analytics(request: Request, period: str = "all"):
+    return await _cached_json(request, f"analytics:{period}", _build_analytics)
+
+
+def _build_analytics() -> dict:
+    bundle = db.get_analytics_bundle()
+    speaker_words = {s["id"]: s["total_words"] for s in db.get_speaker_stats()}
 
     return {
-        "total_words": all_time["total_words"],
-        "today_words": today["total_words"],
-        "week_words": week["total_words"],
-        "month_words": month["total_words"],
-        "total_duration_s": all_time["total_duration_s"],
+        "total_words": bundle["total_words"],
+        "today_words": bundle["today_words"],
+        "week_words": bundle["week_words"],
+        "month_words": bundle["month_words"],
+        "total_duration_s": bundle["total_duration_s"],
         "speaker_words": speaker_words,
-        "segments_per_hour": seg_per_hour,
+        "segments_per_hour": bundle["segments_per_hour"],
         "actions": db.get_actions(limit=50),
-        "conversation_count": all_time["conversation_count"],
-        "summary_count": len([c for c in db.get_conversations(limit=500) if c.get("summary_file_path")]),
+        "conversation_count": bundle["conversation_count"],
+        "summary_count": bundle["summary_count"],
     }
 
 
@@ -343,23 +440,36 @@ async def utterances(conversation_id: str = None):
     return {"error": "conversation_id required"}
 
 
+def _vector_store(request: Request):
+    """Vector store created in lifespan; raises with the startup error if it failed to load."""
+    vs = request.app.state.vs
+    if vs is None:
+        raise RuntimeError(request.app.state.vs_error or "vector store unavailable")
+    return vs
+
+
 @app.get("/api/search")
-async def search_utterances(q: str = "", limit: int = 20):
-    """FTS5 search across utterances, with fallback to vector search."""
+async def search_utterances(request: Request, q: str = "", limit: int = 20):
+    """FTS5 and vector search across utterances, run in parallel and merged."""
     if not q:
         return {"results": [], "query": ""}
-    # Try FTS5 first
-    results = db.search_utterances(q, limit=limit)
-    if results:
-        return {"results": results, "query": q, "source": "fts5"}
-    # Fallback to vector search
-    try:
-        from src.vector_store import PerceptVectorStore
-        vs = PerceptVectorStore()
-        results = vs.search(q, limit=limit)
-        return {"results": results, "query": q, "source": "vector"}
-    except Exception as e:
-        return {"results": [], "query": q, "error": str(e)}
+
+    async def vector_search():
+        return await asyncio.to_thread(_vector_store(request).search, q, limit=limit)
+
+    fts, vec = await asyncio.gather(asyncio.to_thread(db.search_utterances, q, limit=limit),
+                                    vector_search(), return_exceptions=True)
+    if isinstance(fts, Exception):
+        fts = []
+    if isinstance(vec, Exception):
+        if not fts:
+            return {"results": [], "query": q, "error": str(vec)}
+        vec = []
+    # Exact-term FTS hits first; vector chunks only for conversations FTS didn't find
+    seen = {r.get("conversation_id") for r in fts}
+    merged = fts + [r for r in vec if r.get("conversation_id") not in seen]
+    source = "hybrid" if fts and vec else ("fts5" if fts else "vector")
+    return {"results": merged[:limit], "query": q, "source": source}
 
 
 @app.get("/api/relationships")
@@ -369,22 +479,31 @@ async def relationships(entity_id: str = None):
 
 
 @app.get("/api/entities")
-async def entities():
+async def entities(request: Request):
     """List all known entities with mention counts."""
     try:
-        rows = db._conn.execute("""
-            SELECT entity_name, entity_type, COUNT(*) as mention_count,
-                   MAX(timestamp) as last_mentioned
-            FROM entity_mentions
-            GROUP BY entity_name, entity_type
-            ORDER BY mention_count DESC
-            LIMIT 200
-        """).fetchall()
-        return [dict(r) for r in rows]
+        return await _cached_json(request, "entities", _build_entities)
     except Exception as e:
         return {"error": str(e)}
 
 
+_ENTITY_COLS = ("entity_name", "entity_type", "mention_count", "last_mentioned")
+
+
+def _build_entities() -> list[dict]:
+    # Plain tuple rows: skip sqlite3.Row wrapping for a fixed, known column order
+    cur = db._conn.cursor()
+    cur.row_factory = None
+    cur.execute("""
+        SELECT entity_name, entity_type, COUNT(*), MAX(timestamp)
+        FROM entity_mentions
+        GROUP BY 1, 2
+        ORDER BY 3 DESC
+        LIMIT 200
+    """)
+    return [dict(zip(_ENTITY_COLS, r)) for r in cur]
+
+
 @app.get("/api/audit")
 async def audit():
     """Data audit stats."""
@@ -392,12 +511,10 @@ async def audit():
 
 
 @app.get("/api/vector-stats")
-async def vector_stats():
+async def vector_stats(request: Request):
     """Vector store statistics."""
     try:
-        from src.vector_store import PerceptVectorStore
-        vs = PerceptVectorStore()
-        return vs.stats()
+        return _vector_store(request).stats()
     except Exception as e:
         return {"error": str(e)}
 
@@ -477,19 +594,26 @@ async def purge_data(request: Request):
 
 @app.get("/api/export")
 async def export_data():
-    data = {
-        "conversations": db.get_conversations(limit=10000),
-        "speakers": db.get_speakers(),
-        "contacts": db.get_contacts(),
-        "actions": db.get_actions(limit=10000),
-        "relationships": db.get_relationships(),
-        "settings": db.get_all_settings(),
-        "audit": db.audit(),
-    }
-    return JSONResponse(content=data, headers={
+    def generate():
+        # Stream one top-level JSON object; the two large tables go out row by row
+        yield b'{"conversations":['
+        for i, c in enumerate(db.iter_conversations(limit=10000)):
+            yield (b"," if i else b"") + orjson.dumps(c, option=_ORJSON_OPTS)
+        yield b'],"speakers":' + orjson.dumps(db.get_speakers(), option=_ORJSON_OPTS)
+        yield b',"contacts":' + orjson.dumps(db.get_contacts(), option=_ORJSON_OPTS)
+        yield b',"actions":['
+        for i, a in enumerate(db.iter_actions(limit=10000)):
+            yield (b"," if i else b"") + orjson.dumps(a, option=_ORJSON_OPTS)
+        yield b'],"relationships":' + orjson.dumps(db.get_relationships(), option=_ORJSON_OPTS)
+        yield b',"settings":' + orjson.dumps(db.get_all_settings(), option=_ORJSON_OPTS)
+        yield b',"audit":' + orjson.dumps(db.audit(), option=_ORJSON_OPTS) + b"}"
+
+    return StreamingResponse(generate(), media_type="application/json", headers={
         "Content-Disposition": "attachment; filename=percept-export.json"
     })
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8960)
+    # uvicorn[standard] ships uvloop + httptools; access log off keeps /api/live polling cheap
+    uvicorn.run(app, host="0.0.0.0", port=8960, loop="uvloop", http="httptools",
+                log_level="warning", access_log=False)
@@ -1,8 +1,12 @@
 """Backfill SQLite database from existing markdown files and JSON."""
 
+import bisect
 import json
+import os
 import re
 import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -16,6 +20,17 @@ SPEAKERS_JSON = DATA / "speakers.json"
 CONTACTS_JSON = DATA / "contacts.json"
 DB_PATH = DATA / "percept.db"
 
+CONV_NAME_RE = re.compile(r"(\d{4}-\d{2}-\d{2})_(\d{2}-\d{2})")
+# One pass over a conversation file: metadata fields + transcript lines
+META_RE = re.compile(
+    r"\*\*Duration:\*\*\s*(?P<dur>[\d.]+)s"
+    r"|\*\*Segments:\*\*\s*(?P<seg>\d+)"
+    r"|\*\*Topics:\*\*\s*(?P<top>.+)"
+    r"|\*\*People:\*\*\s*(?P<peo>.+)"
+    r"|^\*\*\[[\d.-]+s[ \t]*-[ \t]*[\d.-]+s\][ \t]*(?P<spk>SPEAKER_\d+):\*\*[ \t]*(?P<utt>.*)",
+    re.MULTILINE,
+)
+
 
 def parse_conv_file(fp: Path) -> dict:
     text = fp.read_text(errors="replace")
@@ -25,7 +40,7 @@ def parse_conv_file(fp: Path) -> dict:
     meta["id"] = fp.stem
 
     # Date/time from filename
-    dm = re.match(r"(\d{4}-\d{2}-\d{2})_(\d{2}-\d{2})", fp.name)
+    dm = CONV_NAME_RE.match(fp.name)
     if dm:
         meta["date"] = dm.group(1)
         time_str = dm.group(2).replace("-", ":")
@@ -38,34 +53,34 @@ def parse_conv_file(fp: Path) -> dict:
         meta["date"] = datetime.fromtimestamp(fp.stat().st_mtime).strftime("%Y-%m-%d")
         meta["timestamp"] = fp.stat().st_mtime
 
-    # Duration
-    m = re.search(r"\*\*Duration:\*\*\s*([\d.]+)s", text)
-    meta["duration_seconds"] = float(m.group(1)) if m else 0
-
-    # Segments
-    m = re.search(r"\*\*Segments:\*\*\s*(\d+)", text)
-    meta["segment_count"] = int(m.group(1)) if m else 0
-
-    # Topics
-    m = re.search(r"\*\*Topics:\*\*\s*(.+)", text)
-    meta["topics"] = [t.strip() for t in m.group(1).split(",")] if m else []
-
-    # People/speakers
-    m = re.search(r"\*\*People:\*\*\s*(.+)", text)
-    meta["speakers"] = [p.strip() for p in m.group(1).split(",")] if m else []
-
-    # Transcript lines
+    # Single scan: first occurrence wins for each metadata field
+    fields = {}
     transcript_lines = []
-    for line in text.split("\n"):
-        tm = re.match(r"\*\*\[[\d.-]+s\s*-\s*[\d.-]+s\]\s*(SPEAKER_\d+):\*\*\s*(.*)", line)
-        if tm:
-            transcript_lines.append(f"[{tm.group(1)}] {tm.group(2)}")
+    for m in META_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == "utt":
+            transcript_lines.append(f"[{m.group('spk')}] {m.group('utt')}")
+        elif kind not in fields:
+            fields[kind] = m.group(kind)
+
+    meta["duration_seconds"] = float(fields["dur"]) if "dur" in fields else 0
+    meta["segment_count"] = int(fields["seg"]) if "seg" in fields else 0
+    meta["topics"] = [t.strip() for t in fields["top"].split(",")] if "top" in fields else []
+    meta["speakers"] = [p.strip() for p in fields["peo"].split(",")] if "peo" in fields else []
     meta["transcript"] = "\n".join(transcript_lines)
     meta["word_count"] = sum(len(l.split()) - 1 for l in transcript_lines) if transcript_lines else 0
 
     return meta
 
 
+def _parse_conv_file_safe(fp: Path) -> tuple[dict | None, str | None]:
+    """parse_conv_file for pool workers: returns (meta, error) instead of raising."""
+    try:
+        return parse_conv_file(fp), None
+    except Exception as e:
+        return None, str(e)
+
+
 def parse_summary_file(fp: Path) -> dict:
     text = fp.read_text(errors="replace")
     meta = {"file_path": str(fp)}
@@ -105,66 +120,109 @@ def parse_summary_file(fp: Path) -> dict:
     return meta
 
 
+def build_conversation_index(convs: list[dict]) -> dict:
+    """Group conversations by date into (sorted timestamps, conversations) for bisect lookup."""
+    by_date = defaultdict(list)
+    for c in convs:
+        by_date[c["date"]].append(c)
+    index = {}
+    for date, items in by_date.items():
+        items.sort(key=lambda c: c["timestamp"])
+        index[date] = ([c["timestamp"] for c in items], items)
+    return index
+
+
+def add_to_conversation_index(index: dict, conv: dict):
+    """Insert a conversation into an index from build_conversation_index, keeping it sorted."""
+    stamps, convs = index.setdefault(conv["date"], ([], []))
+    i = bisect.bisect_right(stamps, conv["timestamp"])
+    stamps.insert(i, conv["timestamp"])
+    convs.insert(i, conv)
+
+
+def find_closest_conversation(index: dict, date: str, timestamp: float,
+                              max_diff: float = 300) -> dict | None:
+    """Return the same-day conversation nearest to timestamp, if within max_diff seconds."""
+    stamps, convs = index.get(date, ((), ()))
+    i = bisect.bisect_left(stamps, timestamp)
+    best = None
+    best_diff = max_diff
+    for j in (i, i - 1):  # neighbours on either side; later one wins ties
+        if 0 <= j < len(stamps):
+            diff = abs(stamps[j] - timestamp)
+            if diff < best_diff:
+                best_diff = diff
+                best = convs[j]
+    return best
+
+
 def main():
     print(f"Backfilling database at {DB_PATH}")
     db = PerceptDB(str(DB_PATH))
+    # Bulk load: one transaction per table, WAL without per-commit fsync
+    with db._lock:
+        db._conn.execute("PRAGMA synchronous=NORMAL")
+        db._conn.execute("PRAGMA temp_store=MEMORY")
 
     # 1. Import conversations
     conv_files = sorted(CONV_DIR.glob("*.md")) if CONV_DIR.exists() else []
     print(f"Found {len(conv_files)} conversation files")
-    for fp in conv_files:
-        try:
-            m = parse_conv_file(fp)
-            db.save_conversation(
-                id=m["id"], timestamp=m["timestamp"], date=m["date"],
-                duration_seconds=m.get("duration_seconds"),
-                segment_count=m.get("segment_count"),
-                word_count=m.get("word_count"),
-                speakers=m.get("speakers"), topics=m.get("topics"),
-                transcript=m.get("transcript"), file_path=m.get("file_path"),
-            )
-        except Exception as e:
-            print(f"  Error: {fp.name}: {e}")
+    conv_rows = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        parsed = pool.map(_parse_conv_file_safe, conv_files, chunksize=16)
+        for fp, (m, err) in zip(conv_files, parsed):
+            if err:
+                print(f"  Error: {fp.name}: {err}")
+                continue
+            conv_rows.append({
+                "id": m["id"], "timestamp": m["timestamp"], "date": m["date"],
+                "duration_seconds": m.get("duration_seconds"),
+                "segment_count": m.get("segment_count"),
+                "word_count": m.get("word_count"),
+                "speakers": m.get("speakers"), "topics": m.get("topics"),
+                "transcript": m.get("transcript"), "file_path": m.get("file_path"),
+            })
+    db.save_conversations_batch(conv_rows)
     print(f"  Imported {len(conv_files)} conversations")
 
     # 2. Import summaries — match to closest conversation by timestamp
     summ_files = sorted(SUMM_DIR.glob("*.md")) if SUMM_DIR.exists() else []
     print(f"Found {len(summ_files)} summary files")
+    summ_rows = []
+    conv_index = build_conversation_index(db.get_conversations(limit=100000))
     for fp in summ_files:
         try:
             s = parse_summary_file(fp)
             # Find closest conversation within 5 minutes
-            convs = db.get_conversations(date=s["date"], limit=200)
-            best = None
-            best_diff = 300  # 5 min max
-            for c in convs:
-                diff = abs(c["timestamp"] - s["timestamp"])
-                if diff < best_diff:
-                    best_diff = diff
-                    best = c
+            best = find_closest_conversation(conv_index, s["date"], s["timestamp"])
+            # Rows are saved in one batch below, so keep the index current for
+            # later summaries, as the per-summary DB writes used to
             if best:
                 # Update conversation with summary data
-                db.save_conversation(
-                    id=best["id"], timestamp=best["timestamp"], date=best["date"],
-                    duration_seconds=s.get("duration_min", 0) * 60 or best.get("duration_seconds"),
-                    segment_count=s.get("segments") or best.get("segment_count"),
-                    word_count=s.get("word_count") or best.get("word_count"),
-                    transcript=s.get("transcript") or best.get("transcript"),
-                    summary_file_path=str(fp),
-                )
+                row = {
+                    "id": best["id"], "timestamp": best["timestamp"], "date": best["date"],
+                    "duration_seconds": s.get("duration_min", 0) * 60 or best.get("duration_seconds"),
+                    "segment_count": s.get("segments") or best.get("segment_count"),
+                    "word_count": s.get("word_count") or best.get("word_count"),
+                    "transcript": s.get("transcript") or best.get("transcript"),
+                    "summary_file_path": str(fp),
+                }
+                best.update(row)
             else:
                 # Create standalone conversation from summary
-                conv_id = fp.stem
-                db.save_conversation(
-                    id=conv_id, timestamp=s["timestamp"], date=s["date"],
-                    duration_seconds=s.get("duration_min", 0) * 60,
-                    segment_count=s.get("segments"),
-                    word_count=s.get("word_count"),
-                    transcript=s.get("transcript"),
-                    summary_file_path=str(fp),
-                )
+                row = {
+                    "id": fp.stem, "timestamp": s["timestamp"], "date": s["date"],
+                    "duration_seconds": s.get("duration_min", 0) * 60,
+                    "segment_count": s.get("segments"),
+                    "word_count": s.get("word_count"),
+                    "transcript": s.get("transcript"),
+                    "summary_file_path": str(fp),
+                }
+                add_to_conversation_index(conv_index, dict(row))
+            summ_rows.append(row)
         except Exception as e:
             print(f"  Error: {fp.name}: {e}")
+    db.save_conversations_batch(summ_rows)
     print(f"  Processed {len(summ_files)} summaries")
 
     # 3. Import speakers
@@ -181,11 +239,10 @@ def main():
     # 4. Import contacts
     if CONTACTS_JSON.exists():
         contacts = json.loads(CONTACTS_JSON.read_text())
-        for cname, info in contacts.items():
-            db.save_contact(
-                id=cname, name=cname.capitalize(),
-                email=info.get("email"), phone=info.get("phone"),
-            )
+        db.save_contacts_batch([{
+            "id": cname, "name": cname.capitalize(),
+            "email": info.get("email"), "phone": info.get("phone"),
+        } for cname, info in contacts.items()])
         print(f"  Imported {len(contacts)} contacts")
 
     db.close()
@@ -6,9 +6,11 @@ Inserts as utterances with proper timestamps and speaker IDs.
 Then runs entity extraction on each conversation.
 """
 
+import os
 import re
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -17,12 +19,16 @@ from src.database import PerceptDB
 from src.entity_extractor import EntityExtractor
 
 CONVERSATIONS_DIR = Path(__file__).parent.parent / "data" / "conversations"
+BATCH_UTTERANCES = 5000  # utterances buffered before a batched insert + extraction
 
 # Pattern: **[0.0s - 1.7s] SPEAKER_0:** text
 # Also handles negative start times like **[-0.0s - 1.7s]**
 SEGMENT_PATTERN = re.compile(
     r'\*\*\[(-?\d+\.?\d*)s\s*-\s*(\d+\.?\d*)s\]\s*(\w+):\*\*\s*(.*)'
 )
+WAKE_RE = re.compile(r'\b(?:hey\s+)?jarvis\b', re.IGNORECASE)
+# Trailing suffixes like _1, _2, _conversation
+_CONV_ID_RE = re.compile(r'(_\d+|_conversation)$')
 
 
 def parse_conversation_file(filepath: Path) -> list[dict]:
@@ -31,9 +37,7 @@ def parse_conversation_file(filepath: Path) -> list[dict]:
     text = filepath.read_text()
 
     # Extract conversation ID from filename (e.g., 2026-02-20_13-52.md -> 2026-02-20_13-52)
-    conv_id = filepath.stem
-    # Remove trailing suffixes like _1, _2, _conversation
-    conv_id = re.sub(r'(_\d+|_conversation)$', '', conv_id)
+    conv_id = _CONV_ID_RE.sub('', filepath.stem)
 
     for match in SEGMENT_PATTERN.finditer(text):
         start = float(match.group(1))
@@ -53,7 +57,7 @@ def parse_conversation_file(filepath: Path) -> list[dict]:
             "started_at": max(0, start),  # clamp negative starts
             "ended_at": end,
             "confidence": None,
-            "is_command": any(w in utt_text.lower() for w in ["jarvis", "hey jarvis"]),
+            "is_command": WAKE_RE.search(utt_text) is not None,
         })
 
     return utterances
@@ -76,31 +80,36 @@ def main():
 
     total_utterances = 0
     total_entities = 0
-
-    for i, filepath in enumerate(files):
-        utterances = parse_conversation_file(filepath)
-        if not utterances:
-            continue
-
-        # Batch insert utterances
-        db.save_utterances_batch(utterances)
-        total_utterances += len(utterances)
-
-        # Run entity extraction
-        conv_id = utterances[0]["conversation_id"]
-        entities = extractor.extract_from_utterances(utterances, conv_id)
-        for e in entities:
-            try:
-                db.save_entity_mention(conv_id, e.type, e.resolved_name or e.name)
-            except Exception:
-                pass
-        total_entities += len(entities)
-
-        # Build relationships
-        extractor.build_relationships(entities, conv_id)
-
-        if (i + 1) % 20 == 0:
-            print(f"  Processed {i + 1}/{len(files)} files ({total_utterances} utterances, {total_entities} entities)")
+    pending = []  # (conv_id, utterances) awaiting a batched write + extraction
+    pending_count = 0
+
+    def flush():
+        nonlocal total_utterances, total_entities, pending_count
+        db.save_utterances_batch([u for _, utts in pending for u in utts])
+        for conv_id, entities in extractor.extract_from_utterances_batched(pending):
+            db.save_entity_mentions_batch(conv_id, [(e.type, e.resolved_name or e.name) for e in entities])
+            total_entities += len(entities)
+            # Build relationships
+            extractor.build_relationships(entities, conv_id)
+        total_utterances += pending_count
+        pending.clear()
+        pending_count = 0
+
+    # Parsing is pure-Python CPU work per file — fan it out; SQLite writes stay in this process
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        parsed = pool.map(parse_conversation_file, files, chunksize=16)
+        for i, utterances in enumerate(parsed):
+            if utterances:
+                pending.append((utterances[0]["conversation_id"], utterances))
+                pending_count += len(utterances)
+                if pending_count >= BATCH_UTTERANCES:
+                    flush()
+
+            if (i + 1) % 20 == 0:
+                print(f"  Processed {i + 1}/{len(files)} files ({total_utterances} utterances, {total_entities} entities)")
+
+    if pending:
+        flush()
 
     # Re-enable FK checks
     with db._lock:
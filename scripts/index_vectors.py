@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Bulk index all Percept conversations into the vector store."""
 
+import asyncio
 import sys
 import time
 from pathlib import Path
@@ -35,7 +36,7 @@ def main():
     print()
     print("Indexing...")
     start = time.time()
-    result = vs.index_all(db)
+    result = asyncio.run(vs.index_all_async(db))
     elapsed = time.time() - start
 
     print()
@@ -7,25 +7,174 @@ and routing different action types.
 import asyncio
 import json
 import logging
-import os
 import re
 import shutil
+import sys
+from pathlib import Path
 from typing import Optional
 
 from src.database import PerceptDB
 
 logger = logging.getLogger(__name__)
 
+# Only the end of the match is used, so an optional "hey" prefix adds nothing;
+# leaving it off keeps the literal "jarvis" first for a fast scan
+_WAKE_RE = re.compile(r'jarvis[,.\s]*', re.IGNORECASE)
+
+# Resolved binary paths; misses are not cached so a later install is picked up
+_binary_paths: dict[str, str] = {}
+
+
 # Binary path resolution with fallback
 def _get_binary_path(name: str) -> str:
     """Get binary path dynamically with fallback."""
+    path = _binary_paths.get(name)
+    if path:
+        return path
     path = shutil.which(name)
     if not path:
         logger.warning(f"Binary '{name}' not found in PATH, action will be skipped")
         return None
+    _binary_paths[name] = path
     return path
 
 
+_SPAWN_WORKER_SCRIPT = Path(__file__).with_name("spawn_worker.py")
+
+# Bytes of stdout/stderr kept per CLI call; callers only report the first few hundred
+CLI_OUTPUT_LIMIT = 4096
+
+# Seconds to wait for the spawn worker's ready line
+SPAWN_WORKER_READY_TIMEOUT = 10
+# Extra seconds a caller waits for a worker reply beyond the command's own timeout
+# (covers queueing behind the worker's concurrency limit)
+SPAWN_WORKER_REPLY_MARGIN = 5
+
+
+class _SpawnWorker:
+    """Client for the spawn_worker.py helper process.
+
+    Commands are sent over the worker's stdin and replies are matched back to
+    callers by request id, so concurrent dispatches share one small process
+    instead of each forking the receiver.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._loop = None
+        self._starting = None
+        self._reader = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._next_id = 0
+
+    async def _ensure_started(self):
+        """Start the worker on first use, or restart it if it died or the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._proc and self._proc.returncode is None and self._loop is loop:
+            return
+        if self._starting and self._loop is loop:
+            await self._starting
+            return
+        self._loop = loop
+        self._proc = None
+        self._starting = loop.create_future()
+        proc = None
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, str(_SPAWN_WORKER_SCRIPT),
+                stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+                limit=1 << 20,  # one reply line holds up to 2 * CLI_OUTPUT_LIMIT bytes, JSON-escaped
+            )
+            ready = await asyncio.wait_for(proc.stdout.readline(), timeout=SPAWN_WORKER_READY_TIMEOUT)
+            if not ready.startswith(b'{"ready"'):
+                raise RuntimeError("spawn worker failed to start")
+            self._pending = {}
+            self._reader = loop.create_task(self._read_replies(proc, self._pending))
+            self._proc = proc
+        except BaseException:
+            # A worker that never became ready has no reply reader, so it must not be reused
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+        finally:
+            self._starting.set_result(None)
+            self._starting = None
+
+    @staticmethod
+    async def _read_replies(proc, pending: dict[int, asyncio.Future]):
+        """Resolve pending requests as reply lines arrive; fail the rest if the worker exits."""
+        while line := await proc.stdout.readline():
+            reply = json.loads(line)
+            fut = pending.pop(reply["id"], None)
+            if fut and not fut.done():
+                fut.set_result(reply)
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(RuntimeError("spawn worker exited"))
+        pending.clear()
+
+    async def run(self, argv: list[str], timeout: float) -> tuple[Optional[int], str, str]:
+        """Run argv in the worker. Returns (returncode, stdout, stderr); returncode is None on timeout.
+
+        Raises ConnectionError if the request could not be handed to the worker
+        (safe to retry elsewhere), RuntimeError if the worker died after accepting it.
+        """
+        self._next_id += 1
+        request_id = self._next_id
+        fut = asyncio.get_running_loop().create_future()
+        try:
+            await self._ensure_started()
+            self._pending[request_id] = fut
+            self._proc.stdin.write(json.dumps({"id": request_id, "argv": argv, "timeout": timeout,
+                                               "limit": CLI_OUTPUT_LIMIT}).encode() + b"\n")
+            await self._proc.stdin.drain()
+        except Exception as e:
+            self._pending.pop(request_id, None)
+            raise ConnectionError(str(e) or type(e).__name__) from e
+        try:
+            reply = await asyncio.wait_for(fut, timeout + SPAWN_WORKER_REPLY_MARGIN)
+        except asyncio.TimeoutError:
+            self._pending.pop(request_id, None)
+            return None, "", "timeout"
+        return reply["returncode"], reply["stdout"], reply["stderr"]
+
+
+_spawn_worker = _SpawnWorker()
+
+
+async def _run_cli(argv: list[str], timeout: float) -> tuple[Optional[int], str, str]:
+    """Run a CLI command via the spawn worker, falling back to a direct spawn if it is unavailable."""
+    try:
+        return await _spawn_worker.run(argv, timeout)
+    except ConnectionError as e:
+        logger.warning(f"Spawn worker unavailable ({e}), running {argv[0]} directly")
+    # No env= : the child inherits os.environ (incl. PATH) without copying it per call
+    proc = await asyncio.create_subprocess_exec(
+        *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        limit=CLI_OUTPUT_LIMIT,
+    )
+    try:
+        stdout, stderr, _ = await asyncio.wait_for(
+            asyncio.gather(_read_capped(proc.stdout), _read_capped(proc.stderr), proc.wait()),
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None, "", "timeout"
+    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+async def _read_capped(stream: asyncio.StreamReader) -> bytes:
+    """Read a child's pipe to EOF, keeping only the first CLI_OUTPUT_LIMIT bytes."""
+    kept = bytearray()
+    while chunk := await stream.read(CLI_OUTPUT_LIMIT):
+        if len(kept) < CLI_OUTPUT_LIMIT:
+            kept += chunk[:CLI_OUTPUT_LIMIT - len(kept)]
+    return bytes(kept)
+
+
 async def dispatch_to_openclaw(message: str, timeout: int = 30) -> tuple[bool, str]:
     """Send a message to OpenClaw via CLI.
 
@@ -40,43 +189,53 @@ async def dispatch_to_openclaw(message: str, timeout: int = 30) -> tuple[bool, s
         openclaw_path = _get_binary_path("openclaw")
         if not openclaw_path:
             return False, "openclaw binary not found"
-            
-        env = os.environ.copy()  # Inherit system PATH
-        proc = await asyncio.create_subprocess_exec(
-            openclaw_path, "agent", "--message", message, "--to", "+1XXXXXXXXXX",  # TODO: load from config
-            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
-            env=env,
+
+        returncode, stdout, stderr = await _run_cli(
+            [openclaw_path, "agent", "--message", message, "--to", "+1XXXXXXXXXX"],  # TODO: load from config
+            timeout=timeout,
         )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
-        if proc.returncode == 0:
-            return True, stdout.decode()[:500]
+        if returncode is None:
+            return False, "timeout"
+        if returncode == 0:
+            return True, stdout[:500]
         else:
-            return False, stderr.decode()[:500]
-    except asyncio.TimeoutError:
-        return False, "timeout"
+            return False, stderr[:500]
     except Exception as e:
         return False, str(e)
 
 
-async def send_imessage(text: str):
-    """Send iMessage directly via imsg CLI.
+# In-flight imsg sends; holding the reference keeps the tasks from being GC'd
+_imsg_tasks: set[asyncio.Task] = set()
+
+
+async def _deliver_imessage(argv: list[str], timeout: int = 15):
+    """Run imsg to completion and log failures."""
+    try:
+        returncode, _, stderr = await _run_cli(argv, timeout=timeout)
+        if returncode is None:
+            logger.error("iMessage send failed: timeout")
+        elif returncode != 0:
+            logger.error(f"iMessage send failed: imsg exited with {returncode}: {stderr[:200]}")
+    except Exception as e:
+        logger.error(f"iMessage send failed: {e}")
+
+
+async def send_imessage(text: str, to: str = "+1XXXXXXXXXX"):  # TODO: load from config
+    """Send iMessage directly via imsg CLI without waiting for it to finish.
 
     Args:
         text: Message text to send.
+        to: Recipient handle.
     """
     try:
         imsg_path = _get_binary_path("imsg")
         if not imsg_path:
             logger.warning("imsg binary not found, skipping message")
             return
-            
-        env = os.environ.copy()  # Inherit system PATH
-        proc = await asyncio.create_subprocess_exec(
-            imsg_path, "send", "--to", "+1XXXXXXXXXX", "--text", text,  # TODO: load from config
-            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
-            env=env,
-        )
-        await asyncio.wait_for(proc.communicate(), timeout=15)
+
+        task = asyncio.create_task(_deliver_imessage([imsg_path, "send", "--to", to, "--text", text]))
+        _imsg_tasks.add(task)
+        task.add_done_callback(_imsg_tasks.discard)
     except Exception as e:
         logger.error(f"iMessage send failed: {e}")
 
@@ -115,8 +274,6 @@ def extract_command_after_wake(text: str) -> str:
     Returns:
         Cleaned command text with wake word removed.
     """
-    clean = text
-    match = re.search(r'(?:hey[,.]?\s*)?jarvis[,.\s]*', clean, re.IGNORECASE)
-    if match:
-        clean = clean[match.end():].strip()
-    return clean.strip('.,!? ')
+    match = _WAKE_RE.search(text)
+    clean = text[match.end():] if match else text
+    return clean.strip('.,!? \t\r\n')
@@ -1,6 +1,7 @@
 """Audio buffer manager — accumulates PCM16 chunks by sessionId and triggers transcription after silence."""
 
 import asyncio
+import bisect
 import logging
 import time
 from collections import defaultdict
@@ -18,21 +19,35 @@ BYTES_PER_SECOND = SAMPLE_RATE * 2  # 16-bit mono = 2 bytes per sample
 @dataclass
 class AudioSession:
     session_id: str
-    chunks: dict[int, bytes] = field(default_factory=dict)  # sequenceNumber -> bytes
+    chunks: list[tuple[int, bytes]] = field(default_factory=list)  # (sequenceNumber, bytes), kept sorted
+    last_seq: int = -1  # highest sequence number seen; in-order chunks just append
+    total_bytes: int = 0  # running sum of chunk lengths
     created_at: float = field(default_factory=time.time)
     last_chunk_at: float = field(default_factory=time.time)
-    flush_task: asyncio.Task | None = None
-    flushed: bool = False
+    flush_handle: asyncio.TimerHandle | None = None  # pending silence-timeout callback
 
 
 class AudioBufferManager:
-    """Buffers audio chunks by sessionId; triggers callback after silence."""
+    """Buffers audio chunks by sessionId; triggers callback after silence.
 
-    def __init__(self, on_complete: Callable[[str, bytes], Awaitable[None]], silence_timeout: float = None):
-        """Initialize AudioBufferManager."""
+    Session state is only touched between awaits on the event loop thread, and
+    _flush detaches the session before its first await, so add_chunk and _flush
+    cannot interleave on the same session and no lock is needed.
+    """
+
+    def __init__(self, on_complete: Callable[[str, memoryview], Awaitable[None]], silence_timeout: float = None):
+        """Initialize AudioBufferManager.
+
+        on_complete receives a memoryview over a buffer allocated for that flush
+        alone (or, for a single-chunk session, over that chunk, which makes the
+        view read-only); the manager keeps no reference to it, so the callback
+        may read it in place (e.g. np.frombuffer) or hold on to it without copying.
+        """
         self._sessions: dict[str, AudioSession] = {}
         self._on_complete = on_complete
         self._silence_timeout = silence_timeout or SILENCE_TIMEOUT
+        # Flushes started by silence timers; holding the reference keeps them from being GC'd
+        self._flush_tasks: set[asyncio.Task] = set()
 
     def _get_or_create(self, session_id: str) -> AudioSession:
         """Get or create an audio buffer session for the given key."""
@@ -44,60 +59,71 @@ class AudioBufferManager:
         """Add a chunk and reset the silence timer."""
         session = self._get_or_create(session_id)
 
-        if session.flushed:
-            # Session already completed, start fresh
-            self._sessions.pop(session_id, None)
-            session = self._get_or_create(session_id)
-
-        session.chunks[sequence_number] = audio_bytes
+        if sequence_number > session.last_seq:
+            session.chunks.append((sequence_number, audio_bytes))
+            session.last_seq = sequence_number
+        else:
+            i = bisect.bisect_left(session.chunks, sequence_number, key=lambda c: c[0])
+            if i < len(session.chunks) and session.chunks[i][0] == sequence_number:
+                session.total_bytes -= len(session.chunks[i][1])  # duplicate sequence number replaces the old chunk
+                session.chunks[i] = (sequence_number, audio_bytes)
+            else:
+                session.chunks.insert(i, (sequence_number, audio_bytes))
+        session.total_bytes += len(audio_bytes)
         session.last_chunk_at = time.time()
 
         # Check max buffer duration
-        total_bytes = sum(len(c) for c in session.chunks.values())
-        total_duration = total_bytes / BYTES_PER_SECOND
+        total_duration = session.total_bytes / BYTES_PER_SECOND
         if total_duration >= MAX_BUFFER_DURATION:
-            logger.warning(f"Session {session_id} hit max buffer ({total_duration:.1f}s), flushing now")
-            if session.flush_task:
-                session.flush_task.cancel()
+            logger.warning("Session %s hit max buffer (%.1fs), flushing now", session_id, total_duration)
+            if session.flush_handle:
+                session.flush_handle.cancel()
             await self._flush(session_id)
             return
 
-        # Reset silence timer
-        if session.flush_task:
-            session.flush_task.cancel()
-        session.flush_task = asyncio.create_task(self._silence_timer(session_id))
+        # Reset silence timer (a plain timer callback, no Task per chunk)
+        if session.flush_handle:
+            session.flush_handle.cancel()
+        session.flush_handle = asyncio.get_running_loop().call_later(
+            self._silence_timeout, self._on_silence, session_id)
 
-    async def _silence_timer(self, session_id: str):
-        """Wait for silence, then flush."""
-        await asyncio.sleep(self._silence_timeout)
-        await self._flush(session_id)
+    def _on_silence(self, session_id: str):
+        """Silence timer fired: start the flush."""
+        task = asyncio.create_task(self._flush(session_id))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
 
     async def _flush(self, session_id: str):
         """Assemble chunks in order and invoke callback."""
-        session = self._sessions.get(session_id)
-        if not session or session.flushed:
+        # Detach the session first; chunks arriving from here on start a fresh one
+        session = self._sessions.pop(session_id, None)
+        if not session:
             return
 
-        session.flushed = True
-        if session.flush_task:
-            session.flush_task.cancel()
-            session.flush_task = None
-
-        # Assemble in sequence order
-        ordered_chunks = [session.chunks[k] for k in sorted(session.chunks.keys())]
-        combined = b"".join(ordered_chunks)
+        if session.flush_handle:
+            session.flush_handle.cancel()
+            session.flush_handle = None
+
+        if len(session.chunks) == 1:
+            # Whole utterance in one chunk (common for short commands): no copy needed
+            combined = memoryview(session.chunks[0][1])
+        else:
+            # Chunks are already in sequence order; copy each once into a preallocated buffer
+            buf = bytearray(session.total_bytes)
+            offset = 0
+            for _, chunk in session.chunks:
+                buf[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+            combined = memoryview(buf)
 
         total_duration = len(combined) / BYTES_PER_SECOND
-        logger.info(f"Flushing session {session_id}: {len(ordered_chunks)} chunks, {total_duration:.1f}s")
-
-        # Clean up
-        self._sessions.pop(session_id, None)
+        logger.info("Flushing session %s: %d chunks, %.1fs", session_id, len(session.chunks), total_duration)
 
         if combined:
             try:
                 await self._on_complete(session_id, combined)
             except Exception as e:
-                logger.error(f"Audio completion callback failed for {session_id}: {e}")
+                logger.error("Audio completion callback failed for %s: %s", session_id, e)
 
     @property
     def active_sessions(self) -> int:
@@ -109,11 +135,10 @@ class AudioBufferManager:
         session = self._sessions.get(session_id)
         if not session:
             return None
-        total_bytes = sum(len(c) for c in session.chunks.values())
         return {
             "session_id": session_id,
             "chunks": len(session.chunks),
-            "total_bytes": total_bytes,
-            "duration_s": round(total_bytes / BYTES_PER_SECOND, 1),
+            "total_bytes": session.total_bytes,
+            "duration_s": round(session.total_bytes / BYTES_PER_SECOND, 1),
             "age_s": round(time.time() - session.created_at, 1),
         }
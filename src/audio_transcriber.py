@@ -1,12 +1,28 @@
 """Audio transcription module using faster-whisper for raw PCM16 input."""
 
+import asyncio
 import logging
+import math
+import os
+import ctranslate2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from faster_whisper import WhisperModel
 
 logger = logging.getLogger(__name__)
 
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Utterances shorter than this are decoded greedily (beam_size=1)
+GREEDY_MAX_SECONDS = 3
+
+# RMS below this (as a fraction of full scale) is treated as silence
+SILENCE_RMS = 0.005
+
+# Seconds of audio per block in the early-exit silence scan
+SILENCE_BLOCK_SECONDS = 0.5
+
 @dataclass
 class TranscriptionResult:
     text: str
@@ -14,40 +30,82 @@ class TranscriptionResult:
     confidence: float
 
 
-def pcm16_to_float32(pcm_bytes: bytes) -> np.ndarray:
-    """Convert raw PCM16 (int16, little-endian) bytes to float32 array normalized to [-1, 1]."""
+def pcm16_to_float32(pcm_bytes: bytes | memoryview) -> np.ndarray:
+    """Convert raw PCM16 (int16, little-endian) bytes to float32 array normalized to [-1, 1].
+
+    Accepts any buffer-protocol object; the int16 view is taken without copying.
+    The cast and scale happen in one pass into a single float32 result.
+    """
     if not pcm_bytes:
         return np.array([], dtype=np.float32)
     audio_int16 = np.frombuffer(pcm_bytes, dtype=np.int16)
-    return audio_int16.astype(np.float32) / 32768.0
+    return np.multiply(audio_int16, _INT16_SCALE, dtype=np.float32)
+
+
+def _is_silent(audio_int16: np.ndarray, block_size: int) -> bool:
+    """Return True if the RMS of the whole array is below SILENCE_RMS.
+
+    The sum of squares is accumulated block by block (in int64, without an
+    N-sized squared temporary) and the scan stops at the first block that
+    pushes it past the threshold for the full array, so speech near the
+    start is detected after one block. Silent audio is scanned in full.
+    """
+    limit = (SILENCE_RMS * 32768.0) ** 2 * len(audio_int16)
+    sum_sq = 0
+    for start in range(0, len(audio_int16), block_size):
+        block = audio_int16[start:start + block_size]
+        sum_sq += int(np.einsum("i,i->", block, block, dtype=np.int64, casting="safe"))
+        if sum_sq >= limit:
+            return False
+    return True
 
 
 class AudioTranscriber:
     """Transcribe raw PCM16 audio using faster-whisper."""
 
-    def __init__(self, model_size: str = "base", device: str = "auto", compute_type: str = "int8"):
-        """Initialize AudioTranscriber with the specified transcription backend."""
-        logger.info(f"Loading whisper model: {model_size} (device={device}, compute={compute_type})")
-        self._model = WhisperModel(model_size, device=device, compute_type=compute_type)
+    def __init__(self, model_size: str = "base", device: str = "auto", compute_type: str | None = None,
+                 cpu_threads: int | None = None, num_workers: int = 1):
+        """Initialize AudioTranscriber with the specified transcription backend.
 
-    def transcribe(self, pcm_bytes: bytes, sample_rate: int = 16000) -> TranscriptionResult:
-        """Transcribe raw PCM16 bytes. Returns TranscriptionResult."""
-        audio = pcm16_to_float32(pcm_bytes)
+        compute_type defaults to float16 on CUDA and int8 on CPU; cpu_threads
+        defaults to half the available cores.
+        """
+        if device == "auto":
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        if compute_type is None:
+            compute_type = "float16" if device == "cuda" else "int8"
+        if cpu_threads is None:
+            cpu_threads = max(1, (os.cpu_count() or 2) // 2)
+        logger.info(f"Loading whisper model: {model_size} (device={device}, compute={compute_type}, "
+                    f"cpu_threads={cpu_threads}, num_workers={num_workers})")
+        self._model = WhisperModel(model_size, device=device, compute_type=compute_type,
+                                   cpu_threads=cpu_threads, num_workers=num_workers)
+        # One worker: keeps inference off the event loop and serializes model access
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
 
+    async def transcribe_async(self, pcm_bytes: bytes | memoryview, sample_rate: int = 16000) -> TranscriptionResult:
+        """Run transcribe on the transcriber's own worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.transcribe, pcm_bytes, sample_rate)
+
+    def transcribe(self, pcm_bytes: bytes | memoryview, sample_rate: int = 16000) -> TranscriptionResult:
+        """Transcribe raw PCM16 bytes (or a memoryview over them). Returns TranscriptionResult."""
         # Handle empty/very short audio
         min_samples = sample_rate // 4  # at least 0.25s
-        if len(audio) < min_samples:
+        if len(pcm_bytes) // 2 < min_samples:
             return TranscriptionResult(text="", language="en", confidence=0.0)
+        audio_int16 = np.frombuffer(pcm_bytes, dtype=np.int16)
 
-        # Check for silence (RMS below threshold)
-        rms = np.sqrt(np.mean(audio ** 2))
-        if rms < 0.005:
-            logger.debug("Audio is silence (RMS=%.4f)", rms)
+        # Check for silence on the raw samples, so silent flushes never pay for the float32 conversion
+        if _is_silent(audio_int16, int(sample_rate * SILENCE_BLOCK_SECONDS)):
+            logger.debug("Audio is silence (RMS < %.4f)", SILENCE_RMS)
             return TranscriptionResult(text="", language="en", confidence=0.0)
 
+        audio = pcm16_to_float32(pcm_bytes)
+
         segments, info = self._model.transcribe(
             audio,
-            beam_size=5,
+            beam_size=1 if len(audio) < GREEDY_MAX_SECONDS * sample_rate else 5,
             language="en",
             vad_filter=True,
         )
@@ -57,7 +115,7 @@ class AudioTranscriber:
             texts.append(seg.text.strip())
 
         full_text = " ".join(texts).strip()
-        confidence = round(np.exp(info.language_probability) if hasattr(info, 'language_probability') else 0.0, 3)
+        confidence = round(math.exp(info.language_probability) if hasattr(info, 'language_probability') else 0.0, 3)
 
         return TranscriptionResult(
             text=full_text,
@@ -10,14 +10,130 @@ Before a meeting, automatically assemble a context packet about each attendee:
 
 import json
 import logging
+import os
+import shutil
+import signal
 import subprocess
+import threading
 import time
+import types
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+try:
+    import ijson  # optional: parse gog output incrementally
+    _GOG_PARSE_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _GOG_PARSE_ERRORS = (json.JSONDecodeError,)
+
 logger = logging.getLogger(__name__)
 
+# Attendee briefings are I/O-bound (SQLite, vector search, CLI), so overlap them
+MAX_BRIEFING_WORKERS = 8
+
+# Topics returned per attendee by _extract_recent_topics
+MAX_RECENT_TOPICS = 8
+
+# Topic phrases whose first word ends like this are skipped (e.g. "the", "and", "for")
+_STOPWORD_ENDINGS = ("the", "and", "or", "but")
+
+# LRU of conversation search results per normalized name, so recurring
+# attendees skip the embedding + hybrid search
+_CONVERSATION_CACHE_TTL = 300  # 5 minutes
+_CONVERSATION_CACHE_MAX = 512
+
+
+# Prompt for _generate_talking_points; kept free of per-attendee data so it is a stable prefix
+_TALKING_POINTS_INSTRUCTIONS = (
+    "Generate 3-4 brief talking points for an upcoming meeting. "
+    "Keep talking points concise and actionable."
+)
+
+# Whether `openclaw agent --stdin` works; None until a call settles it
+_openclaw_stdin_supported: Optional[bool] = None
+
+# Longest prompt passed as a --prompt argument when openclaw can't read stdin
+# (well under Linux's 128 KiB limit on a single argv string)
+_PROMPT_ARGV_MAX = 32 * 1024
+
+# Characters of each conversation snippet included in the talking-points prompt
+TALKING_POINT_SNIPPET_CHARS = 200
+
+
+def _trim_conversation(conv: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a search result to the fields the talking-points prompt needs."""
+    return {
+        "date": conv.get("started_at") or conv.get("date"),
+        "text": (conv.get("text") or conv.get("highlighted") or "")[:TALKING_POINT_SNIPPET_CHARS],
+    }
+
+
+def _trim_commitment(commitment: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a commitment to who owes what by when."""
+    return {
+        "speaker": commitment.get("speaker"),
+        "action": (commitment.get("action") or commitment.get("text") or "")[:TALKING_POINT_SNIPPET_CHARS],
+        "deadline": commitment.get("deadline"),
+    }
+
+
+def _compact_json(value: Any) -> str:
+    """json.dumps without indentation or padding, for prompt context."""
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """SIGKILL a child started with start_new_session=True, along with anything it spawned."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _run_gog(cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+    """subprocess.run for gog, but in its own process group that is killed as a whole on timeout.
+
+    subprocess.run(timeout=...) only kills gog itself, so helpers it spawned
+    (and the pipe fds they hold) outlive a stuck call.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                            start_new_session=True)
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_group(proc)
+        proc.communicate()
+        raise
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp (with "Z" allowed for UTC); memoized, since
+    the same meeting and utterance times recur across attendees and briefings."""
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+def _rrf_merge(ranked_lists: List[List[Dict[str, Any]]], limit: int, k: int = 60) -> List[Dict[str, Any]]:
+    """Merge ranked result lists with Reciprocal Rank Fusion (score = sum of 1 / (k + rank)).
+
+    Results are matched on (conversation_id, first 100 chars of text), as in
+    PerceptVectorStore.hybrid_search; the first list's copy of a match is kept.
+    """
+    scored: Dict[tuple, list] = {}  # key -> [score, result]
+    for results in ranked_lists:
+        for rank, result in enumerate(results, start=1):
+            key = (result.get("conversation_id"), (result.get("text") or "")[:100])
+            entry = scored.setdefault(key, [0.0, result])
+            entry[0] += 1 / (k + rank)
+    ranked = sorted(scored.values(), key=lambda entry: entry[0], reverse=True)
+    return [result for _, result in ranked[:limit]]
+
 
 class BriefingEngine:
     """Generate pre-meeting context briefings for attendees."""
@@ -33,6 +149,12 @@ class BriefingEngine:
         
         self.db = db
         self.vector_store = vector_store
+        # Resolved once; None means talking points are skipped
+        self._openclaw_path = shutil.which("openclaw")
+        # name -> (results, timestamp), least recently used first; attendees
+        # are briefed in parallel threads, hence the lock
+        self._conversation_cache: OrderedDict[str, tuple[List[Dict[str, Any]], float]] = OrderedDict()
+        self._conversation_cache_lock = threading.Lock()
 
     def generate_briefing(self, minutes_ahead: int = 60) -> Dict[str, Any]:
         """Generate briefings for upcoming meetings within specified minutes.
@@ -53,20 +175,29 @@ class BriefingEngine:
                 "generated_at": datetime.now().isoformat()
             }
         
+        # Back-to-back meetings often share attendees; brief each person once
+        names: Dict[str, str] = {}  # normalized name -> name to brief
+        for meeting in meetings:
+            for attendee in meeting.get("attendees", []):
+                names.setdefault(attendee["name"].strip().lower(), attendee["name"])
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_BRIEFING_WORKERS, len(names)))) as ex:
+            by_name = dict(zip(names, ex.map(self.briefing_for_person, names.values())))
+
         briefings = []
         for meeting in meetings:
             meeting_briefing = {
                 "meeting": meeting,
                 "attendees": []
             }
-            
+
             for attendee in meeting.get("attendees", []):
-                person_briefing = self.briefing_for_person(attendee["name"])
+                person_briefing = dict(by_name[attendee["name"].strip().lower()])
+                person_briefing["name"] = attendee["name"]
                 person_briefing["email"] = attendee.get("email")
                 meeting_briefing["attendees"].append(person_briefing)
-            
+
             briefings.append(meeting_briefing)
-        
+
         return {
             "status": "success",
             "meetings": briefings,
@@ -83,25 +214,26 @@ class BriefingEngine:
             Dict with all available context about this person
         """
         logger.info(f"Generating briefing for: {name}")
-        
-        # Search conversations mentioning this person
-        conversations = self._find_conversations_with_person(name)
-        
-        # Get relationship graph edges
-        relationships = self._get_person_relationships(name)
-        
-        # Check open commitments
-        commitments = self._get_person_commitments(name)
-        
-        # Get entity co-occurrences (pass conversations to avoid duplicate search)
-        entities = self._get_person_entities(name, conversations=conversations)
-        
-        # Get recent conversation summaries
-        recent_summaries = self._get_recent_summaries_with_person(name)
-        
-        # Generate AI talking points (optional)
-        talking_points = self._generate_talking_points(name, conversations, commitments)
-        
+
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            # Independent lookups run concurrently
+            conversations_f = ex.submit(self._find_conversations_with_person, name)
+            relationships_f = ex.submit(self._get_person_relationships, name)
+            commitments_f = ex.submit(self._get_person_commitments, name)
+            recent_summaries_f = ex.submit(self._get_recent_summaries_with_person, name)
+
+            conversations = conversations_f.result()
+            commitments = commitments_f.result()
+
+            # Entity co-occurrences (pass conversations to avoid duplicate search)
+            # and optional AI talking points both need the results above
+            entities_f = ex.submit(self._get_person_entities, name, conversations=conversations)
+            talking_points = self._generate_talking_points(name, conversations, commitments)
+
+            relationships = relationships_f.result()
+            recent_summaries = recent_summaries_f.result()
+            entities = entities_f.result()
+
         return {
             "name": name,
             "last_interaction": self._get_last_interaction_date(conversations),
@@ -137,50 +269,27 @@ class BriefingEngine:
                 "--to", end_time.strftime("%Y-%m-%dT%H:%M:%S")
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode != 0:
-                logger.warning(f"gog calendar command failed: {result.stderr}")
-                return []
-            
-            events = json.loads(result.stdout) if result.stdout.strip() else []
-            
-            # Parse events and extract attendees
-            meetings = []
-            for event in events:
-                # Skip all-day events and events without attendees
-                if event.get("allDay") or not event.get("attendees"):
-                    continue
-                
-                # Extract attendee names and emails
-                attendees = []
-                for attendee in event.get("attendees", []):
-                    # Extract name from email or use display name
-                    name = attendee.get("displayName") or attendee.get("email", "").split("@")[0]
-                    if name:
-                        attendees.append({
-                            "name": name,
-                            "email": attendee.get("email"),
-                            "response": attendee.get("responseStatus")
-                        })
-                
-                if attendees:
-                    meetings.append({
-                        "id": event.get("id"),
-                        "title": event.get("summary", "Untitled Meeting"),
-                        "start_time": event.get("start", {}).get("dateTime"),
-                        "end_time": event.get("end", {}).get("dateTime"),
-                        "location": event.get("location"),
-                        "attendees": attendees
-                    })
-            
+            if ijson is None:
+                result = _run_gog(cmd, timeout=30)
+
+                if result.returncode != 0:
+                    logger.warning(f"gog calendar command failed: {result.stderr}")
+                    return []
+
+                events = json.loads(result.stdout) if result.stdout.strip() else []
+                meetings = [m for m in map(self._meeting_from_event, events) if m]
+            else:
+                meetings = self._stream_meetings(cmd, timeout=30)
+                if meetings is None:
+                    return []
+
             logger.info(f"Found {len(meetings)} upcoming meetings with attendees")
             return meetings
             
         except subprocess.TimeoutExpired:
             logger.error("gog calendar command timed out")
             return []
-        except json.JSONDecodeError as e:
+        except _GOG_PARSE_ERRORS as e:
             logger.error(f"Failed to parse gog calendar output: {e}")
             return []
         except FileNotFoundError:
@@ -190,36 +299,135 @@ class BriefingEngine:
             logger.error(f"Error getting calendar events: {e}")
             return []
 
-    def _find_conversations_with_person(self, name: str) -> List[Dict[str, Any]]:
-        """Find conversations mentioning this person using hybrid search."""
+    def _stream_meetings(self, cmd: List[str], timeout: float) -> Optional[List[Dict[str, Any]]]:
+        """Run gog and parse its event array with ijson as it arrives.
+
+        Returns None if gog exited with an error; raises subprocess.TimeoutExpired
+        if it ran past timeout and ijson.JSONError on malformed output.
+        """
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True)
+        timed_out = threading.Event()
+
+        def _kill():
+            timed_out.set()
+            _kill_process_group(proc)
+
+        # Drain stderr alongside the parse so gog never blocks on a full stderr pipe
+        stderr_chunks: List[bytes] = []
+
+        def _drain_stderr():
+            with proc.stderr:
+                stderr_chunks.append(proc.stderr.read())
+
+        stderr_reader = threading.Thread(target=_drain_stderr, daemon=True)
+        stderr_reader.start()
+        timer = threading.Timer(timeout, _kill)
+        timer.start()
+        meetings = []
+        parse_error = None
+        killed = False
         try:
-            # Use hybrid search for best results
-            results = self.vector_store.hybrid_search(name, limit=20)
-            
-            # Also try keyword search as fallback
-            if not results:
-                results = self.db.search_utterances(name, limit=10)
-            
-            return results or []
-            
-        except Exception as e:
-            logger.warning(f"Error searching conversations for {name}: {e}")
-            return []
+            # Skip leading whitespace so empty output counts as no events, as with json.loads
+            while (head := proc.stdout.peek(1)) and not head.lstrip():
+                proc.stdout.read(len(head))
+            if head:
+                # read1 hands ijson whatever gog has written so far; a plain read()
+                # waits for a full buffer, hiding malformed output until EOF
+                stdout = types.SimpleNamespace(read=proc.stdout.read1)
+                try:
+                    for event in ijson.items(stdout, "item"):
+                        meeting = self._meeting_from_event(event)
+                        if meeting:
+                            meetings.append(meeting)
+                except ijson.JSONError as e:
+                    parse_error = e
+                    # The rest of stdout goes unread, so stop gog rather than wait on it
+                    killed = proc.poll() is None
+                    if killed:
+                        _kill_process_group(proc)
+            returncode = proc.wait()
+            stderr_reader.join()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if killed:
+            raise parse_error
+        if returncode != 0:
+            stderr = stderr_chunks[0] if stderr_chunks else b""
+            logger.warning(f"gog calendar command failed: {stderr.decode(errors='replace')}")
+            return None
+        if parse_error:
+            raise parse_error
+        return meetings
+
+    @staticmethod
+    def _meeting_from_event(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Convert a gog calendar event to a meeting dict, or None to skip it."""
+        # Skip all-day events and events without attendees
+        if event.get("allDay") or not event.get("attendees"):
+            return None
+
+        # Extract attendee names and emails
+        attendees = []
+        for attendee in event.get("attendees", []):
+            # Extract name from email or use display name
+            name = attendee.get("displayName") or attendee.get("email", "").split("@")[0]
+            if name:
+                attendees.append({
+                    "name": name,
+                    "email": attendee.get("email"),
+                    "response": attendee.get("responseStatus")
+                })
+
+        if not attendees:
+            return None
+        return {
+            "id": event.get("id"),
+            "title": event.get("summary", "Untitled Meeting"),
+            "start_time": event.get("start", {}).get("dateTime"),
+            "end_time": event.get("end", {}).get("dateTime"),
+            "location": event.get("location"),
+            "attendees": attendees
+        }
+
+    def _find_conversations_with_person(self, name: str) -> List[Dict[str, Any]]:
+        """Find conversations mentioning this person using hybrid and keyword search."""
+        cache_key = name.strip().lower()
+        with self._conversation_cache_lock:
+            cached = self._conversation_cache.get(cache_key)
+            if cached and time.time() - cached[1] < _CONVERSATION_CACHE_TTL:
+                self._conversation_cache.move_to_end(cache_key)
+                return cached[0]
+
+        # Run hybrid and keyword search side by side and fuse their rankings, so
+        # keyword-only hits (which carry utterance timestamps) are never dropped
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            searches = [ex.submit(self.vector_store.hybrid_search, name, limit=20),
+                        ex.submit(self.db.search_utterances, name, limit=20)]
+            ranked_lists = []
+            for future in searches:
+                try:
+                    ranked_lists.append(future.result() or [])
+                except Exception as e:
+                    logger.warning(f"Error searching conversations for {name}: {e}")
+
+        results = _rrf_merge(ranked_lists, limit=20)
+        if results:
+            with self._conversation_cache_lock:
+                self._conversation_cache[cache_key] = (results, time.time())
+                self._conversation_cache.move_to_end(cache_key)
+                if len(self._conversation_cache) > _CONVERSATION_CACHE_MAX:
+                    self._conversation_cache.popitem(last=False)  # evict least recently used
+        return results
 
     def _get_person_relationships(self, name: str) -> List[Dict[str, Any]]:
         """Get relationship graph edges for this person."""
         try:
-            # Search for relationships where this person is mentioned
-            relationships = self.db.get_relationships()
-            
-            # Filter for relationships involving this person
-            person_relationships = []
-            for rel in relationships:
-                if (name.lower() in rel.get("source_id", "").lower() or 
-                    name.lower() in rel.get("target_id", "").lower()):
-                    person_relationships.append(rel)
-            
-            return person_relationships
+            # Relationships where this person is either endpoint (filtered in SQL)
+            return self.db.get_relationships(person=name)
             
         except Exception as e:
             logger.warning(f"Error getting relationships for {name}: {e}")
@@ -232,17 +440,8 @@ class BriefingEngine:
             from .commitment_tracker import CommitmentTracker
             tracker = CommitmentTracker(db=self.db)
             
-            # Get all open commitments and filter by person
-            commitments = tracker.get_open_commitments()
-            
-            person_commitments = []
-            for commitment in commitments:
-                # Check if person is mentioned in commitment text or speaker
-                if (name.lower() in commitment.get("text", "").lower() or
-                    name.lower() in commitment.get("speaker", "").lower()):
-                    person_commitments.append(commitment)
-            
-            return person_commitments
+            # Open commitments whose speaker or action mentions this person (filtered in SQL)
+            return tracker.get_open_commitments(person=name)
             
         except Exception as e:
             logger.info(f"Failed to get open commitments: {e}")
@@ -256,15 +455,17 @@ class BriefingEngine:
             if conversations is None:
                 conversations = self._find_conversations_with_person(name)
             
+            conv_ids = list(dict.fromkeys(
+                c["conversation_id"] for c in conversations if c.get("conversation_id")))
+            if not conv_ids:
+                return []
+
+            name_lower = name.lower()
             entities = set()
-            for conv in conversations:
-                conv_id = conv.get("conversation_id")
-                if conv_id:
-                    mentions = self.db.get_entity_mentions(conversation_id=conv_id)
-                    for mention in mentions:
-                        entity_name = mention.get("entity_name")
-                        if entity_name and entity_name.lower() != name.lower():
-                            entities.add(entity_name)
+            for mention in self.db.get_entity_mentions(conversation_ids=conv_ids):
+                entity_name = mention.get("entity_name")
+                if entity_name and entity_name.lower() != name_lower:
+                    entities.add(entity_name)
             
             return list(entities)[:10]  # Limit to top 10
             
@@ -301,28 +502,23 @@ class BriefingEngine:
                                 commitments: List[Dict]) -> Optional[List[str]]:
         """Generate AI-synthesized talking points (optional feature)."""
         try:
-            # Check if openclaw binary is available
-            result = subprocess.run(["which", "openclaw"], capture_output=True)
-            if result.returncode != 0:
+            if not self._openclaw_path:
                 logger.info("OpenClaw not available, skipping AI talking points")
                 return None
             
-            # Prepare context for AI
-            context = f"""Generate 3-4 brief talking points for an upcoming meeting with {name}.
-            
-Recent conversations:
-{json.dumps(conversations[:5], indent=2)}
-
-Open commitments:
-{json.dumps(commitments, indent=2)}
+            # Static instructions first so the prompt prefix is identical across
+            # attendees; compact per-call context goes last
+            context = (
+                f"{_TALKING_POINTS_INSTRUCTIONS}\n\n"
+                f"Meeting with: {name}\n"
+                f"Recent conversations: {_compact_json([_trim_conversation(c) for c in conversations[:5]])}\n"
+                f"Open commitments: {_compact_json([_trim_commitment(c) for c in commitments])}"
+            )
 
-Keep talking points concise and actionable."""
+            result = self._run_openclaw_prompt(context)
+            if result is None:
+                return None
 
-            # Call OpenClaw agent
-            result = subprocess.run([
-                "openclaw", "agent", "--prompt", context, "--max-tokens", "200"
-            ], capture_output=True, text=True, timeout=30)
-            
             if result.returncode == 0 and result.stdout.strip():
                 # Parse response into list of talking points
                 response = result.stdout.strip()
@@ -335,6 +531,37 @@ Keep talking points concise and actionable."""
         
         return None
 
+    def _run_openclaw_prompt(self, prompt: str) -> Optional[subprocess.CompletedProcess]:
+        """Run `openclaw agent` on prompt, piping it over stdin rather than argv.
+
+        If the first stdin attempt fails, the --prompt form is tried and,
+        whatever its outcome, openclaw is taken not to support --stdin so
+        later calls go straight to argv (for prompts up to _PROMPT_ARGV_MAX)
+        instead of running two subprocesses each. Returns None if the prompt
+        was too long to pass that way.
+        """
+        global _openclaw_stdin_supported
+        if _openclaw_stdin_supported is not False:
+            result = subprocess.run([
+                self._openclaw_path, "agent", "--stdin", "--max-tokens", "200"
+            ], input=prompt, capture_output=True, text=True, timeout=30)
+            if result.returncode == 0:
+                _openclaw_stdin_supported = True
+                return result
+            if _openclaw_stdin_supported:
+                return result
+
+        if len(prompt) > _PROMPT_ARGV_MAX:
+            logger.info(f"Talking-points prompt too long for argv ({len(prompt)} chars), skipping")
+            return None
+        result = subprocess.run([
+            self._openclaw_path, "agent", "--prompt", prompt, "--max-tokens", "200"
+        ], capture_output=True, text=True, timeout=30)
+        if _openclaw_stdin_supported is None:
+            logger.info("openclaw agent --stdin failed, passing prompts as an argument from now on")
+            _openclaw_stdin_supported = False
+        return result
+
     def _get_last_interaction_date(self, conversations: List[Dict]) -> Optional[str]:
         """Get the date of the most recent interaction."""
         if not conversations:
@@ -350,7 +577,7 @@ Keep talking points concise and actionable."""
             if timestamp:
                 if isinstance(timestamp, str):
                     # Try to parse ISO format
-                    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+                    dt = _parse_iso(timestamp)
                 else:
                     # Assume Unix timestamp
                     dt = datetime.fromtimestamp(timestamp)
@@ -361,31 +588,33 @@ Keep talking points concise and actionable."""
         return None
 
     def _extract_recent_topics(self, conversations: List[Dict]) -> List[str]:
-        """Extract recent topics from conversations."""
-        topics = set()
+        """Extract recent topics from conversations, in order of first appearance."""
+        topics: Dict[str, None] = {}  # insertion-ordered set
         
         for conv in conversations[:10]:  # Look at recent 10 conversations
             # Extract from summary if available
             summary = conv.get("highlighted") or conv.get("text") or ""
             if summary:
-                # Simple topic extraction - look for key phrases
+                # Simple topic extraction - look for key phrases (adjacent word pairs)
                 words = summary.lower().split()
-                for i, word in enumerate(words):
-                    # Look for meaningful multi-word phrases
-                    if i < len(words) - 1:
-                        phrase = f"{word} {words[i+1]}"
-                        if len(phrase) > 6 and not any(c in phrase for c in ["the ", "and ", "or ", "but "]):
-                            topics.add(phrase.title())
+                for first, second in zip(words, words[1:]):
+                    # A phrase contains "the "/"and "/"or "/"but " exactly when its first word ends with one
+                    if len(first) + len(second) > 5 and not first.endswith(_STOPWORD_ENDINGS):
+                        topics.setdefault(f"{first} {second}".title(), None)
+                        if len(topics) >= MAX_RECENT_TOPICS:
+                            return list(topics)
             
             # Also check conversation topics if available
             conv_topics = conv.get("topics")
             if conv_topics:
                 if isinstance(conv_topics, str):
-                    topics.update(topic.strip() for topic in conv_topics.split(","))
+                    topics.update(dict.fromkeys(topic.strip() for topic in conv_topics.split(",")))
                 elif isinstance(conv_topics, list):
-                    topics.update(conv_topics)
+                    topics.update(dict.fromkeys(conv_topics))
+                if len(topics) >= MAX_RECENT_TOPICS:
+                    break
         
-        return list(topics)[:8]  # Limit to top 8 topics
+        return list(topics)[:MAX_RECENT_TOPICS]
 
     def format_briefing_markdown(self, briefing_data: Dict[str, Any]) -> str:
         """Format briefing data as human-readable markdown."""
@@ -403,7 +632,7 @@ Keep talking points concise and actionable."""
             start_time = meeting.get("start_time", "")
             if start_time:
                 try:
-                    dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+                    dt = _parse_iso(start_time)
                     time_str = dt.strftime("%I:%M %p").lstrip("0")
                 except:
                     time_str = start_time
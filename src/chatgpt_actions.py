@@ -11,14 +11,21 @@ Or via CLI:
     percept chatgpt-api
 """
 
+import asyncio
 import json
 import os
 import sys
+import threading
 import time
+from contextlib import asynccontextmanager
 from datetime import date, datetime
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, Query, Security
+import httpx
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, Security
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, Field
 
@@ -40,11 +47,43 @@ OPENAPI_DESCRIPTION = (
 
 # ── App ────────────────────────────────────────────────────────────────
 
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Recent FastAPI versions serialize response_model endpoints straight to JSON
+    with Pydantic and skip the response class; on older ones this replaces the
+    stdlib json.dumps of the transcript and search payloads.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Shared client so /api/status probes reuse a keep-alive connection to the receiver
+# (closed in lifespan)
+_http_client = httpx.AsyncClient(timeout=2, limits=httpx.Limits(max_keepalive_connections=4))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Serialize the OpenAPI schema at startup; close the shared HTTP client on shutdown."""
+    _openapi_bytes()
+    yield
+    await _http_client.aclose()
+
+
 app = FastAPI(
     title=OPENAPI_TITLE,
     version=OPENAPI_VERSION,
     description=OPENAPI_DESCRIPTION,
     servers=[{"url": "https://percept.clawdoor.com", "description": "Percept API"}],
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    # Served below from pre-serialized bytes instead of FastAPI's per-request JSONResponse
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
 )
 
 security = HTTPBearer(auto_error=False)
@@ -58,8 +97,22 @@ def _check_auth(credentials: HTTPAuthorizationCredentials | None):
         raise HTTPException(status_code=401, detail="Invalid or missing API token")
 
 
+_db: PerceptDB | None = None
+_db_lock = threading.Lock()
+
+
 def _get_db() -> PerceptDB:
-    return PerceptDB()
+    """Return the process-wide PerceptDB, opening it on first use.
+
+    PerceptDB serializes access to its connection, so endpoints running in
+    FastAPI's threadpool can share one handle instead of reconnecting per request.
+    """
+    global _db
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                _db = PerceptDB()
+    return _db
 
 
 # ── Response Models ────────────────────────────────────────────────────
@@ -133,6 +186,34 @@ class StatusResponse(BaseModel):
     total_speakers: int = 0
 
 
+# Rows come straight from our own SQLite schema, so response items are built
+# with model_construct (no per-field validation). The few columns stored as
+# REAL but exposed as strings are converted with _str_or_none, and the JSON
+# list columns PerceptDB decodes (speakers, topics) with _joined_or_none.
+
+
+def _str_or_none(value) -> str | None:
+    """Stringify a REAL timestamp column for a str-typed response field."""
+    return None if value is None else str(value)
+
+
+def _joined_or_none(value) -> str | None:
+    """Join a decoded JSON list column into the comma-separated str the API exposes."""
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    return value
+
+
+def _not_modified(request: Request, response: Response, version: str) -> Response | None:
+    """Tag the response with an ETag for version; return a bare 304 if the client already has it."""
+    etag = f'"{version}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
 # ── Endpoints ──────────────────────────────────────────────────────────
 
 
@@ -141,43 +222,40 @@ def search_conversations(
     q: str = Query(..., description="Search query (FTS5 syntax: AND, OR, NOT, phrases)"),
     limit: int = Query(10, ge=1, le=50),
     credentials: HTTPAuthorizationCredentials | None = Security(security),
+    db: PerceptDB = Depends(_get_db),
 ):
     """Search all captured conversations for specific topics, names, or phrases."""
     _check_auth(credentials)
-    db = _get_db()
-    try:
-        results = db.search_utterances(q, limit=limit)
-        if not results:
-            convos = db.get_conversations(search=q, limit=limit)
-            return SearchResponse(
-                query=q,
-                result_count=len(convos),
-                results=[
-                    SearchResult(
-                        text=(c.get("summary") or "")[:300],
-                        conversation_id=c["id"],
-                        started_at=c.get("date"),
-                        speaker_id=c.get("speakers"),
-                    )
-                    for c in convos
-                ],
-            )
+    results = db.search_utterances(q, limit=limit)
+    if not results:
+        convos = db.get_conversations(search=q, limit=limit)
         return SearchResponse(
             query=q,
-            result_count=len(results),
+            result_count=len(convos),
             results=[
-                SearchResult(
-                    text=r.get("text"),
-                    highlighted=r.get("highlighted"),
-                    speaker_id=r.get("speaker_id"),
-                    conversation_id=r.get("conversation_id"),
-                    started_at=r.get("started_at"),
+                SearchResult.model_construct(
+                    text=(c.get("summary") or "")[:300],
+                    conversation_id=c["id"],
+                    started_at=c.get("date"),
+                    speaker_id=_joined_or_none(c.get("speakers")),
                 )
-                for r in results
+                for c in convos
             ],
         )
-    finally:
-        db.close()
+    return SearchResponse(
+        query=q,
+        result_count=len(results),
+        results=[
+            SearchResult.model_construct(
+                text=r.get("text"),
+                highlighted=r.get("highlighted"),
+                speaker_id=r.get("speaker_id"),
+                conversation_id=r.get("conversation_id"),
+                started_at=_str_or_none(r.get("started_at")),
+            )
+            for r in results
+        ],
+    )
 
 
 @app.get("/api/transcripts", response_model=TranscriptsResponse, tags=["Transcripts"])
@@ -185,121 +263,117 @@ def list_transcripts(
     today_only: bool = Query(False, description="Only return today's transcripts"),
     limit: int = Query(20, ge=1, le=100),
     credentials: HTTPAuthorizationCredentials | None = Security(security),
+    db: PerceptDB = Depends(_get_db),
 ):
     """List recent conversation transcripts with metadata."""
     _check_auth(credentials)
-    db = _get_db()
-    try:
-        date_filter = date.today().strftime("%Y-%m-%d") if today_only else None
-        convos = db.get_conversations(date=date_filter, limit=limit)
-        return TranscriptsResponse(
-            count=len(convos),
-            today_only=today_only,
-            transcripts=[
-                TranscriptItem(
-                    id=c["id"],
-                    date=c.get("date"),
-                    duration_seconds=c.get("duration_seconds"),
-                    word_count=c.get("word_count"),
-                    speakers=c.get("speakers"),
-                    topics=c.get("topics"),
-                    summary=c.get("summary"),
-                    transcript_preview=(c.get("transcript") or "")[:500],
-                )
-                for c in convos
-            ],
-        )
-    finally:
-        db.close()
+    date_filter = date.today().strftime("%Y-%m-%d") if today_only else None
+    convos = db.get_conversations(date=date_filter, limit=limit)
+    return TranscriptsResponse(
+        count=len(convos),
+        today_only=today_only,
+        transcripts=[
+            TranscriptItem.model_construct(
+                id=c["id"],
+                date=c.get("date"),
+                duration_seconds=c.get("duration_seconds"),
+                word_count=c.get("word_count"),
+                speakers=_joined_or_none(c.get("speakers")),
+                topics=_joined_or_none(c.get("topics")),
+                summary=c.get("summary"),
+                transcript_preview=(c.get("transcript") or "")[:500],
+            )
+            for c in convos
+        ],
+    )
 
 
 @app.get("/api/speakers", response_model=SpeakersResponse, tags=["Speakers"])
 def list_speakers(
+    request: Request,
+    response: Response,
     credentials: HTTPAuthorizationCredentials | None = Security(security),
+    db: PerceptDB = Depends(_get_db),
 ):
     """List all known speakers with activity stats."""
     _check_auth(credentials)
-    db = _get_db()
-    try:
-        speakers = db.get_speakers()
-        return SpeakersResponse(
-            count=len(speakers),
-            speakers=[
-                SpeakerItem(
-                    id=s["id"],
-                    name=s.get("name"),
-                    total_words=s.get("total_words", 0),
-                    total_segments=s.get("total_segments", 0),
-                    first_seen=s.get("first_seen"),
-                    last_seen=s.get("last_seen"),
-                    relationship=s.get("relationship"),
-                )
-                for s in speakers
-            ],
-        )
-    finally:
-        db.close()
+    if not_modified := _not_modified(request, response, db.speakers_version()):
+        return not_modified
+    speakers = db.get_speakers()
+    return SpeakersResponse(
+        count=len(speakers),
+        speakers=[
+            SpeakerItem.model_construct(
+                id=s["id"],
+                name=s.get("name"),
+                total_words=s.get("total_words") or 0,
+                total_segments=s.get("total_segments") or 0,
+                first_seen=_str_or_none(s.get("first_seen")),
+                last_seen=_str_or_none(s.get("last_seen")),
+                relationship=s.get("relationship"),
+            )
+            for s in speakers
+        ],
+    )
 
 
 @app.get("/api/entities", response_model=EntitiesResponse, tags=["Entities"])
 def list_entities(
+    request: Request,
+    response: Response,
     q: str | None = Query(None, description="Filter entities by name"),
     limit: int = Query(50, ge=1, le=200),
     credentials: HTTPAuthorizationCredentials | None = Security(security),
+    db: PerceptDB = Depends(_get_db),
 ):
     """List extracted entities (people, companies, topics) from conversations."""
     _check_auth(credentials)
-    db = _get_db()
-    try:
-        entities = db.get_entities(search=q, limit=limit) if hasattr(db, "get_entities") else []
-        return EntitiesResponse(
-            query=q,
-            count=len(entities),
-            entities=[
-                EntityItem(
-                    name=e.get("name", ""),
-                    entity_type=e.get("entity_type"),
-                    mention_count=e.get("mention_count", 0),
-                    last_mentioned=e.get("last_mentioned"),
-                )
-                for e in entities
-            ],
-        )
-    finally:
-        db.close()
+    if not_modified := _not_modified(request, response, db.entity_mentions_version()):
+        return not_modified
+    entities = db.get_entities(search=q, limit=limit) if hasattr(db, "get_entities") else []
+    return EntitiesResponse(
+        query=q,
+        count=len(entities),
+        entities=[
+            EntityItem.model_construct(
+                name=e.get("name", ""),
+                entity_type=e.get("entity_type"),
+                mention_count=e.get("mention_count") or 0,
+                last_mentioned=e.get("last_mentioned"),
+            )
+            for e in entities
+        ],
+    )
 
 
 @app.get("/api/status", response_model=StatusResponse, tags=["Status"])
-def get_status(
+async def get_status(
     credentials: HTTPAuthorizationCredentials | None = Security(security),
+    db: PerceptDB = Depends(_get_db),
 ):
     """Check Percept pipeline health and stats."""
     _check_auth(credentials)
-    from urllib.request import urlopen
-
-    server_status = "not_running"
-    uptime = None
-    try:
-        resp = urlopen("http://localhost:8900/health", timeout=2)
-        health = json.loads(resp.read())
-        server_status = "running"
-        uptime = health.get("uptime")
-    except Exception:
-        pass
-
-    db = _get_db()
-    try:
+
+    async def _probe_server():
+        try:
+            resp = await _http_client.get("http://localhost:8900/health")
+            resp.raise_for_status()
+            return "running", resp.json().get("uptime")
+        except Exception:
+            return "not_running", None
+
+    def _db_stats():
         today_str = date.today().strftime("%Y-%m-%d")
-        convos = db.get_conversations(date=today_str, limit=1000)
-        total_words = sum(c.get("word_count") or 0 for c in convos)
-        audit = db.audit()
-    finally:
-        db.close()
+        return db.conversations_daily_stats(today_str), db.audit()
+
+    # Probe the receiver while the DB queries run in a worker thread
+    (server_status, uptime), ((today_convos, total_words), audit) = await asyncio.gather(
+        _probe_server(), asyncio.to_thread(_db_stats))
 
     return StatusResponse(
         server=server_status,
         uptime_seconds=uptime,
-        today_conversations=len(convos),
+        today_conversations=today_convos,
         today_words=total_words,
         total_conversations=audit.get("conversations", 0),
         total_speakers=audit.get("speakers", 0),
@@ -309,6 +383,39 @@ def get_status(
 # ── OpenAPI Schema Export ──────────────────────────────────────────────
 
 
+_openapi_json: bytes | None = None
+
+
+def _openapi_bytes() -> bytes:
+    """Return the OpenAPI schema as JSON bytes, serializing it on first use.
+
+    The routes are fixed once the module is loaded, so the schema never changes
+    for the life of the process.
+    """
+    global _openapi_json
+    if _openapi_json is None:
+        _openapi_json = orjson.dumps(app.openapi())
+    return _openapi_json
+
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_schema() -> Response:
+    """Serve the OpenAPI schema that Custom GPTs import and re-fetch."""
+    return Response(content=_openapi_bytes(), media_type="application/json")
+
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui() -> HTMLResponse:
+    """Interactive API docs backed by /openapi.json."""
+    return get_swagger_ui_html(openapi_url="/openapi.json", title=f"{OPENAPI_TITLE} - Swagger UI")
+
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc() -> HTMLResponse:
+    """ReDoc API docs backed by /openapi.json."""
+    return get_redoc_html(openapi_url="/openapi.json", title=f"{OPENAPI_TITLE} - ReDoc")
+
+
 def export_openapi_schema(output_path: str | None = None) -> dict:
     """Export the OpenAPI schema for ChatGPT Custom GPT Actions import."""
     schema = app.openapi()
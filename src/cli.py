@@ -11,27 +11,39 @@ Usage:
 """
 
 import argparse
+import contextlib
+import functools
+import heapq
 import json
+import mmap
 import os
 import sys
 import time
-import glob
 import re
-import subprocess
 from datetime import datetime, date
+from operator import attrgetter
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import URLError
+from typing import NamedTuple
+
+# http.client and concurrent.futures are imported inside the functions that use
+# them, to keep `percept --help` / `percept status` startup light
 
 # ── Paths ──────────────────────────────────────────────────────────────
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 CONVERSATIONS_DIR = DATA_DIR / "conversations"
+MEMORY_CONVERSATIONS_DIR = BASE_DIR / "memory" / "conversations"
 SUMMARIES_DIR = DATA_DIR / "summaries"
 CONFIG_FILE = BASE_DIR / "config" / "config.json"
 LIVE_FILE = Path("/tmp/percept-live.txt")
 
+# Threads reading transcript files in parallel (the work is I/O-bound)
+TRANSCRIPT_SCAN_WORKERS = 16
+
+# Seconds a check_health result is reused for the same port
+HEALTH_CACHE_TTL = 1.0
+
 # ── ANSI Colors ────────────────────────────────────────────────────────
 
 class C:
@@ -45,23 +57,38 @@ class C:
     BLUE = "\033[34m"
     RESET = "\033[0m"
 
-    @staticmethod
-    def strip():
-        """Disable colors if not a TTY."""
-        if not sys.stdout.isatty():
-            for attr in ["BOLD", "DIM", "GREEN", "RED", "YELLOW", "CYAN", "MAGENTA", "BLUE", "RESET"]:
-                setattr(C, attr, "")
 
-C.strip()
+_IS_TTY = sys.stdout.isatty()
+if not _IS_TTY:
+    # Disable colors in one step (a class __dict__ is read-only, so rebuild C)
+    C = type("C", (), dict.fromkeys(
+        ("BOLD", "DIM", "GREEN", "RED", "YELLOW", "CYAN", "MAGENTA", "BLUE", "RESET"), ""))
+
+# Per-row output formats, with the color codes interpolated once at import
+_TRANSCRIPT_ROW_FMT = f"  {C.DIM}{{date}}{C.RESET} {C.BOLD}{{time}}{C.RESET}  {C.DIM}{{words:>5}} words{C.RESET}  {{first_line}}"
+_SEARCH_ROW_FMT = (f"  {C.BOLD}{{i}}.{C.RESET} {{score_color}}[{{score:.3f}}]{C.RESET} "
+                   f"{C.DIM}{{date}}{C.RESET} {C.DIM}({{ctype}}){C.RESET}{{source}}")
+_SEARCH_SOURCE_FMT = f" {C.DIM}({{}}){C.RESET}"
 
 # ── Helpers ────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(path: Path, mtime_ns: int, size: int) -> dict:
+    """Parse the config file; cached per (path, mtime, size) so an edited file is re-read."""
+    return json.loads(path.read_bytes())
+
+
 def load_config() -> dict:
-    """Load Percept YAML configuration from the default path."""
-    if CONFIG_FILE.exists():
-        with open(CONFIG_FILE) as f:
-            return json.load(f)
-    return {}
+    """Load Percept YAML configuration from the default path.
+
+    The parsed dict is cached and shared between calls while the file is
+    unchanged; callers that modify it must save it with save_config.
+    """
+    try:
+        st = CONFIG_FILE.stat()
+    except FileNotFoundError:
+        return {}
+    return _load_config_cached(CONFIG_FILE, st.st_mtime_ns, st.st_size)
 
 
 def save_config(cfg: dict):
@@ -69,25 +96,165 @@ def save_config(cfg: dict):
     CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(CONFIG_FILE, "w") as f:
         json.dump(cfg, f, indent=2)
+    _load_config_cached.cache_clear()
+
+
+_health_cache: dict[int, tuple[float, dict | None]] = {}
 
 
 def check_health(port: int = 8900) -> dict | None:
-    """Check if the Percept server is running and healthy."""
+    """Check if the Percept server is running and healthy.
+
+    Results are reused for HEALTH_CACHE_TTL seconds per port, so one command
+    rendering several health-dependent lines makes a single request.
+    """
+    cached = _health_cache.get(port)
+    if cached and time.monotonic() - cached[0] < HEALTH_CACHE_TTL:
+        return cached[1]
+
+    # Plain http.client on the loopback address: no urllib opener setup, no DNS lookup
+    from http.client import HTTPConnection
+
+    conn = HTTPConnection("127.0.0.1", port, timeout=2)
     try:
-        resp = urlopen(f"http://localhost:{port}/health", timeout=2)
-        return json.loads(resp.read())
+        conn.request("GET", "/health")
+        resp = conn.getresponse()
+        health = json.loads(resp.read()) if resp.status == 200 else None
     except Exception:
-        return None
+        health = None
+    finally:
+        conn.close()
+    _health_cache[port] = (time.monotonic(), health)
+    return health
+
+
+@contextlib.contextmanager
+def _db():
+    """Open the Percept database for one command and always close it."""
+    from src.database import PerceptDB
+
+    db = PerceptDB()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# Maps the ASCII bytes str.split() treats as whitespace to b" " and every other byte to b"x"
+_WORD_TABLE = bytes(0x20 if b in b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f" else 0x78 for b in range(256))
 
 
 def count_words_in_file(path: Path) -> int:
-    """Count the number of words in a text file."""
+    """Count the number of words in a text file (as len(text.split()) would)."""
     try:
-        return len(path.read_text().split())
+        data = path.read_bytes()
+        if data.isascii():
+            # Count word starts in one C-level pass, without building a list of words
+            flags = data.translate(_WORD_TABLE)
+            return flags.count(b" x") + flags.startswith(b"x")
+        # Unicode whitespace (e.g. U+00A0) needs str.split
+        return len(data.decode().split())
     except Exception:
         return 0
 
 
+def read_transcript(path: Path) -> str:
+    """Read a transcript as text: one raw read and one UTF-8 decode, bad bytes replaced."""
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8", errors="replace")
+
+
+def transcript_meta(text: str) -> tuple[int, str]:
+    """Return (word count, first non-header line cut to 80 chars) for a transcript's text."""
+    first_line = ""
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped and not stripped.startswith(("#", "---")):
+            first_line = stripped[:80]
+            break
+    return len(text.split()), first_line
+
+
+def file_contains(path: Path, pattern: "re.Pattern[bytes]") -> bool:
+    """Return True if pattern matches somewhere in the file, searching it through mmap.
+
+    Empty and unreadable files never match.
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return pattern.search(mm) is not None
+    except (OSError, ValueError):
+        return False
+
+
+# "key": "plain string value" for the fields cmd_actions shows; escaped values don't match
+_ACTION_FIELD_RE = re.compile(rb'"(status|intent|timestamp)"\s*:\s*"([^"\\]*)"')
+_ACTION_FIELDS = ("status", "intent", "timestamp")
+
+
+def read_action_fields(path: Path) -> dict:
+    """Read status/intent/timestamp from an action JSON file without decoding the rest.
+
+    The fields are picked out of the mmapped bytes. If any is missing, repeated
+    (e.g. also a nested key) or not a plain string, the file is parsed with json instead.
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            found = _ACTION_FIELD_RE.findall(mm)
+    except (OSError, ValueError):
+        found = []
+    fields = {k.decode(): v.decode() for k, v in found}
+    if len(found) == len(_ACTION_FIELDS) and len(fields) == len(_ACTION_FIELDS):
+        return fields
+    return json.loads(path.read_text())
+
+
+class ScannedFile(NamedTuple):
+    """A directory entry with the stat fields the commands use, taken from one stat call."""
+    name: str
+    path: Path
+    mtime: float
+    size: int
+
+
+def scan_dir(directory: Path, prefix: str = "", suffix: str = "") -> list[ScannedFile]:
+    """List files in directory whose names start with prefix and end with suffix.
+
+    Names are filtered before stat, and each match is stat'ed exactly once
+    (os.scandir caches it on the entry). A missing directory yields [].
+    """
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return []
+    files = []
+    with entries:
+        for entry in entries:
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix):
+                st = entry.stat()
+                files.append(ScannedFile(entry.name, Path(entry.path), st.st_mtime, st.st_size))
+    return files
+
+
+def scan_conversations(prefix: str = "") -> list[ScannedFile]:
+    """Transcript .md files from both conversation directories, in one list."""
+    return [f for d in (CONVERSATIONS_DIR, MEMORY_CONVERSATIONS_DIR) for f in scan_dir(d, prefix, ".md")]
+
+
+class _Buf:
+    """Collects a command's output lines and writes them to stdout in one call."""
+
+    def __init__(self):
+        self.lines: list[str] = []
+
+    def __call__(self, s: str = ""):
+        self.lines.append(s)
+
+    def flush(self):
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            self.lines.clear()
+
+
 def format_duration(seconds: float) -> str:
     """Format seconds into a human-readable duration string."""
     if seconds < 60:
@@ -100,14 +267,31 @@ def format_duration(seconds: float) -> str:
         return f"{h}h {m}m"
 
 
+# Tried in order by parse_timestamp_from_filename
+_FILENAME_TS_PATTERNS = (
+    (re.compile(r"(\d{4}-\d{2}-\d{2})_(\d{2})-(\d{2})-(\d{2})"), "%Y-%m-%d_%H-%M-%S"),
+    (re.compile(r"(\d{4}-\d{2}-\d{2})_(\d{2})-(\d{2})"), "%Y-%m-%d_%H-%M"),
+)
+
+
 def parse_timestamp_from_filename(name: str) -> datetime | None:
     """Extract datetime from filenames like 2026-02-20_14-53-45_conversation.md or 2026-02-20_13-52.md"""
-    patterns = [
-        (r"(\d{4}-\d{2}-\d{2})_(\d{2})-(\d{2})-(\d{2})", "%Y-%m-%d_%H-%M-%S"),
-        (r"(\d{4}-\d{2}-\d{2})_(\d{2})-(\d{2})", "%Y-%m-%d_%H-%M"),
-    ]
-    for pat, fmt in patterns:
-        m = re.search(pat, name)
+    # Fast path: names that start with the timestamp are parsed by slicing, without strptime
+    if (name[4:5] == "-" and name[7:8] == "-" and name[10:11] == "_" and name[13:14] == "-"
+            and name[:19].isascii()):
+        digits = name[0:4] + name[5:7] + name[8:10] + name[11:13] + name[14:16]
+        if len(digits) == 12 and digits.isdigit():
+            seconds = name[17:19] if name[16:17] == "-" else ""
+            has_seconds = len(seconds) == 2 and seconds.isdigit()
+            # Without seconds, a full timestamp later in the name would win below
+            if has_seconds or not _FILENAME_TS_PATTERNS[0][0].search(name, 11):
+                try:
+                    return datetime(int(name[0:4]), int(name[5:7]), int(name[8:10]),
+                                    int(name[11:13]), int(name[14:16]), int(seconds) if has_seconds else 0)
+                except ValueError:
+                    pass  # out-of-range field: let the patterns below decide
+    for pat, fmt in _FILENAME_TS_PATTERNS:
+        m = pat.search(name)
         if m:
             try:
                 return datetime.strptime(m.group(0), fmt)
@@ -119,130 +303,132 @@ def parse_timestamp_from_filename(name: str) -> datetime | None:
 
 def cmd_status(args):
     """Show pipeline status."""
-    print(f"\n{C.BOLD}{C.CYAN}⦿ Percept Status{C.RESET}\n")
+    p = _Buf()
+    p(f"\n{C.BOLD}{C.CYAN}⦿ Percept Status{C.RESET}\n")
 
     # Server health
     cfg = load_config()
     port = cfg.get("server", {}).get("port", 8900)
     health = check_health(port)
     if health:
-        print(f"  {C.GREEN}●{C.RESET} Server        {C.GREEN}running{C.RESET} on port {port}")
+        p(f"  {C.GREEN}●{C.RESET} Server        {C.GREEN}running{C.RESET} on port {port}")
         uptime = health.get("uptime")
         if uptime:
-            print(f"  {C.DIM}  Uptime:       {format_duration(uptime)}{C.RESET}")
+            p(f"  {C.DIM}  Uptime:       {format_duration(uptime)}{C.RESET}")
     else:
-        print(f"  {C.RED}●{C.RESET} Server        {C.RED}not running{C.RESET}")
+        p(f"  {C.RED}●{C.RESET} Server        {C.RED}not running{C.RESET}")
 
     # Live file
+    now = time.time()
     if LIVE_FILE.exists():
-        mtime = LIVE_FILE.stat().st_mtime
-        age = time.time() - mtime
+        age = now - LIVE_FILE.stat().st_mtime
         if age < 120:
-            print(f"  {C.GREEN}●{C.RESET} Live stream   {C.GREEN}active{C.RESET} (updated {format_duration(age)} ago)")
+            p(f"  {C.GREEN}●{C.RESET} Live stream   {C.GREEN}active{C.RESET} (updated {format_duration(age)} ago)")
         else:
-            print(f"  {C.YELLOW}●{C.RESET} Live stream   {C.YELLOW}stale{C.RESET} (updated {format_duration(age)} ago)")
+            p(f"  {C.YELLOW}●{C.RESET} Live stream   {C.YELLOW}stale{C.RESET} (updated {format_duration(age)} ago)")
     else:
-        print(f"  {C.DIM}○{C.RESET} Live stream   {C.DIM}no data{C.RESET}")
+        p(f"  {C.DIM}○{C.RESET} Live stream   {C.DIM}no data{C.RESET}")
 
-    # Today's conversations
+    # Today's conversations (including memory/conversations)
     today_str = date.today().strftime("%Y-%m-%d")
-    today_convos = []
-    total_words = 0
-    if CONVERSATIONS_DIR.exists():
-        for f in sorted(CONVERSATIONS_DIR.iterdir()):
-            if f.name.startswith(today_str) and f.suffix == ".md":
-                today_convos.append(f)
-                total_words += count_words_in_file(f)
-
-    # Also check memory/conversations
-    mem_convos_dir = BASE_DIR / "memory" / "conversations"
-    if mem_convos_dir.exists():
-        for f in sorted(mem_convos_dir.iterdir()):
-            if f.name.startswith(today_str) and f.suffix == ".md":
-                today_convos.append(f)
-                total_words += count_words_in_file(f)
-
-    print(f"\n  {C.BOLD}Today{C.RESET}")
-    print(f"  Conversations:  {C.BOLD}{len(today_convos)}{C.RESET}")
-    print(f"  Words captured: {C.BOLD}{total_words:,}{C.RESET}")
+    today_convos = scan_conversations(today_str)
+    total_words = sum(count_words_in_file(f.path) for f in today_convos)
+
+    p(f"\n  {C.BOLD}Today{C.RESET}")
+    p(f"  Conversations:  {C.BOLD}{len(today_convos)}{C.RESET}")
+    p(f"  Words captured: {C.BOLD}{total_words:,}{C.RESET}")
 
     # Summaries
-    today_summaries = []
-    if SUMMARIES_DIR.exists():
-        for f in sorted(SUMMARIES_DIR.iterdir()):
-            if f.name.startswith(today_str):
-                today_summaries.append(f)
-    print(f"  Summaries:      {C.BOLD}{len(today_summaries)}{C.RESET}")
+    today_summaries = scan_dir(SUMMARIES_DIR, today_str)
+    p(f"  Summaries:      {C.BOLD}{len(today_summaries)}{C.RESET}")
 
     # Last event
-    all_files = list(today_convos) + list(today_summaries)
+    all_files = today_convos + today_summaries
     if all_files:
-        latest = max(all_files, key=lambda f: f.stat().st_mtime)
-        age = time.time() - latest.stat().st_mtime
-        print(f"  Last event:     {C.DIM}{format_duration(age)} ago{C.RESET}")
+        age = now - max(f.mtime for f in all_files)
+        p(f"  Last event:     {C.DIM}{format_duration(age)} ago{C.RESET}")
 
-    print()
+    p()
+    p.flush()
 
 
 def cmd_transcripts(args):
     """List recent transcripts."""
-    dirs = [CONVERSATIONS_DIR, BASE_DIR / "memory" / "conversations"]
-    files = []
-    for d in dirs:
-        if d.exists():
-            files.extend(f for f in d.iterdir() if f.suffix == ".md")
+    from concurrent.futures import ThreadPoolExecutor
+
+    p = _Buf()
 
-    # Filter
-    if args.today:
-        today_str = date.today().strftime("%Y-%m-%d")
-        files = [f for f in files if f.name.startswith(today_str)]
+    # Filter by name first so only matching files are stat'ed
+    prefix = date.today().strftime("%Y-%m-%d") if args.today else ""
+    files = scan_conversations(prefix)
 
-    files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+    query = args.search.lower() if args.search else ""
+    if query and query.isascii():
+        # An ASCII query matches the file bytes one-for-one, so smaller files can't contain it
+        files = [f for f in files if f.size >= len(query)]
 
+    by_mtime = attrgetter("mtime")
     if args.search:
-        query = args.search.lower()
-        files = [f for f in files if query in f.read_text().lower()]
+        files.sort(key=by_mtime, reverse=True)
+    else:
+        # Only the newest `limit` files are shown, so skip the full sort
+        files = heapq.nlargest(max(args.limit, 0), files, key=by_mtime)
+
+    with ThreadPoolExecutor(max_workers=TRANSCRIPT_SCAN_WORKERS) as ex:
+        if args.search:
+            # ASCII queries are matched case-insensitively on the raw bytes, without
+            # decoding or lowering the file; others need the decoded text
+            pattern = re.compile(re.escape(query.encode()), re.IGNORECASE) if query.isascii() else None
+
+            def matches(f: ScannedFile) -> bool:
+                return file_contains(f.path, pattern) if pattern else query in read_transcript(f.path).lower()
+
+            # Probe newest-first, one batch per round, so the scan stops soon after the limit
+            shown = []
+            for start in range(0, len(files), TRANSCRIPT_SCAN_WORKERS):
+                if len(shown) >= args.limit:
+                    break
+                batch = files[start:start + TRANSCRIPT_SCAN_WORKERS]
+                shown.extend(f for f, hit in zip(batch, ex.map(matches, batch)) if hit)
+            shown = shown[: args.limit]
+        else:
+            shown = files[: args.limit]
 
-    files = files[: args.limit]
+        metas = list(ex.map(lambda f: transcript_meta(read_transcript(f.path)), shown))
 
-    if not files:
-        print(f"{C.DIM}No transcripts found.{C.RESET}")
+    if not shown:
+        p(f"{C.DIM}No transcripts found.{C.RESET}")
+        p.flush()
         return
 
-    print(f"\n{C.BOLD}{C.CYAN}📝 Recent Transcripts{C.RESET}\n")
-    for f in files:
+    p(f"\n{C.BOLD}{C.CYAN}📝 Recent Transcripts{C.RESET}\n")
+    for f, (words, first_line) in zip(shown, metas):
         ts = parse_timestamp_from_filename(f.name)
         ts_str = ts.strftime("%H:%M") if ts else "??:??"
         date_str = ts.strftime("%Y-%m-%d") if ts else ""
-        words = count_words_in_file(f)
-        preview = f.read_text().strip().split("\n")
-        # Get first non-header line
-        first_line = ""
-        for line in preview:
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#") and not stripped.startswith("---"):
-                first_line = stripped[:80]
-                break
-
-        print(f"  {C.DIM}{date_str}{C.RESET} {C.BOLD}{ts_str}{C.RESET}  {C.DIM}{words:>5} words{C.RESET}  {first_line}")
 
-    print()
+        p(_TRANSCRIPT_ROW_FMT.format(date=date_str, time=ts_str, words=words, first_line=first_line))
+
+    p()
+    p.flush()
 
 
 def cmd_actions(args):
     """List recent actions."""
+    p = _Buf()
     # Look for action files in data dir
     actions_dir = DATA_DIR / "actions"
     if not actions_dir.exists():
-        print(f"\n{C.BOLD}{C.CYAN}⚡ Recent Actions{C.RESET}\n")
-        print(f"  {C.DIM}No actions recorded yet.{C.RESET}\n")
+        p(f"\n{C.BOLD}{C.CYAN}⚡ Recent Actions{C.RESET}\n")
+        p(f"  {C.DIM}No actions recorded yet.{C.RESET}\n")
+        p.flush()
         return
 
-    files = sorted(actions_dir.iterdir(), key=lambda f: f.stat().st_mtime, reverse=True)[:20]
-    print(f"\n{C.BOLD}{C.CYAN}⚡ Recent Actions{C.RESET}\n")
+    files = heapq.nlargest(20, scan_dir(actions_dir), key=attrgetter("mtime"))
+    p(f"\n{C.BOLD}{C.CYAN}⚡ Recent Actions{C.RESET}\n")
     for f in files:
         try:
-            data = json.loads(f.read_text())
+            data = read_action_fields(f.path)
             status = data.get("status", "unknown")
             intent = data.get("intent", "?")
             ts = data.get("timestamp", "")[:16]
@@ -252,80 +438,64 @@ def cmd_actions(args):
                 "failed": C.RED,
                 "needs_human": C.MAGENTA,
             }.get(status, C.DIM)
-            print(f"  {color}●{C.RESET} {ts}  {C.BOLD}{intent}{C.RESET}  {color}{status}{C.RESET}")
+            p(f"  {color}●{C.RESET} {ts}  {C.BOLD}{intent}{C.RESET}  {color}{status}{C.RESET}")
         except Exception:
             pass
-    print()
+    p()
+    p.flush()
+
+
+def _format_kw(rows: list[dict]) -> list[dict]:
+    """Convert FTS5 utterance rows to the vector-search result format, scored by rank."""
+    return [{
+        "conversation_id": r.get("conversation_id", ""),
+        "text": r.get("text", ""),
+        "score": 1.0 / i,
+        "date": "",
+        "speakers": "[]",
+        "chunk_type": "keyword",
+        "source": "keyword",
+    } for i, r in enumerate(rows, 1)]
 
 
 def cmd_search(args):
     """Search over conversations with multiple modes."""
     from src.vector_store import PerceptVectorStore
-    from src.database import PerceptDB
-    
+
+    p = _Buf()
     vs = PerceptVectorStore()
-    db = PerceptDB()
 
     # Determine search mode
     mode = getattr(args, 'mode', 'hybrid')
-    
-    if mode == "keyword":
+
+    if mode == "semantic" and not vs._get_table():
+        p(f"{C.RED}No vector index found. Run: percept reindex{C.RESET}")
+        p.flush()
+        return
+
+    if mode == "hybrid" and not vs._get_table():
+        p(f"{C.YELLOW}No vector index found, falling back to keyword search. Run: percept reindex{C.RESET}")
+        mode_used = "keyword"
+    else:
+        mode_used = mode
+
+    if mode_used == "keyword":
         # FTS5 keyword search only
-        results = db.search_utterances(args.query, limit=args.limit)
-        db.close()
-        
-        # Convert to standard format
-        formatted_results = []
-        for i, r in enumerate(results):
-            formatted_results.append({
-                "conversation_id": r.get("conversation_id", ""),
-                "text": r.get("text", ""),
-                "score": 1.0 / (i + 1),
-                "date": "",
-                "speakers": "[]", 
-                "chunk_type": "keyword",
-                "source": "keyword"
-            })
-        results = formatted_results
-        
-    elif mode == "semantic":
+        with _db() as db:
+            results = _format_kw(db.search_utterances(args.query, limit=args.limit, date_filter=args.date))
+    elif mode_used == "semantic":
         # Vector semantic search only
-        if not vs._get_table():
-            print(f"{C.RED}No vector index found. Run: percept reindex{C.RESET}")
-            db.close()
-            return
         results = vs.search(args.query, limit=args.limit, date_filter=args.date)
-        
     else:  # hybrid (default)
-        # Hybrid search
-        if not vs._get_table():
-            print(f"{C.YELLOW}No vector index found, falling back to keyword search. Run: percept reindex{C.RESET}")
-            results = db.search_utterances(args.query, limit=args.limit)
-            db.close()
-            # Convert to standard format
-            formatted_results = []
-            for i, r in enumerate(results):
-                formatted_results.append({
-                    "conversation_id": r.get("conversation_id", ""),
-                    "text": r.get("text", ""),
-                    "score": 1.0 / (i + 1),
-                    "date": "",
-                    "speakers": "[]",
-                    "chunk_type": "keyword", 
-                    "source": "keyword"
-                })
-            results = formatted_results
-        else:
-            results = vs.hybrid_search(args.query, limit=args.limit, alpha=0.5, date_filter=args.date)
-    
-    db.close()
+        results = vs.hybrid_search(args.query, limit=args.limit, alpha=0.5, date_filter=args.date)
 
     if not results:
-        print(f"{C.DIM}No results for: {args.query}{C.RESET}")
+        p(f"{C.DIM}No results for: {args.query}{C.RESET}")
+        p.flush()
         return
 
     mode_emoji = {"keyword": "📝", "semantic": "🧠", "hybrid": "🔍"}
-    print(f"\n{C.BOLD}{C.CYAN}{mode_emoji.get(mode, '🔍')} Search ({mode}): {args.query}{C.RESET}\n")
+    p(f"\n{C.BOLD}{C.CYAN}{mode_emoji.get(mode, '🔍')} Search ({mode}): {args.query}{C.RESET}\n")
     
     for i, r in enumerate(results, 1):
         score = r.get("score", 0)
@@ -348,158 +518,146 @@ def cmd_search(args):
         display_score = rrf_score if rrf_score is not None else score
         score_color = C.GREEN if display_score > 0.1 else C.YELLOW if display_score > 0.05 else C.DIM
         
-        source_indicator = f" {C.DIM}({source}){C.RESET}" if source and mode == "hybrid" else ""
-        print(f"  {C.BOLD}{i}.{C.RESET} {score_color}[{display_score:.3f}]{C.RESET} {C.DIM}{date}{C.RESET} {C.DIM}({ctype}){C.RESET}{source_indicator}")
+        source_indicator = _SEARCH_SOURCE_FMT.format(source) if source and mode == "hybrid" else ""
+        p(_SEARCH_ROW_FMT.format(i=i, score_color=score_color, score=display_score,
+                                 date=date, ctype=ctype, source=source_indicator))
         if spk_str:
-            print(f"     {C.DIM}Speakers: {spk_str}{C.RESET}")
-        print(f"     {text}")
-        print()
+            p(f"     {C.DIM}Speakers: {spk_str}{C.RESET}")
+        p(f"     {text}")
+        p()
+    p.flush()
 
 
 def cmd_config(args):
     """Show or edit config."""
-    from src.database import PerceptDB
-    db = PerceptDB()
-
-    if args.action == "set" and args.config_args:
-        if len(args.config_args) < 2:
-            print(f"{C.RED}Usage: percept config set <key> <value>{C.RESET}")
-            db.close()
+    with _db() as db:
+        if args.action == "set" and args.config_args:
+            if len(args.config_args) < 2:
+                print(f"{C.RED}Usage: percept config set <key> <value>{C.RESET}")
+                return
+            key, value = args.config_args[0], " ".join(args.config_args[1:])
+            # Store in DB settings
+            db.set_setting(key, value)
+            # Mask secrets in output
+            display_val = value[:4] + "***" if "secret" in key.lower() else value
+            print(f"{C.GREEN}✓{C.RESET} Set {C.BOLD}{key}{C.RESET} = {display_val}")
             return
-        key, value = args.config_args[0], " ".join(args.config_args[1:])
-        # Store in DB settings
-        db.set_setting(key, value)
-        # Mask secrets in output
-        display_val = value[:4] + "***" if "secret" in key.lower() else value
-        print(f"{C.GREEN}✓{C.RESET} Set {C.BOLD}{key}{C.RESET} = {display_val}")
-        db.close()
-        return
-    elif args.action == "get" and args.config_args:
-        key = args.config_args[0]
-        val = db.get_setting(key)
-        if val is not None:
-            display_val = val[:4] + "***" if "secret" in key.lower() else val
-            print(f"{C.BOLD}{key}{C.RESET} = {display_val}")
-        else:
-            print(f"{C.DIM}{key} not set{C.RESET}")
-        db.close()
-        return
-
-    # Also support legacy --set key=value
-    cfg = load_config()
-    if args.legacy_set:
-        key, _, value = args.legacy_set.partition("=")
-        if not value:
-            print(f"{C.RED}Usage: --set key=value{C.RESET}")
-            db.close()
+        elif args.action == "get" and args.config_args:
+            key = args.config_args[0]
+            val = db.get_setting(key)
+            if val is not None:
+                display_val = val[:4] + "***" if "secret" in key.lower() else val
+                print(f"{C.BOLD}{key}{C.RESET} = {display_val}")
+            else:
+                print(f"{C.DIM}{key} not set{C.RESET}")
             return
-        parts = key.split(".")
-        obj = cfg
-        for p in parts[:-1]:
-            obj = obj.setdefault(p, {})
-        if value.lower() == "true":
-            value = True
-        elif value.lower() == "false":
-            value = False
-        else:
-            try:
-                value = int(value)
-            except ValueError:
+
+        # Also support legacy --set key=value
+        cfg = load_config()
+        if args.legacy_set:
+            key, _, value = args.legacy_set.partition("=")
+            if not value:
+                print(f"{C.RED}Usage: --set key=value{C.RESET}")
+                return
+            parts = key.split(".")
+            obj = cfg
+            for p in parts[:-1]:
+                obj = obj.setdefault(p, {})
+            if value.lower() == "true":
+                value = True
+            elif value.lower() == "false":
+                value = False
+            else:
                 try:
-                    value = float(value)
+                    value = int(value)
                 except ValueError:
-                    pass
-        obj[parts[-1]] = value
-        save_config(cfg)
-        print(f"{C.GREEN}✓{C.RESET} Set {C.BOLD}{key}{C.RESET} = {value}")
-        db.close()
-        return
+                    try:
+                        value = float(value)
+                    except ValueError:
+                        pass
+            obj[parts[-1]] = value
+            save_config(cfg)
+            print(f"{C.GREEN}✓{C.RESET} Set {C.BOLD}{key}{C.RESET} = {value}")
+            return
 
-    # Show all config
-    print(f"\n{C.BOLD}{C.CYAN}⚙ Configuration{C.RESET}\n")
-    print(f"  {C.DIM}File: {CONFIG_FILE}{C.RESET}\n")
-    print(json.dumps(cfg, indent=2))
-
-    # Also show DB settings
-    settings = db.get_all_settings()
-    if settings:
-        print(f"\n  {C.BOLD}DB Settings:{C.RESET}")
-        for k, v in sorted(settings.items()):
-            display_v = v[:4] + "***" if "secret" in k.lower() else v
-            print(f"    {k} = {display_v}")
-    print()
-    db.close()
+        # Show all config
+        print(f"\n{C.BOLD}{C.CYAN}⚙ Configuration{C.RESET}\n")
+        print(f"  {C.DIM}File: {CONFIG_FILE}{C.RESET}\n")
+        # Indented output is for people; pipes get the compact form, which
+        # json encodes with its C accelerator instead of the pure-Python indenter
+        print(json.dumps(cfg, indent=2) if _IS_TTY else json.dumps(cfg, separators=(",", ":")))
+
+        # Also show DB settings
+        settings = db.get_all_settings()
+        if settings:
+            print(f"\n  {C.BOLD}DB Settings:{C.RESET}")
+            for k, v in sorted(settings.items()):
+                display_v = v[:4] + "***" if "secret" in k.lower() else v
+                print(f"    {k} = {display_v}")
+        print()
 
 
 def cmd_speakers(args):
     """Manage authorized speakers."""
-    from src.database import PerceptDB
-    db = PerceptDB()
-
-    if args.action == "authorize":
-        if not args.speaker_id:
-            print(f"{C.RED}Usage: percept speakers authorize <speaker_id>{C.RESET}")
-            db.close()
-            return
-        speaker_id = args.speaker_id
-        # Check if speaker exists in speakers table
-        speakers = db.get_speakers()
-        known = {s["id"] for s in speakers}
-        if speaker_id not in known:
-            print(f"{C.YELLOW}⚠{C.RESET}  Speaker '{speaker_id}' not in speakers table (will still be authorized)")
-        db.authorize_speaker(speaker_id)
-        name = next((s["name"] for s in speakers if s["id"] == speaker_id), speaker_id)
-        print(f"{C.GREEN}✓{C.RESET} Authorized speaker: {C.BOLD}{speaker_id}{C.RESET} ({name})")
-
-    elif args.action == "revoke":
-        if not args.speaker_id:
-            print(f"{C.RED}Usage: percept speakers revoke <speaker_id>{C.RESET}")
-            db.close()
-            return
-        if db.revoke_speaker(args.speaker_id):
-            print(f"{C.GREEN}✓{C.RESET} Revoked speaker: {C.BOLD}{args.speaker_id}{C.RESET}")
-        else:
-            print(f"{C.YELLOW}⚠{C.RESET}  Speaker '{args.speaker_id}' was not in authorized list")
-
-    elif args.action == "list":
-        authorized = db.get_authorized_speakers()
-        if not authorized:
-            print(f"\n{C.BOLD}{C.CYAN}🔐 Authorized Speakers{C.RESET}\n")
-            print(f"  {C.DIM}No authorized speakers configured (all speakers allowed){C.RESET}")
-            print(f"  {C.DIM}Use 'percept speakers authorize <speaker_id>' to enable allowlist{C.RESET}\n")
-        else:
-            print(f"\n{C.BOLD}{C.CYAN}🔐 Authorized Speakers ({len(authorized)}){C.RESET}\n")
-            for s in authorized:
-                name = s.get("name") or "Unknown"
-                sid = s["speaker_id"]
-                words = s.get("total_words") or 0
-                print(f"  {C.GREEN}●{C.RESET} {C.BOLD}{sid}{C.RESET}  ({name})  {C.DIM}{words} words{C.RESET}")
-            print()
-
-        # Also show all known speakers for reference
-        all_speakers = db.get_speakers()
-        if all_speakers:
-            auth_ids = {s["speaker_id"] for s in authorized}
-            print(f"  {C.BOLD}All known speakers:{C.RESET}")
-            for s in all_speakers:
-                marker = f"{C.GREEN}✓{C.RESET}" if s["id"] in auth_ids else f"{C.DIM}○{C.RESET}"
-                name = s.get("name") or "Unknown"
-                print(f"    {marker} {s['id']}  ({name})  {s.get('total_words', 0)} words")
-            print()
+    with _db() as db:
+        if args.action == "authorize":
+            if not args.speaker_id:
+                print(f"{C.RED}Usage: percept speakers authorize <speaker_id>{C.RESET}")
+                return
+            speaker_id = args.speaker_id
+            # Check if speaker exists in speakers table
+            speakers = db.get_speakers()
+            known = {s["id"] for s in speakers}
+            if speaker_id not in known:
+                print(f"{C.YELLOW}⚠{C.RESET}  Speaker '{speaker_id}' not in speakers table (will still be authorized)")
+            db.authorize_speaker(speaker_id)
+            name = next((s["name"] for s in speakers if s["id"] == speaker_id), speaker_id)
+            print(f"{C.GREEN}✓{C.RESET} Authorized speaker: {C.BOLD}{speaker_id}{C.RESET} ({name})")
+
+        elif args.action == "revoke":
+            if not args.speaker_id:
+                print(f"{C.RED}Usage: percept speakers revoke <speaker_id>{C.RESET}")
+                return
+            if db.revoke_speaker(args.speaker_id):
+                print(f"{C.GREEN}✓{C.RESET} Revoked speaker: {C.BOLD}{args.speaker_id}{C.RESET}")
+            else:
+                print(f"{C.YELLOW}⚠{C.RESET}  Speaker '{args.speaker_id}' was not in authorized list")
+
+        elif args.action == "list":
+            authorized = db.get_authorized_speakers()
+            if not authorized:
+                print(f"\n{C.BOLD}{C.CYAN}🔐 Authorized Speakers{C.RESET}\n")
+                print(f"  {C.DIM}No authorized speakers configured (all speakers allowed){C.RESET}")
+                print(f"  {C.DIM}Use 'percept speakers authorize <speaker_id>' to enable allowlist{C.RESET}\n")
+            else:
+                print(f"\n{C.BOLD}{C.CYAN}🔐 Authorized Speakers ({len(authorized)}){C.RESET}\n")
+                for s in authorized:
+                    name = s.get("name") or "Unknown"
+                    sid = s["speaker_id"]
+                    words = s.get("total_words") or 0
+                    print(f"  {C.GREEN}●{C.RESET} {C.BOLD}{sid}{C.RESET}  ({name})  {C.DIM}{words} words{C.RESET}")
+                print()
 
-    else:
-        print(f"{C.RED}Unknown action: {args.action}{C.RESET}")
-        print(f"Usage: percept speakers <authorize|revoke|list> [speaker_id]")
+            # Also show all known speakers for reference
+            all_speakers = db.get_speakers()
+            if all_speakers:
+                auth_ids = {s["speaker_id"] for s in authorized}
+                print(f"  {C.BOLD}All known speakers:{C.RESET}")
+                for s in all_speakers:
+                    marker = f"{C.GREEN}✓{C.RESET}" if s["id"] in auth_ids else f"{C.DIM}○{C.RESET}"
+                    name = s.get("name") or "Unknown"
+                    print(f"    {marker} {s['id']}  ({name})  {s.get('total_words', 0)} words")
+                print()
 
-    db.close()
+        else:
+            print(f"{C.RED}Unknown action: {args.action}{C.RESET}")
+            print(f"Usage: percept speakers <authorize|revoke|list> [speaker_id]")
 
 
 def cmd_security_log(args):
     """Show security log."""
-    from src.database import PerceptDB
-    db = PerceptDB()
-    events = db.get_security_log(limit=args.limit, reason=args.reason)
-    db.close()
+    with _db() as db:
+        events = db.get_security_log(limit=args.limit, reason=args.reason)
 
     if not events:
         print(f"\n{C.BOLD}{C.CYAN}🛡️  Security Log{C.RESET}\n")
@@ -571,11 +729,17 @@ def cmd_serve(args):
     # Start dashboard in background
     dashboard_script = BASE_DIR / "dashboard" / "server.py"
     if dashboard_script.exists():
-        subprocess.Popen(
-            [sys.executable, str(dashboard_script), "--port", str(args.dashboard_port)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        # posix_spawn rather than fork+exec: nothing of this process is copied into the child
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        try:
+            os.posix_spawn(
+                sys.executable,
+                [sys.executable, str(dashboard_script), "--port", str(args.dashboard_port)],
+                os.environ,
+                file_actions=[(os.POSIX_SPAWN_DUP2, devnull, 1), (os.POSIX_SPAWN_DUP2, devnull, 2)],
+            )
+        finally:
+            os.close(devnull)
         print(f"  {C.GREEN}●{C.RESET} Dashboard started on http://localhost:{args.dashboard_port}", file=sys.stderr)
 
     uvicorn.run(
@@ -587,10 +751,8 @@ def cmd_serve(args):
 
 def cmd_audit(args):
     """Show data stats."""
-    from src.database import PerceptDB
-    db = PerceptDB()
-    stats = db.audit()
-    db.close()
+    with _db() as db:
+        stats = db.audit()
 
     print(f"\n{C.BOLD}{C.CYAN}📊 Percept Data Audit{C.RESET}\n")
     for table, count in stats.items():
@@ -605,73 +767,66 @@ def cmd_audit(args):
 
 def cmd_commitments(args):
     """Track commitments and promises from conversations."""
-    from src.database import PerceptDB
     from src.commitment_tracker import CommitmentTracker
     from datetime import datetime
 
-    db = PerceptDB()
-    tracker = CommitmentTracker(db=db)
+    with _db() as db:
+        tracker = CommitmentTracker(db=db)
 
-    action = args.action or "list"
+        action = args.action or "list"
 
-    if action == "fulfill":
-        cid = args.id
-        if not cid:
-            print(f"{C.RED}✗{C.RESET} --id required for fulfill")
+        if action == "fulfill":
+            cid = args.id
+            if not cid:
+                print(f"{C.RED}✗{C.RESET} --id required for fulfill")
+                return
+            if tracker.fulfill(cid):
+                print(f"{C.GREEN}✓{C.RESET} Marked as fulfilled: {cid[:8]}...")
+            else:
+                print(f"{C.RED}✗{C.RESET} Failed to fulfill {cid[:8]}...")
             return
-        if tracker.fulfill(cid):
-            print(f"{C.GREEN}✓{C.RESET} Marked as fulfilled: {cid[:8]}...")
-        else:
-            print(f"{C.RED}✗{C.RESET} Failed to fulfill {cid[:8]}...")
-        db.close()
-        return
 
-    if action == "cancel":
-        cid = args.id
-        if not cid:
-            print(f"{C.RED}✗{C.RESET} --id required for cancel")
+        if action == "cancel":
+            cid = args.id
+            if not cid:
+                print(f"{C.RED}✗{C.RESET} --id required for cancel")
+                return
+            if tracker.cancel(cid):
+                print(f"{C.GREEN}✓{C.RESET} Cancelled: {cid[:8]}...")
+            else:
+                print(f"{C.RED}✗{C.RESET} Failed to cancel {cid[:8]}...")
             return
-        if tracker.cancel(cid):
-            print(f"{C.GREEN}✓{C.RESET} Cancelled: {cid[:8]}...")
-        else:
-            print(f"{C.RED}✗{C.RESET} Failed to cancel {cid[:8]}...")
-        db.close()
-        return
 
-    if action == "overdue":
-        overdue = tracker.check_overdue()
-        if not overdue:
-            print(f"\n{C.GREEN}✓{C.RESET} No overdue commitments!\n")
-            db.close()
+        if action == "overdue":
+            overdue = tracker.check_overdue()
+            if not overdue:
+                print(f"\n{C.GREEN}✓{C.RESET} No overdue commitments!\n")
+                return
+            print(f"\n{C.BOLD}{C.RED}⚠ Overdue Commitments{C.RESET}\n")
+            for c in overdue:
+                days = c["days_overdue"]
+                print(f"  {C.RED}●{C.RESET} {C.BOLD}{c['speaker']}{C.RESET}: {c['action'][:80]}")
+                print(f"    Due: {c['deadline']} ({days:.0f} days overdue) | Confidence: {c['confidence']:.0%}")
+                print(f"    ID: {c['id'][:8]}...")
+                print()
             return
-        print(f"\n{C.BOLD}{C.RED}⚠ Overdue Commitments{C.RESET}\n")
-        for c in overdue:
-            days = c["days_overdue"]
-            print(f"  {C.RED}●{C.RESET} {C.BOLD}{c['speaker']}{C.RESET}: {c['action'][:80]}")
-            print(f"    Due: {c['deadline']} ({days:.0f} days overdue) | Confidence: {c['confidence']:.0%}")
-            print(f"    ID: {c['id'][:8]}...")
-            print()
-        db.close()
-        return
 
-    # Default: list open commitments
-    commitments = tracker.get_open_commitments(speaker=args.speaker)
-    if not commitments:
-        print(f"\n{C.DIM}No open commitments.{C.RESET}\n")
-        db.close()
-        return
-
-    print(f"\n{C.BOLD}{C.CYAN}📋 Open Commitments{C.RESET}\n")
-    for c in commitments:
-        deadline_str = f" | Due: {c['deadline']}" if c.get("deadline") else ""
-        status_color = C.YELLOW if c.get("deadline_dt") and c["deadline_dt"] < datetime.now().timestamp() else C.GREEN
-        extracted = datetime.fromtimestamp(c["extracted_at"]).strftime("%b %d") if c.get("extracted_at") else ""
+        # Default: list open commitments
+        commitments = tracker.get_open_commitments(speaker=args.speaker)
+        if not commitments:
+            print(f"\n{C.DIM}No open commitments.{C.RESET}\n")
+            return
 
-        print(f"  {status_color}●{C.RESET} {C.BOLD}{c['speaker']}{C.RESET}: {c['action'][:80]}")
-        print(f"    {extracted}{deadline_str} | Confidence: {c['confidence']:.0%} | ID: {c['id'][:8]}...")
-        print()
+        print(f"\n{C.BOLD}{C.CYAN}📋 Open Commitments{C.RESET}\n")
+        now = time.time()
+        for c in commitments:
+            deadline_str = f" | Due: {c['deadline']}" if c.get("deadline") else ""
+            status_color = C.YELLOW if c.get("deadline_dt") and c["deadline_dt"] < now else C.GREEN
+            extracted = datetime.fromtimestamp(c["extracted_at"]).strftime("%b %d") if c.get("extracted_at") else ""
 
-    db.close()
+            print(f"  {status_color}●{C.RESET} {C.BOLD}{c['speaker']}{C.RESET}: {c['action'][:80]}")
+            print(f"    {extracted}{deadline_str} | Confidence: {c['confidence']:.0%} | ID: {c['id'][:8]}...")
+            print()
 
 
 def cmd_briefing(args):
@@ -745,12 +900,10 @@ def cmd_briefing(args):
 def cmd_reindex(args):
     """Re-embed all conversations into vector store."""
     from src.vector_store import PerceptVectorStore
-    from src.database import PerceptDB
     
     print(f"\n{C.BOLD}{C.CYAN}🔄 Reindexing Conversations{C.RESET}\n")
     
     vs = PerceptVectorStore()
-    db = PerceptDB()
     
     # Show current embedder status
     embedder_type = "NVIDIA NIM" if vs._use_nvidia else "Local (sentence-transformers)"
@@ -769,7 +922,8 @@ def cmd_reindex(args):
     # Perform bulk indexing
     start_time = time.time()
     try:
-        results = vs.index_all(db=db)
+        with _db() as db:
+            results = vs.index_all(db=db)
         elapsed = time.time() - start_time
         
         print(f"  {C.GREEN}✓{C.RESET} Reindexing complete in {elapsed:.1f}s")
@@ -785,40 +939,33 @@ def cmd_reindex(args):
         
     except Exception as e:
         print(f"  {C.RED}✗{C.RESET} Reindexing failed: {e}")
-    finally:
-        db.close()
     
     print()
 
 
 def cmd_purge(args):
     """Purge data."""
-    from src.database import PerceptDB
-    db = PerceptDB()
-
-    if args.conversation:
-        db.purge_conversation(args.conversation)
-        print(f"{C.GREEN}✓{C.RESET} Purged conversation {args.conversation}")
-    elif args.older_than:
-        count = db.purge_older_than(args.older_than)
-        print(f"{C.GREEN}✓{C.RESET} Purged {count} conversations older than {args.older_than} days")
-    elif args.all:
-        if not args.confirm:
-            print(f"{C.RED}Error:{C.RESET} Use --confirm to delete all data")
-            db.close()
-            return
-        # Purge everything
-        with db._lock:
-            for table in ("utterances", "entity_mentions", "actions", "relationships", "conversations"):
-                db._conn.execute(f"DELETE FROM {table}")
-            db._conn.commit()
-        print(f"{C.GREEN}✓{C.RESET} Purged all data")
-    else:
-        # Purge expired TTL
-        count = db.purge_expired()
-        print(f"{C.GREEN}✓{C.RESET} Purged {count} expired conversations")
-
-    db.close()
+    with _db() as db:
+        if args.conversation:
+            db.purge_conversation(args.conversation)
+            print(f"{C.GREEN}✓{C.RESET} Purged conversation {args.conversation}")
+        elif args.older_than:
+            count = db.purge_older_than(args.older_than)
+            print(f"{C.GREEN}✓{C.RESET} Purged {count} conversations older than {args.older_than} days")
+        elif args.all:
+            if not args.confirm:
+                print(f"{C.RED}Error:{C.RESET} Use --confirm to delete all data")
+                return
+            # Purge everything
+            with db._lock:
+                for table in ("utterances", "entity_mentions", "actions", "relationships", "conversations"):
+                    db._conn.execute(f"DELETE FROM {table}")
+                db._conn.commit()
+            print(f"{C.GREEN}✓{C.RESET} Purged all data")
+        else:
+            # Purge expired TTL
+            count = db.purge_expired()
+            print(f"{C.GREEN}✓{C.RESET} Purged {count} expired conversations")
 
 
 # ── Meeting Source Connectors ──────────────────────────────────────────
@@ -884,17 +1031,9 @@ def cmd_chatgpt_api(args):
     uvicorn.run(app, host=args.host, port=args.port)
 
 
-# ── Main ───────────────────────────────────────────────────────────────
+# ── Argument Parsing ───────────────────────────────────────────────────
 
-def main():
-    """Main entry point for the Percept CLI."""
-    parser = argparse.ArgumentParser(
-        prog="percept",
-        description="Percept — ambient voice intelligence pipeline",
-    )
-    sub = parser.add_subparsers(dest="command")
-
-    # listen
+def _add_listen_parser(sub):
     p_listen = sub.add_parser("listen", help="Start audio pipeline, output protocol events")
     p_listen.add_argument("--agent", choices=["openclaw", "stdout", "webhook"], default="openclaw")
     p_listen.add_argument("--webhook-url", default=None)
@@ -902,101 +1041,125 @@ def main():
     p_listen.add_argument("--port", type=int, default=8900)
     p_listen.add_argument("--format", choices=["json", "text"], default="json")
 
-    # serve
+
+def _add_serve_parser(sub):
     p_serve = sub.add_parser("serve", help="Start full server (receiver + dashboard)")
     p_serve.add_argument("--port", type=int, default=8900)
     p_serve.add_argument("--dashboard-port", type=int, default=8960)
     p_serve.add_argument("--webhook-url", default=None)
 
-    # status
+
+def _add_status_parser(sub):
     sub.add_parser("status", help="Show pipeline status")
 
-    # transcripts
+
+def _add_transcripts_parser(sub):
     p_trans = sub.add_parser("transcripts", help="List recent transcripts")
     p_trans.add_argument("--today", action="store_true")
     p_trans.add_argument("--search", default=None)
     p_trans.add_argument("--limit", type=int, default=20)
 
-    # actions
+
+def _add_actions_parser(sub):
     sub.add_parser("actions", help="List recent actions")
 
-    # search
+
+def _add_search_parser(sub):
     p_search = sub.add_parser("search", help="Search over conversations")
     p_search.add_argument("query", help="Search query")
     p_search.add_argument("--limit", type=int, default=10)
     p_search.add_argument("--date", default=None, help="Filter by date (YYYY-MM-DD)")
-    p_search.add_argument("--mode", choices=["keyword", "semantic", "hybrid"], default="hybrid", 
+    p_search.add_argument("--mode", choices=["keyword", "semantic", "hybrid"], default="hybrid",
                           help="Search mode: keyword (FTS5), semantic (vector), or hybrid (default)")
 
-    # reindex
+
+def _add_reindex_parser(sub):
     p_reindex = sub.add_parser("reindex", help="Re-embed all conversations into vector store")
     p_reindex.add_argument("--force", action="store_true", help="Force rebuild entire index")
 
-    # config
+
+def _add_config_parser(sub):
     p_cfg = sub.add_parser("config", help="Show/edit configuration")
     p_cfg.add_argument("action", nargs="?", default=None, choices=["set", "get"], help="set/get a DB setting")
     p_cfg.add_argument("config_args", nargs="*", default=[], help="key [value]")
     p_cfg.add_argument("--set", default=None, metavar="KEY=VALUE", dest="legacy_set")
     p_cfg.add_argument("--show", action="store_true")
 
-    # speakers
+
+def _add_speakers_parser(sub):
     p_spk = sub.add_parser("speakers", help="Manage authorized speakers")
     p_spk.add_argument("action", choices=["authorize", "revoke", "list"], help="Action")
     p_spk.add_argument("speaker_id", nargs="?", default=None, help="Speaker ID (e.g. SPEAKER_00)")
 
-    # security-log
+
+def _add_security_log_parser(sub):
     p_sec = sub.add_parser("security-log", help="Show security event log")
     p_sec.add_argument("--limit", type=int, default=50)
     p_sec.add_argument("--reason", default=None, choices=["unauthorized_speaker", "invalid_webhook_auth", "injection_detected"])
 
-    # audit
+
+def _add_audit_parser(sub):
     sub.add_parser("audit", help="Show data stats (conversations, utterances, speakers, etc.)")
 
-    # commitments (CIL Level 2)
+
+def _add_commitments_parser(sub):
     p_commit = sub.add_parser("commitments", help="Track commitments and promises from conversations")
     p_commit.add_argument("action", nargs="?", default="list", choices=["list", "overdue", "fulfill", "cancel"],
                           help="list (default), overdue, fulfill <id>, cancel <id>")
     p_commit.add_argument("--speaker", default=None, help="Filter by speaker name")
     p_commit.add_argument("--id", default=None, help="Commitment ID (for fulfill/cancel)")
 
-    # briefing (CIL Level 2)
+
+def _add_briefing_parser(sub):
     p_briefing = sub.add_parser("briefing", help="Generate pre-meeting context intelligence briefings")
     p_briefing.add_argument("--person", default=None, help="Generate briefing for specific person")
     p_briefing.add_argument("--all", action="store_true", help="Briefings for all meetings today")
-    p_briefing.add_argument("--format", choices=["markdown", "json"], default="markdown", 
+    p_briefing.add_argument("--format", choices=["markdown", "json"], default="markdown",
                            help="Output format (default: markdown)")
-    p_briefing.add_argument("--minutes-ahead", type=int, default=60, 
+    p_briefing.add_argument("--minutes-ahead", type=int, default=60,
                            help="Look for meetings within N minutes (default: 60)")
 
-    # mcp
+
+def _add_mcp_parser(sub):
     sub.add_parser("mcp", help="Start MCP server (Model Context Protocol) for Claude Desktop")
 
-    # purge
+
+def _add_purge_parser(sub):
     p_purge = sub.add_parser("purge", help="Purge data")
     p_purge.add_argument("--older-than", type=int, default=None, metavar="DAYS", help="Delete conversations older than N days")
     p_purge.add_argument("--conversation", default=None, metavar="ID", help="Delete a specific conversation")
     p_purge.add_argument("--all", action="store_true", help="Delete all data")
     p_purge.add_argument("--confirm", action="store_true", help="Confirm destructive action")
 
-    # ── Meeting source connectors ──
+
+# Meeting source connectors
+
+def _add_granola_sync_parser(sub):
     p_granola = sub.add_parser("granola-sync", help="Import meetings from Granola (local cache or API)")
     p_granola.add_argument("--api", action="store_true", help="Use Granola Enterprise API instead of local cache")
     p_granola.add_argument("--since", default=None, help="Only import meetings after date (YYYY-MM-DD)")
     p_granola.add_argument("--dry-run", action="store_true", help="Preview without writing to DB")
 
+
+def _add_zoom_sync_parser(sub):
     p_zoom_sync = sub.add_parser("zoom-sync", help="Import recent Zoom cloud recordings")
     p_zoom_sync.add_argument("--days", type=int, default=7, help="How many days back to sync (default 7)")
 
+
+def _add_zoom_import_parser(sub):
     p_zoom_import = sub.add_parser("zoom-import", help="Import a specific Zoom recording or VTT file")
     p_zoom_import.add_argument("source", help="Zoom meeting ID or path to .vtt file")
     p_zoom_import.add_argument("--topic", default=None, help="Meeting topic (for VTT files)")
 
+
+def _add_chatgpt_api_parser(sub):
     p_chatgpt = sub.add_parser("chatgpt-api", help="Start ChatGPT Actions API server")
     p_chatgpt.add_argument("--port", type=int, default=8901, help="Port (default 8901)")
     p_chatgpt.add_argument("--host", default="127.0.0.1", help="Bind address")
     p_chatgpt.add_argument("--export-schema", type=str, default=None, help="Export OpenAPI schema to file and exit")
 
-    # Browser audio capture
+
+def _add_capture_browser_parser(sub):
     p_browser = sub.add_parser("capture-browser", help="Capture audio from browser tabs via Chrome CDP")
     p_browser.add_argument("subcommand", nargs="?", default="status",
                           choices=["tabs", "capture", "stop", "status", "watch"],
@@ -1005,7 +1168,66 @@ def main():
     p_browser.add_argument("--cdp-url", default="http://127.0.0.1:9222", help="Chrome CDP URL")
     p_browser.add_argument("--interval", type=int, default=15, help="Watch check interval (seconds)")
 
-    args = parser.parse_args()
+
+# Each subcommand's arguments, in `percept --help` order
+_SUBPARSER_BUILDERS = {
+    "listen": _add_listen_parser,
+    "serve": _add_serve_parser,
+    "status": _add_status_parser,
+    "transcripts": _add_transcripts_parser,
+    "actions": _add_actions_parser,
+    "search": _add_search_parser,
+    "reindex": _add_reindex_parser,
+    "config": _add_config_parser,
+    "speakers": _add_speakers_parser,
+    "security-log": _add_security_log_parser,
+    "audit": _add_audit_parser,
+    "commitments": _add_commitments_parser,
+    "briefing": _add_briefing_parser,
+    "mcp": _add_mcp_parser,
+    "purge": _add_purge_parser,
+    "granola-sync": _add_granola_sync_parser,
+    "zoom-sync": _add_zoom_sync_parser,
+    "zoom-import": _add_zoom_import_parser,
+    "chatgpt-api": _add_chatgpt_api_parser,
+    "capture-browser": _add_capture_browser_parser,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand name if argv starts with one."""
+    if argv and not argv[0].startswith("-"):
+        return argv[0]
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    For a known subcommand only its own subparser is built; otherwise (no
+    command, --help, a typo) all of them are, so help and errors list every command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="percept",
+        description="Percept — ambient voice intelligence pipeline",
+    )
+    sub = parser.add_subparsers(dest="command")
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](sub)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(sub)
+    return parser
+
+
+# ── Main ───────────────────────────────────────────────────────────────
+
+def main():
+    """Main entry point for the Percept CLI."""
+    argv = sys.argv[1:]
+    parser = _get_parser(_sniff_subcommand(argv))
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
@@ -2,8 +2,14 @@
 
 import re
 import logging
+import threading
 from dataclasses import dataclass
 
+try:
+    import hyperscan  # optional: scan all dangerous patterns in one DFA pass
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -62,6 +68,44 @@ _INFO_LEAK_PATTERNS = [
     r'\b(whoami|hostname|ifconfig|ip\s+addr)\b.*\b(email|text|send|curl|post)\b',
 ]
 
+# Literal substrings one of which must occur in any (lowercased) text a pattern
+# matches; a pattern whose literals are all absent can be skipped without running it.
+# Patterns missing from this table are always run.
+_PATTERN_LITERALS = {
+    _EXFIL_PATTERNS[0]: ("curl", "wget", "fetch", "http"),
+    _EXFIL_PATTERNS[1]: ("send",),
+    _EXFIL_PATTERNS[2]: ("upload", "post", "push", "exfiltrate"),
+    _EXFIL_PATTERNS[3]: ("curl", "wget", "fetch"),
+    _CRED_PATTERNS[0]: ("read",),
+    _CRED_PATTERNS[1]: ("cat",),
+    _CRED_PATTERNS[2]: ("print",),
+    _CRED_PATTERNS[3]: ("$",),
+    _CRED_PATTERNS[4]: ("env",),
+    _CRED_PATTERNS[5]: ("key", "token"),
+    _CRED_PATTERNS[6]: ("send", "email", "text", "post"),
+    _CRED_PATTERNS[7]: ("dump", "export"),
+    _CRED_PATTERNS[8]: ("cat",),
+    _CRED_PATTERNS[9]: ("read",),
+    _CRED_PATTERNS[10]: ("cat",),
+    _NETWORK_PATTERNS[0]: ("sshd_config", "authorized_keys"),
+    _NETWORK_PATTERNS[1]: ("sshd", "authorized_keys"),
+    _NETWORK_PATTERNS[2]: ("port",),
+    _NETWORK_PATTERNS[3]: ("iptables", "ufw", "firewall"),
+    _NETWORK_PATTERNS[4]: ("chmod",),
+    _NETWORK_PATTERNS[5]: ("netcat", "nc"),
+    _NETWORK_PATTERNS[6]: ("shell",),
+    _DESTRUCTIVE_PATTERNS[0]: ("rm",),
+    _DESTRUCTIVE_PATTERNS[1]: ("rm",),
+    _DESTRUCTIVE_PATTERNS[2]: ("if=",),
+    _DESTRUCTIVE_PATTERNS[3]: ("mkfs",),
+    _DESTRUCTIVE_PATTERNS[4]: ("format",),
+    _DESTRUCTIVE_PATTERNS[5]: ("shutdown", "reboot", "halt", "poweroff"),
+    _DESTRUCTIVE_PATTERNS[6]: ("kill",),
+    _DESTRUCTIVE_PATTERNS[7]: (":()",),
+    _INFO_LEAK_PATTERNS[0]: ("email", "text", "send", "message"),
+    _INFO_LEAK_PATTERNS[1]: ("whoami", "hostname", "ifconfig", "addr"),
+}
+
 # Combined for efficiency
 _ALL_DANGEROUS = (
     [("exfiltration", p) for p in _EXFIL_PATTERNS] +
@@ -78,6 +122,90 @@ _SAFE_CONTEXT_PATTERNS = [
 ]
 
 
+def _compile_patterns(entries: list[tuple[str, str]], flags: int = 0) -> list[tuple[str, re.Pattern]]:
+    """Compile (category, pattern) pairs once, logging and skipping any invalid regex."""
+    compiled = []
+    for category, pattern in entries:
+        try:
+            compiled.append((category, re.compile(pattern, flags)))
+        except re.error as e:
+            logger.error(f"Skipping invalid {category} safety pattern {pattern!r}: {e}")
+    return compiled
+
+
+_ALL_DANGEROUS_COMPILED = _compile_patterns(_ALL_DANGEROUS, re.IGNORECASE)
+_SAFE_CONTEXT_COMPILED = [re.compile(p) for p in _SAFE_CONTEXT_PATTERNS]
+
+
+def _build_category_unions(compiled: list[tuple[str, re.Pattern]]) -> list[tuple[str, re.Pattern, list[re.Pattern]]]:
+    """Fuse each category's patterns into one alternation, keeping category order.
+
+    One search per category replaces one per pattern; the individual patterns are
+    kept to report which one matched.
+    """
+    by_category: dict[str, list[re.Pattern]] = {}
+    for category, pattern in compiled:
+        by_category.setdefault(category, []).append(pattern)
+    return [
+        (category, re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.IGNORECASE), patterns)
+        for category, patterns in by_category.items()
+    ]
+
+
+_CATEGORY_UNIONS = _build_category_unions(_ALL_DANGEROUS_COMPILED)
+
+# (category, pattern, trigger literals or None) in pattern order, for the prefiltered scan
+_PREFILTERED = [
+    (category, pattern, frozenset(_PATTERN_LITERALS[pattern.pattern]) if pattern.pattern in _PATTERN_LITERALS else None)
+    for category, pattern in _ALL_DANGEROUS_COMPILED
+]
+_ALL_LITERALS = frozenset().union(*(literals for _, _, literals in _PREFILTERED if literals))
+
+
+def _build_hyperscan_db(compiled: list[tuple[str, re.Pattern]]):
+    """Compile the dangerous patterns hyperscan supports into one block-mode database.
+
+    Returns (database, ids of the patterns it holds), or (None, empty set) when
+    hyperscan is unavailable. Patterns hyperscan rejects (e.g. lookaheads) stay on re.
+    """
+    if hyperscan is None:
+        return None, frozenset()
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    supported = []
+    for i, (_, pattern) in enumerate(compiled):
+        try:
+            hyperscan.Database().compile(expressions=[pattern.pattern.encode()], ids=[i], flags=[flags])
+            supported.append(i)
+        except hyperscan.error:
+            pass
+    if not supported:
+        return None, frozenset()
+    db = hyperscan.Database()
+    db.compile(expressions=[compiled[i][1].pattern.encode() for i in supported],
+               ids=supported, flags=[flags] * len(supported))
+    return db, frozenset(supported)
+
+
+_HS_DB, _HS_IDS = _build_hyperscan_db(_ALL_DANGEROUS_COMPILED)
+# Python's str \s also matches these ASCII separators; hyperscan's \s does not
+_HS_UNSUPPORTED_WHITESPACE = re.compile("[\x1c-\x1f]")
+_hs_local = threading.local()  # hyperscan scratch space is per thread
+
+
+def _hyperscan_hits(combined: str) -> set[int]:
+    """Ids of the hyperscan-compiled patterns that match combined."""
+    scratch = getattr(_hs_local, "scratch", None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(_HS_DB)
+    hits = set()
+    _HS_DB.scan(combined.encode(), match_event_handler=lambda pattern_id, *_: hits.add(pattern_id), scratch=scratch)
+    return hits
+
+
+# Categories still blocked when the command reads as an informational query
+_INFORMATIONAL_BLOCKED = ("exfiltration", "destructive_command")
+
+
 @dataclass
 class SafetyResult:
     level: str  # "safe", "needs_confirmation", "blocked"
@@ -105,24 +233,67 @@ def classify_command_safety(transcript: str, parsed_intent: dict = None) -> Safe
     
     combined = f"{text} {params_text}"
     
-    # First check if this is clearly a safe/informational query
-    is_informational = any(re.search(p, text) for p in _SAFE_CONTEXT_PATTERNS)
+    # Whether this is clearly a safe/informational query; only worked out once
+    # a dangerous pattern matches, since most commands match none
+    is_informational = None
     
-    # Check against all dangerous patterns
-    for category, pattern in _ALL_DANGEROUS:
-        try:
-            if re.search(pattern, combined, re.IGNORECASE):
-                # If it's an informational query, only block exfiltration and destructive
-                if is_informational and category not in ("exfiltration", "destructive_command"):
+    # hyperscan's \b and \w are ASCII-only and its \s lacks \x1c-\x1f, so it
+    # only handles ASCII text without those separators
+    if (_HS_DB is not None and combined.isascii()
+            and not _HS_UNSUPPORTED_WHITESPACE.search(combined)):
+        hits = _hyperscan_hits(combined)
+        for i, (category, pattern) in enumerate(_ALL_DANGEROUS_COMPILED):
+            if not (i in hits if i in _HS_IDS else pattern.search(combined)):
+                continue
+            if category not in _INFORMATIONAL_BLOCKED:
+                if is_informational is None:
+                    is_informational = _is_informational(text)
+                if is_informational:
                     continue
-                
-                return SafetyResult(
-                    level="blocked",
-                    reason=f"Dangerous command detected: {category}",
-                    category=category,
-                    matched_pattern=pattern[:100],
-                )
-        except re.error:
-            continue
+            return _blocked(category, pattern)
+        return SafetyResult(level="safe")
+    
+    # Without hyperscan, ASCII text only runs the patterns whose trigger literals
+    # occur in it (non-ASCII could match a literal case-insensitively, e.g. "ſ" for "s")
+    if combined.isascii():
+        present = {literal for literal in _ALL_LITERALS if literal in combined}
+        for category, pattern, literals in _PREFILTERED:
+            if literals is not None and literals.isdisjoint(present):
+                continue
+            if not pattern.search(combined):
+                continue
+            if category not in _INFORMATIONAL_BLOCKED:
+                if is_informational is None:
+                    is_informational = _is_informational(text)
+                if is_informational:
+                    continue
+            return _blocked(category, pattern)
+        return SafetyResult(level="safe")
+    
+    # Check against all dangerous patterns, one combined scan per category
+    for category, union, patterns in _CATEGORY_UNIONS:
+        if union.search(combined):
+            # If it's an informational query, only block exfiltration and destructive
+            if category not in _INFORMATIONAL_BLOCKED:
+                if is_informational is None:
+                    is_informational = _is_informational(text)
+                if is_informational:
+                    continue
+            
+            # Report the first pattern in list order, as a per-pattern scan would
+            return _blocked(category, next(p for p in patterns if p.search(combined)))
     
     return SafetyResult(level="safe")
+
+
+def _is_informational(text: str) -> bool:
+    return any(p.search(text) for p in _SAFE_CONTEXT_COMPILED)
+
+
+def _blocked(category: str, pattern: re.Pattern) -> SafetyResult:
+    return SafetyResult(
+        level="blocked",
+        reason=f"Dangerous command detected: {category}",
+        category=category,
+        matched_pattern=pattern.pattern[:100],
+    )
@@ -15,6 +15,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
 
+from .database import like_contains, sql_lower
+
 logger = logging.getLogger(__name__)
 
 # Commitment signal patterns — phrases that indicate someone is committing to something
@@ -402,29 +404,36 @@ class CommitmentTracker:
             logger.error(f"Failed to check overdue: {e}")
             return []
 
-    def get_open_commitments(self, speaker: Optional[str] = None) -> list[dict]:
-        """Get all open commitments, optionally filtered by speaker."""
+    def get_open_commitments(self, speaker: Optional[str] = None,
+                             person: Optional[str] = None) -> list[dict]:
+        """Get all open commitments, optionally filtered by speaker.
+
+        person matches commitments whose speaker or action mentions that name.
+        """
         if not self.db:
             return []
 
         try:
             conn = self.db._get_conn()
+            q = """
+                SELECT id, speaker_name, action, deadline, deadline_dt,
+                       status, confidence, extracted_at
+                FROM commitments
+                WHERE status = 'open'
+            """
+            params = []
             if speaker:
-                rows = conn.execute("""
-                    SELECT id, speaker_name, action, deadline, deadline_dt,
-                           status, confidence, extracted_at
-                    FROM commitments
-                    WHERE status = 'open' AND speaker_name LIKE ?
-                    ORDER BY deadline_dt ASC NULLS LAST
-                """, (f"%{speaker}%",)).fetchall()
-            else:
-                rows = conn.execute("""
-                    SELECT id, speaker_name, action, deadline, deadline_dt,
-                           status, confidence, extracted_at
-                    FROM commitments
-                    WHERE status = 'open'
-                    ORDER BY deadline_dt ASC NULLS LAST
-                """).fetchall()
+                q += " AND speaker_name LIKE ?"
+                params.append(f"%{speaker}%")
+            if person:
+                # Match person literally and with Python's Unicode case folding
+                conn.create_function("py_lower", 1, sql_lower, deterministic=True)
+                q += (" AND (py_lower(speaker_name) LIKE ? ESCAPE '\\'"
+                      " OR py_lower(action) LIKE ? ESCAPE '\\')")
+                pattern = like_contains(person.lower())
+                params.extend([pattern, pattern])
+            q += " ORDER BY deadline_dt ASC NULLS LAST"
+            rows = conn.execute(q, params).fetchall()
 
             return [
                 {
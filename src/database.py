@@ -12,6 +12,21 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# remove_diacritics is only understood by the trigram tokenizer from SQLite 3.45
+_TRIGRAM_TOKENIZE = ("trigram remove_diacritics 1" if sqlite3.sqlite_version_info >= (3, 45, 0)
+                     else "trigram")
+
+
+def like_contains(text: str) -> str:
+    """LIKE pattern (for use with ESCAPE '\\') matching text literally anywhere in a value."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def sql_lower(value):
+    """str.lower for SQL as py_lower(); SQLite's own lower() and LIKE fold ASCII only."""
+    return value.lower() if isinstance(value, str) else value
+
 
 class PerceptDB:
     def __init__(self, db_path: str = None):
@@ -21,8 +36,10 @@ class PerceptDB:
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self._db_path = db_path
         self._lock = threading.Lock()
+        self._data_version = 0  # bumped on writes that feed dashboard aggregates
         self._conn = sqlite3.connect(db_path, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
+        self._conn.create_function("py_lower", 1, sql_lower, deterministic=True)
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA foreign_keys=ON")
         self._create_tables()
@@ -116,6 +133,7 @@ class PerceptDB:
                 CREATE INDEX IF NOT EXISTS idx_actions_status ON actions(status);
                 CREATE INDEX IF NOT EXISTS idx_actions_timestamp ON actions(timestamp);
                 CREATE INDEX IF NOT EXISTS idx_entity_mentions_name ON entity_mentions(entity_name);
+                CREATE INDEX IF NOT EXISTS idx_entity_mentions_conversation ON entity_mentions(conversation_id);
                 CREATE INDEX IF NOT EXISTS idx_speakers_name ON speakers(name);
 
                 -- CIL: Utterances (atomic unit)
@@ -196,6 +214,37 @@ class PerceptDB:
                 END;
             """)
 
+            # Trigram FTS5 index for substring matches the porter index misses
+            # (partial words, names inside compounds). Needs SQLite >= 3.34.
+            self._has_trigram = True
+            try:
+                existed = c.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'utterances_trigram'").fetchone()
+                c.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS utterances_trigram USING fts5(
+                        text, content=utterances, content_rowid=rowid,
+                        tokenize='{_TRIGRAM_TOKENIZE}'
+                    )
+                """)
+                c.executescript("""
+                    CREATE TRIGGER IF NOT EXISTS utterances_tri_ai AFTER INSERT ON utterances BEGIN
+                        INSERT INTO utterances_trigram(rowid, text) VALUES (new.rowid, new.text);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS utterances_tri_ad AFTER DELETE ON utterances BEGIN
+                        INSERT INTO utterances_trigram(utterances_trigram, rowid, text) VALUES('delete', old.rowid, old.text);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS utterances_tri_au AFTER UPDATE ON utterances BEGIN
+                        INSERT INTO utterances_trigram(utterances_trigram, rowid, text) VALUES('delete', old.rowid, old.text);
+                        INSERT INTO utterances_trigram(rowid, text) VALUES (new.rowid, new.text);
+                    END;
+                """)
+                if not existed:
+                    # Index utterances saved before the trigram table existed
+                    c.execute("INSERT INTO utterances_trigram(utterances_trigram) VALUES('rebuild')")
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Trigram FTS5 tokenizer unavailable, substring search disabled: {e}")
+                self._has_trigram = False
+
             # Settings table
             c.execute("""
                 CREATE TABLE IF NOT EXISTS settings (
@@ -266,6 +315,22 @@ class PerceptDB:
 
     # --- Conversations ---
 
+    _UPSERT_CONVERSATION_SQL = """
+        INSERT INTO conversations (id, timestamp, date, duration_seconds, segment_count,
+            word_count, speakers, topics, transcript, summary, file_path, summary_file_path)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            duration_seconds=excluded.duration_seconds,
+            segment_count=excluded.segment_count,
+            word_count=excluded.word_count,
+            speakers=excluded.speakers,
+            topics=excluded.topics,
+            transcript=excluded.transcript,
+            summary=COALESCE(excluded.summary, conversations.summary),
+            file_path=COALESCE(excluded.file_path, conversations.file_path),
+            summary_file_path=COALESCE(excluded.summary_file_path, conversations.summary_file_path)
+    """
+
     def save_conversation(self, id: str, timestamp: float, date: str,
                           duration_seconds: float = None, segment_count: int = None,
                           word_count: int = None, speakers: list = None,
@@ -274,24 +339,25 @@ class PerceptDB:
                           summary_file_path: str = None):
         """Save a conversation record to the database."""
         with self._lock:
-            self._conn.execute("""
-                INSERT INTO conversations (id, timestamp, date, duration_seconds, segment_count,
-                    word_count, speakers, topics, transcript, summary, file_path, summary_file_path)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    duration_seconds=excluded.duration_seconds,
-                    segment_count=excluded.segment_count,
-                    word_count=excluded.word_count,
-                    speakers=excluded.speakers,
-                    topics=excluded.topics,
-                    transcript=excluded.transcript,
-                    summary=COALESCE(excluded.summary, conversations.summary),
-                    file_path=COALESCE(excluded.file_path, conversations.file_path),
-                    summary_file_path=COALESCE(excluded.summary_file_path, conversations.summary_file_path)
-            """, (id, timestamp, date, duration_seconds, segment_count, word_count,
-                  json.dumps(speakers) if speakers else None,
-                  json.dumps(topics) if topics else None,
-                  transcript, summary, file_path, summary_file_path))
+            self._conn.execute(self._UPSERT_CONVERSATION_SQL, (
+                id, timestamp, date, duration_seconds, segment_count, word_count,
+                json.dumps(speakers) if speakers else None,
+                json.dumps(topics) if topics else None,
+                transcript, summary, file_path, summary_file_path))
+            self._data_version += 1
+            self._conn.commit()
+
+    def save_conversations_batch(self, conversations: list[dict]):
+        """Bulk upsert conversations in one transaction. Each dict takes save_conversation's kwargs."""
+        with self._lock:
+            self._conn.executemany(self._UPSERT_CONVERSATION_SQL, [(
+                c["id"], c["timestamp"], c["date"], c.get("duration_seconds"),
+                c.get("segment_count"), c.get("word_count"),
+                json.dumps(c["speakers"]) if c.get("speakers") else None,
+                json.dumps(c["topics"]) if c.get("topics") else None,
+                c.get("transcript"), c.get("summary"), c.get("file_path"), c.get("summary_file_path"),
+            ) for c in conversations])
+            self._data_version += 1
             self._conn.commit()
 
     def get_conversations(self, date: str = None, limit: int = 50, search: str = None) -> list[dict]:
@@ -314,6 +380,19 @@ class PerceptDB:
             rows = self._conn.execute(q, params).fetchall()
         return [self._row_to_dict(r) for r in rows]
 
+    def conversations_daily_stats(self, date: str) -> tuple[int, int]:
+        """Return (conversation count, total words) for a date in one aggregate query."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(word_count), 0) FROM conversations WHERE date = ?",
+                (date,)).fetchone()
+        return row[0], row[1]
+
+    def iter_conversations(self, limit: int = 10000, batch_size: int = 256):
+        """Yield conversations newest-first without materializing the full result set."""
+        yield from self._iter_query(
+            "SELECT * FROM conversations ORDER BY timestamp DESC LIMIT ?", (limit,), batch_size)
+
     def get_conversation(self, id: str) -> dict | None:
         """Get a single conversation by ID."""
         with self._lock:
@@ -333,6 +412,7 @@ class PerceptDB:
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             """, (action_id, time.time(), conversation_id, intent,
                   json.dumps(params) if params else None, raw_text, status))
+            self._data_version += 1
             self._conn.commit()
         return action_id
 
@@ -342,6 +422,7 @@ class PerceptDB:
             self._conn.execute("""
                 UPDATE actions SET status = ?, result = ?, executed_at = ? WHERE id = ?
             """, (status, result, time.time() if status != "pending" else None, action_id))
+            self._data_version += 1
             self._conn.commit()
 
     def get_actions(self, status: str = None, limit: int = 50) -> list[dict]:
@@ -355,6 +436,11 @@ class PerceptDB:
                 "SELECT * FROM actions ORDER BY timestamp DESC LIMIT ?", (limit,)).fetchall()
         return [self._row_to_dict(r) for r in rows]
 
+    def iter_actions(self, limit: int = 10000, batch_size: int = 256):
+        """Yield actions newest-first without materializing the full result set."""
+        yield from self._iter_query(
+            "SELECT * FROM actions ORDER BY timestamp DESC LIMIT ?", (limit,), batch_size)
+
     # --- Speakers ---
 
     def get_speakers(self) -> list[dict]:
@@ -391,8 +477,20 @@ class PerceptDB:
                     INSERT INTO speakers (id, name, first_seen, last_seen, total_words, total_segments, relationship)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
                 """, (speaker_id, name, now, now, words_delta, segments_delta, relationship))
+            self._data_version += 1
             self._conn.commit()
 
+    def speakers_version(self) -> str:
+        """Change token for the speakers table: row count plus newest last_seen.
+
+        update_speaker bumps last_seen on every write, so the token changes with
+        any speaker insert or update, including ones made by other processes.
+        """
+        with self._lock:
+            count, newest = self._conn.execute(
+                "SELECT COUNT(*), MAX(last_seen) FROM speakers").fetchone()
+        return f"{count}-{newest or 0}"
+
     def get_speaker_stats(self) -> list[dict]:
         """Get aggregated speaker statistics."""
         with self._lock:
@@ -412,11 +510,36 @@ class PerceptDB:
                     INSERT INTO entity_mentions (conversation_id, entity_type, entity_name, timestamp)
                     VALUES (?, ?, ?, ?)
                 """, (conversation_id, entity_type, entity_name, time.time()))
+                self._data_version += 1
                 self._conn.commit()
             except Exception:
                 # FK constraint can fail if conversation not yet saved — skip silently
                 pass
 
+    def save_entity_mentions_batch(self, conversation_id: str, mentions: list[tuple[str, str]]):
+        """Save (entity_type, entity_name) mentions for one conversation with a single executemany."""
+        if not mentions:
+            return
+        now = time.time()
+        rows = [(conversation_id, etype, name, now) for etype, name in mentions]
+        sql = """
+            INSERT INTO entity_mentions (conversation_id, entity_type, entity_name, timestamp)
+            VALUES (?, ?, ?, ?)
+        """
+        with self._lock:
+            try:
+                self._conn.executemany(sql, rows)
+            except Exception:
+                # FK constraint can fail if conversation not yet saved — keep per-row skip semantics
+                self._conn.rollback()
+                for row in rows:
+                    try:
+                        self._conn.execute(sql, row)
+                    except Exception:
+                        pass
+            self._data_version += 1
+            self._conn.commit()
+
     def search_entities(self, query: str) -> list[dict]:
         """Search entity mentions by name pattern."""
         with self._lock:
@@ -426,6 +549,25 @@ class PerceptDB:
             """, (f"%{query}%",)).fetchall()
         return [self._row_to_dict(r) for r in rows]
 
+    def entity_mentions_version(self) -> str:
+        """Change token for entity_mentions: row count plus highest id (ids only grow)."""
+        with self._lock:
+            count, newest = self._conn.execute(
+                "SELECT COUNT(*), MAX(id) FROM entity_mentions").fetchone()
+        return f"{count}-{newest or 0}"
+
+    def get_entity_mentions(self, conversation_ids: list[str]) -> list[dict]:
+        """Get entity mentions for any of the given conversations in one query."""
+        if not conversation_ids:
+            return []
+        placeholders = ",".join("?" * len(conversation_ids))
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT conversation_id, entity_type, entity_name FROM entity_mentions
+                WHERE conversation_id IN ({placeholders})
+            """, list(conversation_ids)).fetchall()
+        return [self._row_to_dict(r) for r in rows]
+
     # --- Analytics ---
 
     def get_analytics(self, period: str = "today") -> dict:
@@ -464,6 +606,44 @@ class PerceptDB:
             "total_duration_s": row["duration"],
         }
 
+    def get_analytics_bundle(self) -> dict:
+        """Get today/week/month/all-time totals plus today's segments per hour in one pass."""
+        import datetime as dt
+        now = dt.datetime.now()
+        params = {
+            "today": now.strftime("%Y-%m-%d"),
+            "week": (now - dt.timedelta(days=7)).strftime("%Y-%m-%d"),
+            "month": (now - dt.timedelta(days=30)).strftime("%Y-%m-%d"),
+        }
+        with self._lock:
+            row = self._conn.execute("""
+                SELECT COUNT(*) as count,
+                       COALESCE(SUM(word_count),0) as words,
+                       COALESCE(SUM(CASE WHEN date = :today THEN word_count END),0) as today_words,
+                       COALESCE(SUM(CASE WHEN date >= :week THEN word_count END),0) as week_words,
+                       COALESCE(SUM(CASE WHEN date >= :month THEN word_count END),0) as month_words,
+                       COALESCE(SUM(duration_seconds),0) as duration,
+                       COALESCE(SUM(summary_file_path IS NOT NULL),0) as summary_count
+                FROM conversations
+            """, params).fetchone()
+            hours = self._conn.execute("""
+                SELECT COALESCE(strftime('%H', NULLIF(timestamp, 0), 'unixepoch', 'localtime'), '00') as hour,
+                       COALESCE(SUM(segment_count),0) as segments
+                FROM conversations WHERE date = :today
+                GROUP BY hour
+            """, params).fetchall()
+
+        return {
+            "conversation_count": row["count"],
+            "total_words": row["words"],
+            "today_words": row["today_words"],
+            "week_words": row["week_words"],
+            "month_words": row["month_words"],
+            "total_duration_s": row["duration"],
+            "summary_count": row["summary_count"],
+            "segments_per_hour": {r["hour"]: r["segments"] for r in hours},
+        }
+
     # --- Context ---
 
     def get_recent_context(self, minutes: int = 30) -> list[dict]:
@@ -479,18 +659,28 @@ class PerceptDB:
 
     # --- Contacts ---
 
+    _UPSERT_CONTACT_SQL = """
+        INSERT INTO contacts (id, name, email, phone, relationship)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            name=excluded.name, email=COALESCE(excluded.email, contacts.email),
+            phone=COALESCE(excluded.phone, contacts.phone),
+            relationship=COALESCE(excluded.relationship, contacts.relationship)
+    """
+
     def save_contact(self, id: str, name: str, email: str = None, phone: str = None,
                      relationship: str = None):
         """Save or update a contact record."""
         with self._lock:
-            self._conn.execute("""
-                INSERT INTO contacts (id, name, email, phone, relationship)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    name=excluded.name, email=COALESCE(excluded.email, contacts.email),
-                    phone=COALESCE(excluded.phone, contacts.phone),
-                    relationship=COALESCE(excluded.relationship, contacts.relationship)
-            """, (id, name, email, phone, relationship))
+            self._conn.execute(self._UPSERT_CONTACT_SQL, (id, name, email, phone, relationship))
+            self._conn.commit()
+
+    def save_contacts_batch(self, contacts: list[dict]):
+        """Bulk upsert contacts in one transaction. Each dict takes save_contact's kwargs."""
+        with self._lock:
+            self._conn.executemany(self._UPSERT_CONTACT_SQL, [(
+                c["id"], c["name"], c.get("email"), c.get("phone"), c.get("relationship"),
+            ) for c in contacts])
             self._conn.commit()
 
     def get_contacts(self) -> list[dict]:
@@ -732,19 +922,41 @@ class PerceptDB:
                 "started_at": u["started_at"], "ended_at": u["ended_at"],
                 "confidence": u.get("confidence"), "is_command": int(u.get("is_command", False)),
             } for u in utterances_list])
+            self._data_version += 1
             self._conn.commit()
 
-    def search_utterances(self, query: str, limit: int = 20) -> list[dict]:
-        """FTS5 search across utterances."""
+    def search_utterances(self, query: str, limit: int = 20,
+                          date_filter: str = None) -> list[dict]:
+        """FTS5 search across utterances.
+
+        Tries the stemmed porter index first, then the trigram index so that
+        substrings (e.g. "sarah" in "sarahs") still match without a vector fallback.
+        date_filter (YYYY-MM-DD) restricts matches to conversations on that date
+        inside the query, so LIMIT applies after the filter.
+        """
+        date_join = ("JOIN conversations c ON c.id = u.conversation_id AND c.date = ?"
+                     if date_filter else "")
+        params = (date_filter, query, limit) if date_filter else (query, limit)
         with self._lock:
-            rows = self._conn.execute("""
+            rows = self._conn.execute(f"""
                 SELECT u.*, highlight(utterances_fts, 0, '<b>', '</b>') as highlighted
                 FROM utterances_fts fts
                 JOIN utterances u ON u.rowid = fts.rowid
+                {date_join}
                 WHERE utterances_fts MATCH ?
                 ORDER BY rank
                 LIMIT ?
-            """, (query, limit)).fetchall()
+            """, params).fetchall()
+            if not rows and self._has_trigram and len(query.strip()) >= 3:
+                rows = self._conn.execute(f"""
+                    SELECT u.*, highlight(utterances_trigram, 0, '<b>', '</b>') as highlighted
+                    FROM utterances_trigram tri
+                    JOIN utterances u ON u.rowid = tri.rowid
+                    {date_join}
+                    WHERE utterances_trigram MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                """, params).fetchall()
         return [self._row_to_dict(r) for r in rows]
 
     def get_utterances(self, conversation_id: str) -> list[dict]:
@@ -760,48 +972,78 @@ class PerceptDB:
     def save_relationship(self, source_id: str, target_id: str, relation_type: str,
                           evidence: str = None) -> str:
         """Save or update a relationship between two entities."""
-        now = time.time()
-        # Check for existing relationship
         with self._lock:
-            existing = self._conn.execute("""
-                SELECT id, evidence, weight FROM relationships
-                WHERE source_id = ? AND target_id = ? AND relation_type = ?
-            """, (source_id, target_id, relation_type)).fetchone()
+            try:
+                rel_id = self._save_relationship_inner(source_id, target_id, relation_type,
+                                                       evidence, time.time())
+            except IntegrityError as e:
+                logger.warning(f"IntegrityError inserting relationship {source_id} -> {target_id}: {e}")
+                self._conn.rollback()
+                return None
+            self._conn.commit()
+            return rel_id
 
-            if existing:
-                # Update existing: bump weight, update last_seen, append evidence
-                old_evidence = json.loads(existing["evidence"]) if existing["evidence"] else []
-                if evidence:
-                    old_evidence.append(evidence)
-                self._conn.execute("""
-                    UPDATE relationships SET weight = weight + 1.0, last_seen = ?, evidence = ?
-                    WHERE id = ?
-                """, (now, json.dumps(old_evidence[-10:]), existing["id"]))
-                self._conn.commit()
-                return existing["id"]
-            else:
-                rel_id = str(uuid.uuid4())
-                ev_json = json.dumps([evidence]) if evidence else None
+    def save_relationships_batch(self, edges: list[tuple[str, str, str]], evidence: str = None):
+        """Save (source_id, target_id, relation_type) edges in one transaction.
+
+        Same upsert semantics as calling save_relationship per edge, but one lock
+        acquisition and one commit for the whole batch.
+        """
+        if not edges:
+            return
+        now = time.time()
+        with self._lock:
+            for source_id, target_id, relation_type in edges:
                 try:
-                    self._conn.execute("""
-                        INSERT INTO relationships (id, source_id, target_id, relation_type, weight, first_seen, last_seen, evidence)
-                        VALUES (?, ?, ?, ?, 1.0, ?, ?, ?)
-                    """, (rel_id, source_id, target_id, relation_type, now, now, ev_json))
-                    self._conn.commit()
-                    return rel_id
+                    self._save_relationship_inner(source_id, target_id, relation_type, evidence, now)
                 except IntegrityError as e:
                     logger.warning(f"IntegrityError inserting relationship {source_id} -> {target_id}: {e}")
-                    self._conn.rollback()
-                    return None
+            self._conn.commit()
 
-    def get_relationships(self, entity_id: str = None, relation_type: str = None) -> list[dict]:
-        """Get relationships with optional entity and type filters."""
+    def _save_relationship_inner(self, source_id: str, target_id: str, relation_type: str,
+                                 evidence: str, now: float) -> str:
+        """Upsert one relationship without committing. Must be called within lock."""
+        existing = self._conn.execute("""
+            SELECT id, evidence, weight FROM relationships
+            WHERE source_id = ? AND target_id = ? AND relation_type = ?
+        """, (source_id, target_id, relation_type)).fetchone()
+
+        if existing:
+            # Update existing: bump weight, update last_seen, append evidence
+            old_evidence = json.loads(existing["evidence"]) if existing["evidence"] else []
+            if evidence:
+                old_evidence.append(evidence)
+            self._conn.execute("""
+                UPDATE relationships SET weight = weight + 1.0, last_seen = ?, evidence = ?
+                WHERE id = ?
+            """, (now, json.dumps(old_evidence[-10:]), existing["id"]))
+            return existing["id"]
+
+        rel_id = str(uuid.uuid4())
+        ev_json = json.dumps([evidence]) if evidence else None
+        self._conn.execute("""
+            INSERT INTO relationships (id, source_id, target_id, relation_type, weight, first_seen, last_seen, evidence)
+            VALUES (?, ?, ?, ?, 1.0, ?, ?, ?)
+        """, (rel_id, source_id, target_id, relation_type, now, now, ev_json))
+        return rel_id
+
+    def get_relationships(self, entity_id: str = None, relation_type: str = None,
+                          person: str = None) -> list[dict]:
+        """Get relationships with optional entity, type, and person filters.
+
+        person matches a case-insensitive substring of either endpoint.
+        """
         q = "SELECT * FROM relationships"
         params = []
         clauses = []
         if entity_id:
             clauses.append("(source_id = ? OR target_id = ?)")
             params.extend([entity_id, entity_id])
+        if person:
+            clauses.append("(py_lower(source_id) LIKE ? ESCAPE '\\' "
+                           "OR py_lower(target_id) LIKE ? ESCAPE '\\')")
+            p = like_contains(person.lower())
+            params.extend([p, p])
         if relation_type:
             clauses.append("relation_type = ?")
             params.append(relation_type)
@@ -966,6 +1208,24 @@ class PerceptDB:
 
     # --- Helpers ---
 
+    @property
+    def data_version(self) -> int:
+        """Counter bumped on every conversation/utterance/entity/action/speaker write
+        made through this instance — lets callers invalidate cached aggregates."""
+        return self._data_version
+
+    def _iter_query(self, q: str, params, batch_size: int = 256):
+        """Yield rows as dicts, holding the lock only while each batch is fetched."""
+        with self._lock:
+            cur = self._conn.execute(q, params)
+        while True:
+            with self._lock:
+                rows = cur.fetchmany(batch_size)
+            if not rows:
+                return
+            for r in rows:
+                yield self._row_to_dict(r)
+
     @staticmethod
     def _row_to_dict(row: sqlite3.Row) -> dict:
         """Convert a sqlite3.Row to a plain dict."""
@@ -32,6 +32,30 @@ CONF_AUTO = 0.8       # auto-resolve
 CONF_SOFT = 0.5       # soft-resolve (flag uncertainty)
 # < 0.5 = needs_human
 
+# Fast-pass patterns, compiled once
+_EMAIL_RE = re.compile(r'\b[\w.+-]+@[\w-]+\.[\w.]+\b')
+_PHONE_RE = re.compile(r'\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b')
+_URL_RE = re.compile(r'https?://\S+')
+_MENTION_RE = re.compile(r'@(\w+)')
+_DATE_PATTERNS = [
+    (re.compile(r'\b(today|tomorrow|yesterday)\b', re.IGNORECASE), 0.9),
+    (re.compile(r'\b(next|this|last)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b', re.IGNORECASE), 0.85),
+    (re.compile(r'\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?\b', re.IGNORECASE), 0.85),
+    (re.compile(r'\b\d{1,2}/\d{1,2}(?:/\d{2,4})?\b', re.IGNORECASE), 0.7),
+]
+_TITLED_NAME_RE = re.compile(r'\b(?:Mr\.?|Mrs\.?|Ms\.?|Dr\.?)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)')
+_COMPANY_RE = re.compile(r'\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)\s+(?:Inc\.?|Corp\.?|LLC|Ltd\.?|Co\.?)\b')
+_CAPITALIZED_PHRASE_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b')
+
+# Known products/tech — classified before the generic capitalized phrase pass
+_KNOWN_PRODUCTS = frozenset({
+    "apple watch", "apple tv", "apple music", "apple pay",
+    "google maps", "google drive", "google cloud", "google home",
+    "amazon echo", "amazon alexa", "mac mini", "mac pro",
+    "microsoft teams", "visual studio", "open ai", "chat gpt",
+    "omi pendant", "omi device",
+})
+
 
 @dataclass
 class ExtractedEntity:
@@ -52,6 +76,7 @@ class EntityExtractor:
         self.db = db
         self.llm_enabled = llm_enabled
         self._cache: dict[str, list[dict]] = {}  # text_hash -> entities
+        self._directory: tuple[list[dict], list[dict]] | None = None  # (speakers, contacts) snapshot during batches
 
     # ── Fast Pass (regex) ──────────────────────────────────────────────
 
@@ -60,51 +85,36 @@ class EntityExtractor:
         entities = []
 
         # Emails
-        for m in re.finditer(r'\b[\w.+-]+@[\w-]+\.[\w.]+\b', text):
+        for m in _EMAIL_RE.finditer(text):
             entities.append(ExtractedEntity("email", m.group(), 0.95, text[max(0,m.start()-20):m.end()+20]))
 
         # Phone numbers
-        for m in re.finditer(r'\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b', text):
+        for m in _PHONE_RE.finditer(text):
             entities.append(ExtractedEntity("phone", m.group(), 0.9, text[max(0,m.start()-20):m.end()+20]))
 
         # URLs
-        for m in re.finditer(r'https?://\S+', text):
+        for m in _URL_RE.finditer(text):
             entities.append(ExtractedEntity("url", m.group(), 0.95, text[max(0,m.start()-20):m.end()+20]))
 
         # @mentions
-        for m in re.finditer(r'@(\w+)', text):
+        for m in _MENTION_RE.finditer(text):
             entities.append(ExtractedEntity("mention", m.group(1), 0.85, text[max(0,m.start()-20):m.end()+20]))
 
         # Dates: today, tomorrow, next Monday, Feb 21, etc.
-        date_patterns = [
-            (r'\b(today|tomorrow|yesterday)\b', 0.9),
-            (r'\b(next|this|last)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b', 0.85),
-            (r'\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?\b', 0.85),
-            (r'\b\d{1,2}/\d{1,2}(?:/\d{2,4})?\b', 0.7),
-        ]
-        for pat, conf in date_patterns:
-            for m in re.finditer(pat, text, re.IGNORECASE):
+        for pat, conf in _DATE_PATTERNS:
+            for m in pat.finditer(text):
                 entities.append(ExtractedEntity("date", m.group(), conf, text[max(0,m.start()-20):m.end()+20]))
 
         # Named entities: title prefixes + capitalized words
-        for m in re.finditer(r'\b(?:Mr\.?|Mrs\.?|Ms\.?|Dr\.?)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', text):
+        for m in _TITLED_NAME_RE.finditer(text):
             entities.append(ExtractedEntity("person", m.group(1), 0.85, text[max(0,m.start()-20):m.end()+20]))
 
         # Company suffixes
-        for m in re.finditer(r'\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)\s+(?:Inc\.?|Corp\.?|LLC|Ltd\.?|Co\.?)\b', text):
+        for m in _COMPANY_RE.finditer(text):
             entities.append(ExtractedEntity("org", m.group(), 0.8, text[max(0,m.start()-20):m.end()+20]))
 
-        # Known products/tech — classify before the generic capitalized phrase pass
-        _KNOWN_PRODUCTS = {
-            "apple watch", "apple tv", "apple music", "apple pay",
-            "google maps", "google drive", "google cloud", "google home",
-            "amazon echo", "amazon alexa", "mac mini", "mac pro",
-            "microsoft teams", "visual studio", "open ai", "chat gpt",
-            "omi pendant", "omi device",
-        }
-
         # Capitalized multi-word phrases (potential names/orgs) — lower confidence
-        for m in re.finditer(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b', text):
+        for m in _CAPITALIZED_PHRASE_RE.finditer(text):
             name = m.group(1)
             # Skip if already captured
             if not any(e.name == name for e in entities):
@@ -246,12 +256,17 @@ JSON array:"""
     def _exact_match(self, name: str) -> Optional[dict]:
         """Exact match against speakers and contacts."""
         # Speakers
-        speakers = self.db.get_speakers()
+        speakers = self._directory[0] if self._directory else self.db.get_speakers()
         for s in speakers:
             if s.get("name") and s["name"].lower() == name.lower():
                 return {"id": s["id"], "name": s["name"]}
 
         # Contacts
+        if self._directory:
+            for c in self._directory[1]:
+                if c["name"].lower() == name.lower():
+                    return {"id": c["id"], "name": c["name"]}
+            return None
         try:
             with self.db._lock:
                 row = self.db._conn.execute(
@@ -270,7 +285,8 @@ JSON array:"""
         best_score = 0
 
         # Check speakers
-        for s in self.db.get_speakers():
+        speakers = self._directory[0] if self._directory else self.db.get_speakers()
+        for s in speakers:
             sname = s.get("name") or ""
             score = SequenceMatcher(None, name.lower(), sname.lower()).ratio()
             if score > best_score and score >= threshold:
@@ -279,8 +295,11 @@ JSON array:"""
 
         # Check contacts
         try:
-            with self.db._lock:
-                rows = self.db._conn.execute("SELECT id, name FROM contacts").fetchall()
+            if self._directory:
+                rows = self._directory[1]
+            else:
+                with self.db._lock:
+                    rows = self.db._conn.execute("SELECT id, name FROM contacts").fetchall()
             for r in rows:
                 score = SequenceMatcher(None, name.lower(), r["name"].lower()).ratio()
                 if score > best_score and score >= threshold:
@@ -362,6 +381,23 @@ JSON array:"""
 
         return all_entities
 
+    def extract_from_utterances_batched(self, batch: list[tuple[str, list[dict]]]
+                                        ) -> list[tuple[str, list[ExtractedEntity]]]:
+        """Extract entities for many conversations at once.
+
+        Takes (conversation_id, utterances) pairs and returns (conversation_id, entities)
+        pairs. Speakers and contacts are loaded once for the whole batch instead of on
+        every resolved entity — the dominant cost when backfilling thousands of files.
+        """
+        if self.db:
+            with self.db._lock:
+                contacts = [dict(r) for r in self.db._conn.execute("SELECT id, name FROM contacts")]
+            self._directory = (self.db.get_speakers(), contacts)
+        try:
+            return [(cid, self.extract_from_utterances(utts, cid)) for cid, utts in batch]
+        finally:
+            self._directory = None
+
     async def extract_from_utterances_async(self, utterances: list[dict],
                                              conversation_id: str = None) -> list[ExtractedEntity]:
         """Extract entities with both fast and LLM passes."""
@@ -403,6 +439,7 @@ JSON array:"""
         projects = [e for e in entities if e.type == "project"]
 
         evidence = f"conversation:{conversation_id}" if conversation_id else None
+        edges = []
 
         # Person-person: mentioned_with
         for i, p1 in enumerate(persons):
@@ -410,18 +447,20 @@ JSON array:"""
                 name1 = p1.resolved_name or p1.name
                 name2 = p2.resolved_name or p2.name
                 if name1 != name2:
-                    self.db.save_relationship(name1, name2, "mentioned_with", evidence)
+                    edges.append((name1, name2, "mentioned_with"))
 
         # Person-org: works_on or client_of
         for p in persons:
             for o in orgs:
                 pname = p.resolved_name or p.name
                 oname = o.resolved_name or o.name
-                self.db.save_relationship(pname, oname, "works_on", evidence)
+                edges.append((pname, oname, "works_on"))
 
         # Person-project: works_on
         for p in persons:
             for proj in projects:
                 pname = p.resolved_name or p.name
                 projname = proj.resolved_name or proj.name
-                self.db.save_relationship(pname, projname, "works_on", evidence)
+                edges.append((pname, projname, "works_on"))
+
+        self.db.save_relationships_batch(edges, evidence)
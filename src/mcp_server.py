@@ -44,6 +44,18 @@ def _get_db() -> PerceptDB:
     return PerceptDB()
 
 
+_briefing_engine = None
+
+
+def _get_briefing_engine():
+    """Get the shared BriefingEngine, so its conversation search cache outlives a call."""
+    global _briefing_engine
+    if _briefing_engine is None:
+        from src.briefing_engine import BriefingEngine
+        _briefing_engine = BriefingEngine()
+    return _briefing_engine
+
+
 # ── Tools ──────────────────────────────────────────────────────────────
 
 
@@ -353,9 +365,7 @@ def get_briefing(person: str = None, minutes_ahead: int = 60) -> str:
         minutes_ahead: Look for meetings within N minutes (default 60)
     """
     try:
-        from src.briefing_engine import BriefingEngine
-        
-        engine = BriefingEngine()
+        engine = _get_briefing_engine()
         
         if person:
             # Generate briefing for specific person
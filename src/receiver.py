@@ -57,8 +57,11 @@ def _get_audio_transcriber() -> AudioTranscriber:
     """Get or create the singleton AudioTranscriber instance."""
     global _audio_transcriber
     if _audio_transcriber is None:
+        whisper_cfg = CONFIG.get("whisper", {})
         _audio_transcriber = AudioTranscriber(
-            model_size=CONFIG.get("whisper", {}).get("model_size", "base"),
+            model_size=whisper_cfg.get("model_size", "base"),
+            cpu_threads=whisper_cfg.get("cpu_threads"),
+            num_workers=whisper_cfg.get("num_workers", 1),
         )
     return _audio_transcriber
 
@@ -87,26 +90,8 @@ _context_engine = ContextEngine(db=_db)
 # --- Direct iMessage helper (bypasses OpenClaw session) ---
 async def _send_imessage(text: str):
     """Send iMessage directly via imsg CLI — doesn't pollute the main session."""
-    try:
-        imsg_path = _get_binary_path("imsg")
-        if not imsg_path:
-            print(f"[IMSG] imsg binary not found, skipping message", flush=True)
-            return
-            
-        env = os.environ.copy()  # Inherit system PATH
-        _imsg_target = _db.get_setting("dispatch_target", "+14153414104")
-        proc = await asyncio.create_subprocess_exec(
-            imsg_path, "send", "--to", _imsg_target, "--text", text,
-            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
-            env=env,
-        )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=15)
-        if proc.returncode == 0:
-            print(f"[IMSG] Sent directly", flush=True)
-        else:
-            print(f"[IMSG] Error: {stderr.decode()[:200]}", flush=True)
-    except Exception as e:
-        print(f"[IMSG] Failed: {e}", flush=True)
+    _imsg_target = _db.get_setting("dispatch_target", "+14153414104")
+    await send_imessage(text, to=_imsg_target)
 
 
 async def _send_reminder(openclaw_path: str, channel: str, target: str, task: str, env: dict):
@@ -774,8 +759,7 @@ async def _summarize_conversation(session_key: str):
         utterance_dicts = [{"text": s.get("text", ""), "speaker_id": s.get("speaker", "SPEAKER_00")} for s in segments]
         entities = _entity_extractor.extract_from_utterances(utterance_dicts, conv_id_ee)
         # Save entity mentions
-        for e in entities:
-            _db.save_entity_mention(conv_id_ee, e.type, e.resolved_name or e.name)
+        _db.save_entity_mentions_batch(conv_id_ee, [(e.type, e.resolved_name or e.name) for e in entities])
         # Build relationships from co-occurring entities
         _entity_extractor.build_relationships(entities, conv_id_ee)
         if entities:
@@ -1083,12 +1067,10 @@ Question: {text}"""
         print(f"[AMBIENT] Failed: {e}", flush=True)
 
 
-async def _on_audio_complete(session_id: str, pcm_bytes: bytes):
+async def _on_audio_complete(session_id: str, pcm_bytes: memoryview):
     """Called when audio buffer flushes (3s silence). Transcribe and feed into pipeline."""
     try:
-        at = _get_audio_transcriber()
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, at.transcribe, pcm_bytes)
+        result = await _get_audio_transcriber().transcribe_async(pcm_bytes)
 
         if not result.text:
             print(f"[AUDIO] Session {session_id}: silence/empty — skipping", flush=True)
@@ -0,0 +1,79 @@
+"""Long-lived helper process that runs CLI commands for action_dispatcher.
+
+The receiver holds whisper/embedding models in memory, so forking it for
+every openclaw/imsg call is expensive. This worker only imports the stdlib,
+so spawning from it stays cheap.
+
+Protocol (newline-delimited JSON), after an initial {"ready": true} line:
+    stdin:  {"id": int, "argv": [str, ...], "timeout": float | null, "limit": int | null}
+    stdout: {"id": int, "returncode": int | null, "stdout": str, "stderr": str}
+returncode is null when the command timed out. stdout/stderr are cut to the
+first `limit` bytes; the rest of the output is read and discarded.
+"""
+
+import json
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_CONCURRENT = 8
+_READ_SIZE = 65536
+
+_write_lock = threading.Lock()
+
+
+def _drain(stream, limit: int | None, out: list):
+    """Read stream to EOF, keeping at most limit bytes, so the child never blocks on a full pipe."""
+    kept = bytearray()
+    while chunk := stream.read(_READ_SIZE):
+        if limit is None or len(kept) < limit:
+            kept += chunk if limit is None else chunk[:limit - len(kept)]
+    stream.close()
+    out.append(bytes(kept))
+
+
+def _run(request: dict):
+    """Run one command and write its reply line."""
+    reply = {"id": request["id"], "returncode": -1, "stdout": "", "stderr": ""}
+    try:
+        # stdin is our request pipe; a child reading it would swallow later requests
+        proc = subprocess.Popen(request["argv"], stdin=subprocess.DEVNULL,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        limit = request.get("limit")
+        stdout, stderr = [], []
+        readers = [threading.Thread(target=_drain, args=(proc.stdout, limit, stdout), daemon=True),
+                   threading.Thread(target=_drain, args=(proc.stderr, limit, stderr), daemon=True)]
+        for reader in readers:
+            reader.start()
+        try:
+            proc.wait(timeout=request.get("timeout"))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            reply.update(returncode=None, stderr="timeout")
+        else:
+            for reader in readers:
+                reader.join()
+            reply.update(returncode=proc.returncode,
+                         stdout=stdout[0].decode(errors="replace"),
+                         stderr=stderr[0].decode(errors="replace"))
+    except Exception as e:
+        reply["stderr"] = str(e)
+    with _write_lock:
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+
+
+def main():
+    """Serve requests until stdin closes."""
+    sys.stdout.write('{"ready": true}\n')
+    sys.stdout.flush()
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT) as pool:
+        for line in sys.stdin:
+            if line.strip():
+                pool.submit(_run, json.loads(line))
+
+
+if __name__ == "__main__":
+    main()
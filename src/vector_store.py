@@ -1,5 +1,6 @@
 """Semantic vector store for Percept conversations using NVIDIA NIM + LanceDB."""
 
+import asyncio
 import json
 import logging
 import time
@@ -15,6 +16,8 @@ NVIDIA_CREDS_PATH = Path.home() / ".config" / "nvidia" / "credentials.json"
 DEFAULT_MODEL = "nvidia/nv-embedqa-e5-v5"
 NVIDIA_ENDPOINT = "https://integrate.api.nvidia.com/v1/embeddings"
 LOCAL_MODEL = "all-MiniLM-L6-v2"
+INDEX_CONCURRENCY = 16  # concurrent embedding requests during bulk indexing
+INDEX_BATCH_SIZE = 32   # texts per embedding request during bulk indexing
 
 
 def _load_nvidia_key(path: Path = NVIDIA_CREDS_PATH) -> Optional[str]:
@@ -191,6 +194,25 @@ class PerceptVectorStore:
             logger.warning(f"NVIDIA batch embedding failed: {e}")
             return None
 
+    async def _get_nvidia_embeddings_batch_async(self, client, texts: List[str],
+                                                 input_type: str = "passage") -> Optional[List[List[float]]]:
+        """Async variant of _get_nvidia_embeddings_batch using a shared httpx.AsyncClient."""
+        if not self._api_key or not texts:
+            return None
+        try:
+            resp = await client.post(NVIDIA_ENDPOINT, json={
+                "input": [t[:8000] for t in texts],
+                "model": self._model,
+                "input_type": input_type,
+                "encoding_format": "float",
+            }, headers={"Authorization": f"Bearer {self._api_key}"})
+            resp.raise_for_status()
+            result = resp.json()
+            return [d["embedding"] for d in sorted(result["data"], key=lambda x: x["index"])]
+        except Exception as e:
+            logger.warning(f"NVIDIA batch embedding failed: {e}")
+            return None
+
     # ── Chunking ────────────────────────────────────────────────────
 
     def _chunk_text(self, text: str) -> list[str]:
@@ -243,13 +265,7 @@ class PerceptVectorStore:
             logger.debug(f"Already indexed: {conversation_id}")
             return 0
 
-        # Build chunks: transcript chunks + summary (high-signal)
-        chunks = self._chunk_text(transcript or "")
-        chunk_types = ["transcript"] * len(chunks)
-        if summary:
-            chunks.append(summary)
-            chunk_types.append("summary")
-
+        chunks, chunk_types = self._conversation_chunks(transcript, summary)
         if not chunks:
             return 0
 
@@ -270,30 +286,46 @@ class PerceptVectorStore:
             logger.warning(f"Embedding count mismatch for {conversation_id}")
             return 0
 
-        speakers_str = json.dumps(speakers) if speakers else "[]"
-        topics_str = json.dumps(topics) if topics else "[]"
+        records = self._build_records(conversation_id, chunks, chunk_types, all_vecs,
+                                      speakers=speakers, date=date, topics=topics)
+        self._add_records(records)
+        return len(records)
 
-        records = []
-        for idx, (chunk, vec, ctype) in enumerate(zip(chunks, all_vecs, chunk_types)):
-            records.append({
-                "conversation_id": conversation_id,
-                "chunk_index": idx,
-                "chunk_type": ctype,
-                "text": chunk,
-                "date": date or "",
-                "speakers": speakers_str,
-                "topics": topics_str,
-                "vector": vec,
-            })
+    def _conversation_chunks(self, transcript: str, summary: str = None) -> tuple[list[str], list[str]]:
+        """Build chunks for a conversation: transcript chunks + summary (high-signal)."""
+        chunks = self._chunk_text(transcript or "")
+        chunk_types = ["transcript"] * len(chunks)
+        if summary:
+            chunks.append(summary)
+            chunk_types.append("summary")
+        return chunks, chunk_types
 
+    @staticmethod
+    def _build_records(conversation_id: str, chunks: list[str], chunk_types: list[str],
+                       vecs: list, speakers: list = None, date: str = None,
+                       topics: list = None) -> list[dict]:
+        """Build LanceDB rows for one conversation's embedded chunks."""
+        speakers_str = json.dumps(speakers) if speakers else "[]"
+        topics_str = json.dumps(topics) if topics else "[]"
+        return [{
+            "conversation_id": conversation_id,
+            "chunk_index": idx,
+            "chunk_type": ctype,
+            "text": chunk,
+            "date": date or "",
+            "speakers": speakers_str,
+            "topics": topics_str,
+            "vector": vec,
+        } for idx, (chunk, vec, ctype) in enumerate(zip(chunks, vecs, chunk_types))]
+
+    def _add_records(self, records: list[dict]):
+        """Append rows to the vectors table, creating it on first write."""
         tbl = self._get_table()
         if tbl is None:
             self._db.create_table(self._table_name, records)
         else:
             tbl.add(records)
 
-        return len(records)
-
     # ── Search ──────────────────────────────────────────────────────
 
     def search(self, query: str, limit: int = 10, date_filter: str = None) -> List[Dict[str, Any]]:
@@ -349,7 +381,7 @@ class PerceptVectorStore:
         try:
             from .database import PerceptDB
             db = PerceptDB()
-            fts_results = db.search_utterances(query, limit=limit * 2)
+            fts_results = db.search_utterances(query, limit=limit * 2, date_filter=date_filter)
             db.close()
             
             for i, result in enumerate(fts_results):
@@ -468,6 +500,19 @@ class PerceptVectorStore:
 
     def index_all(self, db=None) -> dict:
         """Bulk index all conversations from SQLite."""
+        return asyncio.run(self.index_all_async(db))
+
+    async def index_all_async(self, db=None, concurrency: int = INDEX_CONCURRENCY,
+                              batch_size: int = INDEX_BATCH_SIZE) -> dict:
+        """Bulk index all conversations from SQLite with concurrent embedding requests.
+
+        Chunks from all pending conversations are packed into batches of
+        ``batch_size`` texts and embedded with at most ``concurrency`` requests
+        in flight. A conversation counts as failed if any of its batches fails.
+        A conversation's rows are written to LanceDB as soon as its last batch
+        is embedded (one add per batch), so an interrupted run keeps the
+        conversations it finished and only in-flight vectors are held in memory.
+        """
         if db is None:
             from src.database import PerceptDB
             db = PerceptDB()
@@ -475,38 +520,83 @@ class PerceptVectorStore:
         already = self._indexed_conversation_ids()
         convos = db.get_conversations(limit=10000)
         total = len(convos)
-        indexed = 0
         skipped = 0
-        failed = 0
-
-        for i, c in enumerate(convos):
-            cid = c["id"]
-            if cid in already:
-                skipped += 1
-                continue
 
+        pending = []  # (conversation, chunks, chunk_types)
+        texts = []
+        owners = []   # index into pending for each text
+        for c in convos:
             transcript = c.get("transcript") or ""
-            if not transcript.strip():
+            if c["id"] in already or not transcript.strip():
                 skipped += 1
                 continue
-
-            n = self.index_conversation(
-                conversation_id=cid,
-                transcript=transcript,
-                summary=c.get("summary"),
-                speakers=c.get("speakers"),
-                date=c.get("date"),
-                topics=c.get("topics"),
-            )
-            if n > 0:
-                indexed += 1
+            chunks, chunk_types = self._conversation_chunks(transcript, c.get("summary"))
+            owners.extend([len(pending)] * len(chunks))
+            texts.extend(chunks)
+            pending.append((c, chunks, chunk_types))
+
+        vecs = [None] * len(texts)
+        n_batches = (len(texts) + batch_size - 1) // batch_size
+        # Local model is CPU-bound; embed its batches one at a time
+        sem = asyncio.Semaphore(concurrency if self._use_nvidia else 1)
+        done = 0
+        remaining = [len(chunks) for _, chunks, _ in pending]  # chunks not yet embedded
+        offsets = [0]  # index of each pending conversation's first text
+        for _, chunks, _ in pending:
+            offsets.append(offsets[-1] + len(chunks))
+        failed_convs = set()
+
+        def flush(finished: list[int]):
+            """Write the rows of conversations whose last batch just landed, then drop their vectors."""
+            records = []
+            for n in finished:
+                c, chunks, chunk_types = pending[n]
+                start, end = offsets[n], offsets[n + 1]
+                if n not in failed_convs:
+                    records.extend(self._build_records(c["id"], chunks, chunk_types, vecs[start:end],
+                                                       speakers=c.get("speakers"), date=c.get("date"),
+                                                       topics=c.get("topics")))
+                vecs[start:end] = [None] * (end - start)
+            if records:
+                self._add_records(records)
+
+        async def embed(start: int, client=None):
+            nonlocal done
+            batch = texts[start:start + batch_size]
+            async with sem:
+                if client is not None:
+                    out = await self._get_nvidia_embeddings_batch_async(client, batch)
+                else:
+                    out = await asyncio.to_thread(self._get_embeddings_batch, batch)
+            ok = out is not None and len(out) == len(batch)
+            if ok:
+                vecs[start:start + len(batch)] = out
             else:
-                failed += 1
-
-            if (i + 1) % 10 == 0:
-                print(f"  Indexed {indexed}/{total} conversations... (skipped {skipped}, failed {failed})")
+                logger.warning(f"Embedding failed for batch at chunk {start}")
+            finished = []
+            for i in range(start, start + len(batch)):
+                n = owners[i]
+                if not ok:
+                    failed_convs.add(n)
+                remaining[n] -= 1
+                if remaining[n] == 0:
+                    finished.append(n)
+            flush(finished)
+            done += 1
+            if done % 10 == 0:
+                print(f"  Embedded {done}/{n_batches} batches...")
+
+        starts = range(0, len(texts), batch_size)
+        if self._use_nvidia:
+            import httpx
+            async with httpx.AsyncClient(timeout=60,
+                                         limits=httpx.Limits(max_connections=concurrency)) as client:
+                await asyncio.gather(*(embed(i, client) for i in starts))
+        else:
+            await asyncio.gather(*(embed(i) for i in starts))
 
-        return {"total": total, "indexed": indexed, "skipped": skipped, "failed": failed}
+        failed = len(failed_convs)
+        return {"total": total, "indexed": len(pending) - failed, "skipped": skipped, "failed": failed}
 
     # ── Stats ───────────────────────────────────────────────────────
 
@@ -0,0 +1,143 @@
+"""Tests for action dispatcher helpers."""
+import asyncio
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src import action_dispatcher
+
+
+class TestSendImessage:
+    @pytest.mark.asyncio
+    async def test_returns_without_waiting_for_process(self):
+        with patch.object(action_dispatcher, "_get_binary_path", return_value="/bin/sleep"):
+            start = time.monotonic()
+            # /bin/sleep rejects the imsg arguments, but only after being spawned
+            await action_dispatcher.send_imessage("hello")
+            assert time.monotonic() - start < 1
+            assert len(action_dispatcher._imsg_tasks) == 1
+            await asyncio.gather(*action_dispatcher._imsg_tasks)
+        await asyncio.sleep(0)
+        assert not action_dispatcher._imsg_tasks
+
+    @pytest.mark.asyncio
+    async def test_missing_binary_is_skipped(self):
+        with patch.object(action_dispatcher, "_get_binary_path", return_value=None):
+            await action_dispatcher.send_imessage("hello")
+        assert not action_dispatcher._imsg_tasks
+
+
+class TestSpawnWorker:
+    @pytest.mark.asyncio
+    async def test_concurrent_commands_share_worker(self):
+        results = await asyncio.gather(*(action_dispatcher._run_cli(["echo", str(i)], timeout=5)
+                                         for i in range(5)))
+        assert [r[:2] for r in results] == [(0, f"{i}\n") for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        returncode, _, stderr = await action_dispatcher._run_cli(["sleep", "5"], timeout=0.2)
+        assert returncode is None
+        assert stderr == "timeout"
+
+    @pytest.mark.asyncio
+    async def test_command_does_not_read_worker_stdin(self):
+        returncode, stdout, _ = await action_dispatcher._run_cli(["cat"], timeout=3)
+        assert (returncode, stdout) == (0, "")
+        assert (await action_dispatcher._run_cli(["echo", "after"], timeout=5))[:2] == (0, "after\n")
+
+    @pytest.mark.asyncio
+    async def test_output_is_capped(self):
+        argv = [sys.executable, "-c", "import sys; sys.stdout.write('x' * 1_000_000)"]
+        returncode, stdout, _ = await action_dispatcher._run_cli(argv, timeout=10)
+        assert returncode == 0
+        assert stdout == "x" * action_dispatcher.CLI_OUTPUT_LIMIT
+
+    @pytest.mark.asyncio
+    async def test_direct_fallback_output_is_capped(self):
+        argv = [sys.executable, "-c", "import sys; sys.stdout.write('y' * 1_000_000)"]
+        with patch.object(action_dispatcher._spawn_worker, "run", side_effect=ConnectionError("down")):
+            returncode, stdout, _ = await action_dispatcher._run_cli(argv, timeout=10)
+        assert returncode == 0
+        assert stdout == "y" * action_dispatcher.CLI_OUTPUT_LIMIT
+
+    @pytest.mark.asyncio
+    async def test_direct_fallback_timeout_reaps_child(self, monkeypatch):
+        spawned = []
+        real_exec = asyncio.create_subprocess_exec
+
+        async def recording_exec(*args, **kwargs):
+            proc = await real_exec(*args, **kwargs)
+            spawned.append(proc)
+            return proc
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", recording_exec)
+        with patch.object(action_dispatcher._spawn_worker, "run", side_effect=ConnectionError("down")):
+            assert await action_dispatcher._run_cli(["sleep", "5"], timeout=0.2) == (None, "", "timeout")
+        assert spawned[0].returncode is not None
+
+
+class TestSpawnWorkerFailures:
+    @pytest.mark.asyncio
+    async def test_slow_start_is_killed_and_not_reused(self, tmp_path, monkeypatch):
+        script = tmp_path / "slow_worker.py"
+        script.write_text("import time, sys\ntime.sleep(1.5)\nprint('{\"ready\": true}', flush=True)\n"
+                          "sys.stdin.read()\n")
+        monkeypatch.setattr(action_dispatcher, "_SPAWN_WORKER_SCRIPT", script)
+        monkeypatch.setattr(action_dispatcher, "SPAWN_WORKER_READY_TIMEOUT", 0.3)
+        worker = action_dispatcher._SpawnWorker()
+        monkeypatch.setattr(action_dispatcher, "_spawn_worker", worker)
+
+        for _ in range(2):
+            result = await asyncio.wait_for(action_dispatcher._run_cli(["echo", "hi"], 5), timeout=5)
+            assert result[:2] == (0, "hi\n")
+            assert worker._proc is None
+
+    @pytest.mark.asyncio
+    async def test_failed_ready_check_kills_worker(self, tmp_path, monkeypatch):
+        script = tmp_path / "bad_worker.py"
+        script.write_text("import sys\nprint('hello', flush=True)\nsys.stdin.read()\n")
+        monkeypatch.setattr(action_dispatcher, "_SPAWN_WORKER_SCRIPT", script)
+        worker = action_dispatcher._SpawnWorker()
+        spawned = []
+        real_exec = asyncio.create_subprocess_exec
+
+        async def recording_exec(*args, **kwargs):
+            proc = await real_exec(*args, **kwargs)
+            spawned.append(proc)
+            return proc
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", recording_exec)
+        with pytest.raises(ConnectionError):
+            await worker.run(["echo", "hi"], 5)
+        assert worker._proc is None
+        assert spawned[0].returncode is not None
+
+    @pytest.mark.asyncio
+    async def test_reply_wait_is_bounded(self, tmp_path, monkeypatch):
+        script = tmp_path / "mute_worker.py"
+        script.write_text("import sys\nprint('{\"ready\": true}', flush=True)\nsys.stdin.read()\n")
+        monkeypatch.setattr(action_dispatcher, "_SPAWN_WORKER_SCRIPT", script)
+        monkeypatch.setattr(action_dispatcher, "SPAWN_WORKER_REPLY_MARGIN", 0.2)
+        worker = action_dispatcher._SpawnWorker()
+
+        start = time.monotonic()
+        assert await worker.run(["echo", "hi"], 0.2) == (None, "", "timeout")
+        assert time.monotonic() - start < 2
+        assert worker._pending == {}
+        worker._proc.kill()
+        await worker._proc.wait()
+
+
+class TestExtractCommandAfterWake:
+    @pytest.mark.parametrize("text,expected", [
+        ("Hey Jarvis, email Sarah about the demo.", "email Sarah about the demo"),
+        ("jarvis remind me to call mom\n", "remind me to call mom"),
+        ("so anyway hey, jarvis. what's next?", "what's next"),
+        ("no wake word here!", "no wake word here"),
+        ("hey hey, Jarvis, lights off", "lights off"),
+    ])
+    def test_extract(self, text, expected):
+        assert action_dispatcher.extract_command_after_wake(text) == expected
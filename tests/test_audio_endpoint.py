@@ -6,9 +6,10 @@ import struct
 import time
 import pytest
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, AsyncMock, MagicMock
 
-from src.audio_transcriber import pcm16_to_float32, TranscriptionResult
+from src.audio_transcriber import pcm16_to_float32, AudioTranscriber, TranscriptionResult
 from src.audio_buffer import AudioBufferManager, SILENCE_TIMEOUT, MAX_BUFFER_DURATION, BYTES_PER_SECOND
 
 
@@ -48,6 +49,41 @@ class TestPCM16ToFloat32:
         assert result.dtype == np.float32
 
 
+class TestTranscribeSilence:
+    @pytest.fixture
+    def transcriber(self):
+        t = AudioTranscriber.__new__(AudioTranscriber)
+        t._model = MagicMock()
+        t._executor = ThreadPoolExecutor(max_workers=1)
+        t._model.transcribe.return_value = ([MagicMock(text=" hi ")], MagicMock(language="en", language_probability=0.0))
+        return t
+
+    def test_silence_skips_model(self, transcriber):
+        pcm = struct.pack("<8000h", *([100, -100] * 4000))  # RMS ~0.003
+        result = transcriber.transcribe(pcm)
+        assert result.text == ""
+        transcriber._model.transcribe.assert_not_called()
+
+    def test_quiet_speech_after_silence_is_not_silent(self, transcriber):
+        # RMS of the whole buffer is just above the threshold even though most blocks are silent
+        pcm = b"\x00\x00" * 30000 + struct.pack("<2000h", *([1000, -1000] * 1000))
+        assert transcriber.transcribe(pcm).text == "hi"
+
+    def test_speech_reaches_model_as_float32(self, transcriber):
+        pcm = struct.pack("<8000h", *([3000, -3000] * 4000))
+        assert transcriber.transcribe(memoryview(pcm)).text == "hi"
+        audio = transcriber._model.transcribe.call_args[0][0]
+        assert audio.dtype == np.float32 and len(audio) == 8000
+        assert transcriber._model.transcribe.call_args.kwargs["beam_size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_transcribe_async_serializes_on_worker(self, transcriber):
+        pcm = struct.pack("<8000h", *([3000, -3000] * 4000))
+        results = await asyncio.gather(*(transcriber.transcribe_async(pcm) for _ in range(3)))
+        assert [r.text for r in results] == ["hi"] * 3
+        assert transcriber._model.transcribe.call_count == 3
+
+
 # --- Audio buffer tests ---
 
 class TestAudioBufferManager:
@@ -112,6 +148,58 @@ class TestAudioBufferManager:
         # Should have flushed due to max buffer
         assert callback.await_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_duplicate_sequence_replaces_chunk(self, manager, callback):
+        await manager.add_chunk("sess5", 0, b"\x00" * 100)
+        await manager.add_chunk("sess5", 0, b"\x01" * 40)
+        await manager.add_chunk("sess5", 1, b"\x02" * 60)
+        assert manager.get_session_info("sess5")["total_bytes"] == 100
+        await manager._flush("sess5")
+        assert callback.call_args[0][1] == b"\x01" * 40 + b"\x02" * 60
+
+    @pytest.mark.asyncio
+    async def test_callback_gets_writable_view(self, manager, callback):
+        await manager.add_chunk("sess8", 0, b"\x01\x00" * 10)
+        await manager.add_chunk("sess8", 1, b"\x02\x00" * 10)
+        await manager._flush("sess8")
+        pcm = callback.call_args[0][1]
+        assert isinstance(pcm, memoryview) and not pcm.readonly
+        assert np.frombuffer(pcm, dtype=np.int16).flags.writeable
+
+    @pytest.mark.asyncio
+    async def test_single_chunk_passed_through_without_copy(self, manager, callback):
+        chunk = b"\x01\x00" * 10
+        await manager.add_chunk("sess9", 0, chunk)
+        await manager._flush("sess9")
+        assert callback.call_args[0][1].obj is chunk
+
+    @pytest.mark.asyncio
+    async def test_late_and_duplicate_chunks_keep_order(self, manager, callback):
+        for seq in (0, 3, 1, 3, 2):
+            await manager.add_chunk("sess6", seq, bytes([seq]) * 10)
+        assert manager.get_session_info("sess6")["chunks"] == 4
+        await manager._flush("sess6")
+        assert callback.call_args[0][1] == b"".join(bytes([i]) * 10 for i in range(4))
+
+    @pytest.mark.asyncio
+    async def test_chunks_during_slow_flush_start_new_session(self):
+        flushed = []
+        release = asyncio.Event()
+
+        async def slow_callback(session_id, pcm):
+            flushed.append(bytes(pcm))
+            await release.wait()
+
+        manager = AudioBufferManager(on_complete=slow_callback)
+        await manager.add_chunk("sess7", 0, b"\x01" * 10)
+        flush = asyncio.create_task(manager._flush("sess7"))
+        await asyncio.sleep(0)
+        await manager.add_chunk("sess7", 1, b"\x02" * 10)  # arrives while the callback is running
+        release.set()
+        await flush
+        await manager._flush("sess7")
+        assert flushed == [b"\x01" * 10, b"\x02" * 10]
+
 
 # --- Endpoint integration tests ---
 
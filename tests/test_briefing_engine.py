@@ -1,6 +1,8 @@
 """Tests for the Percept briefing engine."""
 
 import json
+import subprocess
+import time
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
@@ -11,6 +13,20 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
+@pytest.fixture(autouse=True)
+def no_ijson():
+    """Route gog calls through _run_gog (which the tests mock via Popen) unless a test opts in."""
+    with patch("src.briefing_engine.ijson", None):
+        yield
+
+
+def _gog_process(stdout: str, returncode: int = 0) -> Mock:
+    """Stand-in for the Popen object of a finished gog call."""
+    proc = Mock(returncode=returncode)
+    proc.communicate.return_value = (stdout, "")
+    return proc
+
+
 @pytest.fixture
 def mock_db():
     """Mock database for testing."""
@@ -117,15 +133,13 @@ def test_briefing_for_person_no_data():
     assert briefing["conversation_count"] == 0
 
 
-@patch('subprocess.run')
+@patch('subprocess.Popen')
 def test_get_upcoming_meetings_success(mock_subprocess):
     """Test successful calendar integration."""
     from src.briefing_engine import BriefingEngine
     
     # Mock successful gog calendar response
-    mock_subprocess.return_value = Mock(
-        returncode=0,
-        stdout=json.dumps([
+    mock_subprocess.return_value = _gog_process(json.dumps([
             {
                 "id": "meeting1",
                 "summary": "VectorCare Standup",
@@ -148,7 +162,7 @@ def test_get_upcoming_meetings_success(mock_subprocess):
     assert meetings[0]["attendees"][0]["name"] == "Rob Martinez"
 
 
-@patch('subprocess.run')
+@patch('subprocess.Popen')
 def test_get_upcoming_meetings_no_gog(mock_subprocess):
     """Test graceful degradation when gog CLI not available."""
     from src.briefing_engine import BriefingEngine
@@ -162,16 +176,13 @@ def test_get_upcoming_meetings_no_gog(mock_subprocess):
     assert meetings == []
 
 
-@patch('subprocess.run')
+@patch('subprocess.Popen')
 def test_generate_briefing_no_meetings(mock_subprocess):
     """Test briefing generation when no upcoming meetings."""
     from src.briefing_engine import BriefingEngine
     
     # Mock empty calendar response
-    mock_subprocess.return_value = Mock(
-        returncode=0,
-        stdout="[]"
-    )
+    mock_subprocess.return_value = _gog_process("[]")
     
     engine = BriefingEngine()
     briefing = engine.generate_briefing()
@@ -180,15 +191,13 @@ def test_generate_briefing_no_meetings(mock_subprocess):
     assert briefing["meetings"] == []
 
 
-@patch('subprocess.run')
+@patch('subprocess.Popen')
 def test_generate_briefing_with_meetings(mock_subprocess, mock_db, mock_vector_store):
     """Test full briefing generation with meetings."""
     from src.briefing_engine import BriefingEngine
     
     # Mock calendar response
-    mock_subprocess.return_value = Mock(
-        returncode=0,
-        stdout=json.dumps([
+    mock_subprocess.return_value = _gog_process(json.dumps([
             {
                 "id": "meeting1",
                 "summary": "Team Meeting",
@@ -209,6 +218,224 @@ def test_generate_briefing_with_meetings(mock_subprocess, mock_db, mock_vector_s
     assert briefing["meetings"][0]["attendees"][0]["name"] == "Rob Martinez"
 
 
+@patch('subprocess.Popen')
+def test_generate_briefing_keeps_attendee_order(mock_subprocess, mock_db, mock_vector_store):
+    """Test that parallel briefings land on the right meeting and attendee."""
+    from src.briefing_engine import BriefingEngine
+
+    mock_subprocess.return_value = _gog_process(json.dumps([
+            {
+                "id": f"meeting{m}",
+                "summary": f"Meeting {m}",
+                "attendees": [
+                    {"email": f"p{m}{i}@company.com", "displayName": f"Person {m}{i}"}
+                    for i in range(4)
+                ]
+            }
+            for m in range(3)
+        ])
+    )
+
+    engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    briefing = engine.generate_briefing()
+
+    for m, meeting in enumerate(briefing["meetings"]):
+        assert [(a["name"], a["email"]) for a in meeting["attendees"]] == [
+            (f"Person {m}{i}", f"p{m}{i}@company.com") for i in range(4)
+        ]
+
+
+@patch('subprocess.Popen')
+def test_generate_briefing_briefs_shared_attendee_once(mock_subprocess, mock_db, mock_vector_store):
+    """Test that an attendee in several meetings is briefed once and attached to each."""
+    from src.briefing_engine import BriefingEngine
+
+    mock_subprocess.return_value = _gog_process(json.dumps([
+        {"id": "m1", "summary": "Standup",
+         "attendees": [{"email": "rob@company.com", "displayName": "Rob Martinez"}]},
+        {"id": "m2", "summary": "Review",
+         "attendees": [{"email": "rob@company.com", "displayName": "rob martinez"},
+                       {"email": "sam@company.com", "displayName": "Sam Lee"}]},
+    ]))
+
+    engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    with patch.object(engine, "briefing_for_person", wraps=engine.briefing_for_person) as brief:
+        briefing = engine.generate_briefing()
+
+    assert sorted(c.args[0] for c in brief.call_args_list) == ["Rob Martinez", "Sam Lee"]
+    first, second = briefing["meetings"]
+    assert [a["name"] for a in first["attendees"]] == ["Rob Martinez"]
+    assert [a["name"] for a in second["attendees"]] == ["rob martinez", "Sam Lee"]
+    assert first["attendees"][0] is not second["attendees"][0]
+    assert first["attendees"][0]["conversation_count"] == second["attendees"][0]["conversation_count"]
+
+
+def test_conversation_search_cached_per_engine(mock_db, mock_vector_store):
+    """Test that repeat attendees reuse the hybrid search result of the same engine."""
+    from src.briefing_engine import BriefingEngine
+
+    first = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    second = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    assert first._find_conversations_with_person("Rob Martinez")
+    assert first._find_conversations_with_person(" rob martinez ") == \
+        first._find_conversations_with_person("Rob Martinez")
+    assert mock_vector_store.hybrid_search.call_count == 1
+    second._find_conversations_with_person("Rob Martinez")
+    assert mock_vector_store.hybrid_search.call_count == 2
+
+
+def test_conversation_cache_evicts_least_recently_used(mock_db, mock_vector_store):
+    """Test that a cache hit keeps an attendee from being the next eviction."""
+    from src.briefing_engine import BriefingEngine
+
+    engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    with patch("src.briefing_engine._CONVERSATION_CACHE_MAX", 2):
+        engine._find_conversations_with_person("Rob Martinez")
+        engine._find_conversations_with_person("Sam Lee")
+        engine._find_conversations_with_person("Rob Martinez")  # hit
+        engine._find_conversations_with_person("Ana Cruz")  # evicts Sam Lee
+        assert list(engine._conversation_cache) == ["rob martinez", "ana cruz"]
+        engine._find_conversations_with_person("Rob Martinez")
+    assert mock_vector_store.hybrid_search.call_count == 3
+
+
+@patch('subprocess.run')
+def test_talking_points_skipped_without_openclaw(mock_subprocess, mock_db, mock_vector_store):
+    """Test that a missing openclaw binary skips talking points without spawning anything."""
+    from src.briefing_engine import BriefingEngine
+
+    with patch('shutil.which', return_value=None):
+        engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    assert engine._generate_talking_points("Rob Martinez", [], []) is None
+    mock_subprocess.assert_not_called()
+
+
+@patch('subprocess.run')
+def test_talking_points_prompt_is_compact(mock_subprocess, mock_db, mock_vector_store):
+    """Test that conversation snippets are trimmed and follow the static instructions."""
+    from src import briefing_engine
+    from src.briefing_engine import BriefingEngine
+
+    mock_subprocess.return_value = Mock(returncode=0, stdout="- Ask about FHIR\n")
+    with patch('shutil.which', return_value="/usr/bin/openclaw"):
+        engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    conversations = [{"text": "x" * 5000, "started_at": "2026-02-25T10:30:00", "embedding": [0.1] * 384}]
+    commitments = [{"speaker": "Rob", "action": "send the API docs", "deadline": "Friday", "confidence": 0.9}]
+
+    with patch.object(briefing_engine, "_openclaw_stdin_supported", None):
+        assert engine._generate_talking_points("Rob Martinez", conversations, commitments) == ["- Ask about FHIR"]
+    assert mock_subprocess.call_args[0][0] == ["/usr/bin/openclaw", "agent", "--stdin", "--max-tokens", "200"]
+    prompt = mock_subprocess.call_args[1]["input"]
+    assert prompt.startswith(briefing_engine._TALKING_POINTS_INSTRUCTIONS)
+    assert "x" * briefing_engine.TALKING_POINT_SNIPPET_CHARS in prompt
+    assert "x" * (briefing_engine.TALKING_POINT_SNIPPET_CHARS + 1) not in prompt
+    assert "embedding" not in prompt and "confidence" not in prompt
+    assert '"action":"send the API docs"' in prompt
+
+
+@patch('subprocess.run')
+def test_talking_points_fall_back_to_argv_without_stdin_support(mock_subprocess, mock_db, mock_vector_store):
+    """Test that an openclaw without --stdin gets the prompt as an argument from then on."""
+    from src import briefing_engine
+    from src.briefing_engine import BriefingEngine
+
+    with patch('shutil.which', return_value="/usr/bin/openclaw"):
+        engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    rejected = Mock(returncode=2, stdout="", stderr="unknown option '--stdin'")
+    ok = Mock(returncode=0, stdout="- Follow up\n")
+    mock_subprocess.side_effect = [rejected, ok, ok]
+
+    with patch.object(briefing_engine, "_openclaw_stdin_supported", None):
+        assert engine._generate_talking_points("Rob Martinez", [], []) == ["- Follow up"]
+        assert briefing_engine._openclaw_stdin_supported is False
+        assert engine._generate_talking_points("Rob Martinez", [], []) == ["- Follow up"]
+    argvs = [c[0][0] for c in mock_subprocess.call_args_list]
+    assert [argv[2] for argv in argvs] == ["--stdin", "--prompt", "--prompt"]
+
+
+@patch('subprocess.run')
+def test_talking_points_probe_stdin_once_when_both_forms_fail(mock_subprocess, mock_db, mock_vector_store):
+    """Test that a failing openclaw is not run twice per call after the first probe."""
+    from src import briefing_engine
+    from src.briefing_engine import BriefingEngine
+
+    with patch('shutil.which', return_value="/usr/bin/openclaw"):
+        engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    mock_subprocess.return_value = Mock(returncode=1, stdout="", stderr="not logged in")
+
+    with patch.object(briefing_engine, "_openclaw_stdin_supported", None):
+        for _ in range(3):
+            assert engine._generate_talking_points("Rob Martinez", [], []) is None
+        assert briefing_engine._openclaw_stdin_supported is False
+    argvs = [c[0][0] for c in mock_subprocess.call_args_list]
+    assert [argv[2] for argv in argvs] == ["--stdin", "--prompt", "--prompt", "--prompt"]
+
+
+def test_stream_meetings_with_ijson(mock_db, mock_vector_store):
+    """Test incremental parsing of gog output, including skipped events."""
+    ijson = pytest.importorskip("ijson")
+    from src.briefing_engine import BriefingEngine
+
+    events = [
+        {"id": "m1", "summary": "Standup", "attendees": [{"email": "rob@company.com"}]},
+        {"id": "m2", "summary": "Holiday", "allDay": True, "attendees": [{"email": "a@b.com"}]},
+        {"id": "m3", "summary": "Focus time"},
+    ]
+    engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    script = f"import sys; sys.stdout.write({json.dumps(json.dumps(events))})"
+    with patch("src.briefing_engine.ijson", ijson):
+        meetings = engine._stream_meetings([sys.executable, "-c", script], timeout=10)
+        assert [m["id"] for m in meetings] == ["m1"]
+        assert meetings[0]["attendees"][0]["name"] == "rob"
+
+        assert engine._stream_meetings([sys.executable, "-c", "print()"], timeout=10) == []
+        assert engine._stream_meetings([sys.executable, "-c", "import sys; sys.exit(1)"], timeout=10) is None
+        with pytest.raises(subprocess.TimeoutExpired):
+            engine._stream_meetings([sys.executable, "-c", "import time; time.sleep(5)"], timeout=0.2)
+
+
+def test_stream_meetings_does_not_block_on_gog_stderr(mock_db, mock_vector_store):
+    """Test that chatty stderr and malformed stdout report gog's real outcome, not a timeout."""
+    ijson = pytest.importorskip("ijson")
+    from src.briefing_engine import BriefingEngine
+
+    engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    chatty = ("import sys; sys.stderr.write('w' * 1_000_000); sys.stderr.flush(); "
+              "sys.stdout.write('[]')")
+    stuck = "import sys, time; sys.stdout.write('[{oops'); sys.stdout.flush(); time.sleep(30)"
+    with patch("src.briefing_engine.ijson", ijson):
+        assert engine._stream_meetings([sys.executable, "-c", chatty], timeout=10) == []
+        start = time.monotonic()
+        with pytest.raises(ijson.JSONError):
+            engine._stream_meetings([sys.executable, "-c", stuck], timeout=10)
+        assert time.monotonic() - start < 5
+
+
+def test_conversation_search_fuses_keyword_hits(mock_db, mock_vector_store):
+    """Test that keyword-only hits are merged with hybrid results by RRF."""
+    from src.briefing_engine import BriefingEngine
+
+    shared = {"conversation_id": "conv1", "text": "Rob mentioned the FHIR integration deadline"}
+    mock_vector_store.hybrid_search.return_value = [{"conversation_id": "conv2", "text": "Rob on budget"}, shared]
+    mock_db.search_utterances.return_value = [dict(shared, started_at=1.0), {"conversation_id": "conv3", "text": "Rob again"}]
+
+    engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    results = engine._find_conversations_with_person("Rob Martinez")
+
+    # conv1 appears in both lists, so it outranks the single-list hits
+    assert [r["conversation_id"] for r in results] == ["conv1", "conv2", "conv3"]
+
+
+def test_conversation_search_survives_vector_failure(mock_db, mock_vector_store):
+    """Test that keyword hits are still returned when hybrid search raises."""
+    from src.briefing_engine import BriefingEngine
+
+    mock_vector_store.hybrid_search.side_effect = RuntimeError("lancedb unavailable")
+    engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    results = engine._find_conversations_with_person("Rob Martinez")
+    assert [r["conversation_id"] for r in results] == ["conv1"]
+
+
 def test_format_briefing_markdown_no_meetings():
     """Test markdown formatting for no meetings."""
     from src.briefing_engine import BriefingEngine
@@ -333,4 +560,78 @@ def test_extract_recent_topics():
     
     assert len(topics) > 0
     # Should include topics from both text and topics field
-    assert any("fhir" in topic.lower() for topic in topics)
\ No newline at end of file
+    assert any("fhir" in topic.lower() for topic in topics)
+
+def test_person_entities_single_batched_query(mock_db, mock_vector_store):
+    """Entity mentions for all matched conversations come from one DB call."""
+    from src.briefing_engine import BriefingEngine
+
+    engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    mock_db.get_entity_mentions.return_value = [
+        {"entity_name": "FHIR"}, {"entity_name": "rob martinez"}, {"entity_name": "FHIR"},
+    ]
+    conversations = [{"conversation_id": "conv1"}, {"conversation_id": "conv2"},
+                     {"conversation_id": "conv1"}, {"text": "no id"}]
+
+    entities = engine._get_person_entities("Rob Martinez", conversations)
+
+    assert entities == ["FHIR"]
+    mock_db.get_entity_mentions.assert_called_once_with(conversation_ids=["conv1", "conv2"])
+
+
+def test_parse_iso_accepts_z_suffix_and_memoizes():
+    """Calendar and utterance timestamps parse once, including the UTC "Z" form."""
+    from src.briefing_engine import _parse_iso
+
+    _parse_iso.cache_clear()
+    first = _parse_iso("2026-02-25T10:30:00Z")
+    assert first == datetime.fromisoformat("2026-02-25T10:30:00+00:00")
+    assert _parse_iso("2026-02-25T10:30:00Z") is first
+    assert _parse_iso.cache_info().hits == 1
+
+
+def test_run_gog_timeout_kills_process_group(tmp_path):
+    """Test that a timed-out gog takes the processes it spawned down with it."""
+    import os
+    import time
+    from src.briefing_engine import _run_gog
+
+    pid_file = tmp_path / "child.pid"
+    script = (
+        "import subprocess, sys, time; "
+        "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+        f"open({str(pid_file)!r}, 'w').write(str(child.pid)); time.sleep(30)"
+    )
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_gog([sys.executable, "-c", script], timeout=1)
+
+    child_pid = int(pid_file.read_text())
+    for _ in range(50):
+        try:
+            os.kill(child_pid, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail("grandchild survived the gog timeout")
+
+
+def test_extract_recent_topics_keeps_order_and_stops_at_limit(mock_db, mock_vector_store):
+    """Test that topics come back in first-seen order and later conversations go unscanned."""
+    from src.briefing_engine import BriefingEngine, MAX_RECENT_TOPICS
+
+    engine = BriefingEngine(db=mock_db, vector_store=mock_vector_store)
+    later = Mock()
+    conversations = [
+        {"text": "alpha beta gamma delta epsilon zeta"},
+        {"topics": "Roadmap, Budget, Roadmap"},
+        {"text": "hiring plans quarterly offsite"},
+        later,
+    ]
+
+    topics = engine._extract_recent_topics(conversations)
+
+    assert topics == ["Alpha Beta", "Beta Gamma", "Gamma Delta", "Delta Epsilon", "Epsilon Zeta",
+                      "Roadmap", "Budget", "Hiring Plans"]
+    assert len(topics) == MAX_RECENT_TOPICS
+    later.get.assert_not_called()
@@ -0,0 +1,51 @@
+"""Tests for chatgpt_actions.py — ChatGPT Actions REST endpoints."""
+
+import time
+import warnings
+
+import pytest
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src import chatgpt_actions
+    monkeypatch.setattr(chatgpt_actions, "API_TOKEN", "")
+    chatgpt_actions.app.dependency_overrides[chatgpt_actions._get_db] = lambda: db
+    yield TestClient(chatgpt_actions.app)
+    chatgpt_actions.app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def conversation(db):
+    db.save_conversation("c1", time.time(), "2026-02-20", word_count=12,
+                         speakers=["SPEAKER_00", "SPEAKER_01"], topics=["roadmap", "hiring"],
+                         transcript="We talked about the roadmap.", summary="Roadmap sync")
+
+
+class TestListTranscripts:
+    def test_list_columns_are_strings(self, client, conversation):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            resp = client.get("/api/transcripts")
+        assert resp.status_code == 200
+        item = resp.json()["transcripts"][0]
+        assert item["speakers"] == "SPEAKER_00, SPEAKER_01"
+        assert item["topics"] == "roadmap, hiring"
+        assert item["transcript_preview"] == "We talked about the roadmap."
+
+    def test_missing_list_columns(self, client, db):
+        db.save_conversation("c2", time.time(), "2026-02-20")
+        item = client.get("/api/transcripts").json()["transcripts"][0]
+        assert item["speakers"] is None
+        assert item["topics"] is None
+
+
+class TestSearch:
+    def test_conversation_fallback_speakers_are_a_string(self, client, conversation):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            resp = client.get("/api/search", params={"q": "Roadmap sync"})
+        assert resp.status_code == 200
+        results = resp.json()["results"]
+        assert [r["speaker_id"] for r in results] == ["SPEAKER_00, SPEAKER_01"]
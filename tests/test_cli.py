@@ -0,0 +1,356 @@
+"""Tests for CLI helpers."""
+import os
+import re
+from datetime import datetime
+
+import pytest
+
+from src import cli
+
+
+class TestScanDir:
+    def test_filters_by_prefix_and_suffix(self, tmp_path):
+        for name in ("2026-02-20_10-00.md", "2026-02-20_11-00.txt", "2026-02-19_09-00.md"):
+            (tmp_path / name).write_text("hello world")
+        os.utime(tmp_path / "2026-02-20_10-00.md", (1000, 1000))
+
+        files = cli.scan_dir(tmp_path, "2026-02-20", ".md")
+
+        assert [f.name for f in files] == ["2026-02-20_10-00.md"]
+        assert files[0].path == tmp_path / "2026-02-20_10-00.md"
+        assert files[0].mtime == 1000
+        assert files[0].size == len("hello world")
+
+    def test_missing_directory(self, tmp_path):
+        assert cli.scan_dir(tmp_path / "nope") == []
+
+
+class TestScanConversations:
+    def test_both_directories(self, tmp_path, monkeypatch):
+        data, memory = tmp_path / "data", tmp_path / "memory"
+        data.mkdir()
+        memory.mkdir()
+        (data / "2026-02-20_10-00.md").write_text("a")
+        (memory / "2026-02-20_11-00.md").write_text("b")
+        (memory / "2026-02-19_11-00.md").write_text("c")
+        (memory / "2026-02-20_12-00.txt").write_text("d")
+        monkeypatch.setattr(cli, "CONVERSATIONS_DIR", data)
+        monkeypatch.setattr(cli, "MEMORY_CONVERSATIONS_DIR", memory)
+
+        names = [f.name for f in cli.scan_conversations("2026-02-20")]
+
+        assert names == ["2026-02-20_10-00.md", "2026-02-20_11-00.md"]
+
+    def test_missing_directories(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cli, "CONVERSATIONS_DIR", tmp_path / "a")
+        monkeypatch.setattr(cli, "MEMORY_CONVERSATIONS_DIR", tmp_path / "b")
+        assert cli.scan_conversations() == []
+
+
+class TestReadTranscript:
+    def test_decodes_utf8_and_replaces_bad_bytes(self, tmp_path):
+        path = tmp_path / "t.md"
+        path.write_bytes("café\n".encode() + b"\xff ok")
+        assert cli.read_transcript(path) == "café\n\ufffd ok"
+
+
+class TestTranscriptMeta:
+    def test_skips_headers(self):
+        text = "# 2026-02-20 Conversation\n---\n\n  Hello there, general Kenobi  \nsecond line\n"
+        assert cli.transcript_meta(text) == (10, "Hello there, general Kenobi")
+
+    def test_empty(self):
+        assert cli.transcript_meta("") == (0, "")
+
+
+class TestParseTimestampFromFilename:
+    @pytest.mark.parametrize("name,expected", [
+        ("2026-02-20_14-53-45_conversation.md", datetime(2026, 2, 20, 14, 53, 45)),
+        ("2026-02-20_13-52.md", datetime(2026, 2, 20, 13, 52)),
+        ("summary_2026-02-20_13-52.md", datetime(2026, 2, 20, 13, 52)),
+        ("2026-02-20_13-52-xx.md", datetime(2026, 2, 20, 13, 52)),
+        ("2026-02-20_13-52_from_2026-02-19_08-00-05.md", datetime(2026, 2, 19, 8, 0, 5)),
+        ("2026-13-20_13-52.md", None),
+        ("notes.md", None),
+    ])
+    def test_parse(self, name, expected):
+        assert cli.parse_timestamp_from_filename(name) == expected
+
+
+class TestLoadConfig:
+    def test_cached_until_saved(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cli, "CONFIG_FILE", tmp_path / "config.json")
+        assert cli.load_config() == {}
+
+        cli.save_config({"server": {"port": 8900}})
+        first = cli.load_config()
+        assert first == {"server": {"port": 8900}}
+        assert cli.load_config() is first
+
+        cli.save_config({"server": {"port": 8901}})
+        assert cli.load_config() == {"server": {"port": 8901}}
+
+
+class TestCountWordsInFile:
+    @pytest.mark.parametrize("text", [
+        "",
+        "   ",
+        "hello",
+        "  hello world  \n\nsecond\tline\x0bthird\x1cfourth ",
+        "café naïve\u00a0nbsp — dash",
+    ])
+    def test_matches_str_split(self, tmp_path, text):
+        path = tmp_path / "t.md"
+        path.write_text(text, encoding="utf-8")
+        assert cli.count_words_in_file(path) == len(text.split())
+
+    def test_unreadable(self, tmp_path):
+        assert cli.count_words_in_file(tmp_path / "missing.md") == 0
+
+
+class TestFileContains:
+    def test_case_insensitive_match(self, tmp_path):
+        path = tmp_path / "t.md"
+        path.write_text("# Notes\nDiscussed the Q2 Budget with Sarah\n")
+        pattern = re.compile(re.escape(b"q2 budget"), re.IGNORECASE)
+        assert cli.file_contains(path, pattern)
+        assert not cli.file_contains(path, re.compile(b"roadmap", re.IGNORECASE))
+
+    def test_empty_and_missing_files(self, tmp_path):
+        (tmp_path / "empty.md").write_text("")
+        pattern = re.compile(b"x")
+        assert not cli.file_contains(tmp_path / "empty.md", pattern)
+        assert not cli.file_contains(tmp_path / "missing.md", pattern)
+
+
+class _FakeDB:
+    def __init__(self):
+        self.closed = 0
+
+    def get_security_log(self, limit, reason):
+        return []
+
+    def get_all_settings(self):
+        return {}
+
+    def close(self):
+        self.closed += 1
+
+
+class TestDb:
+    def test_command_closes_once(self, monkeypatch):
+        from src import database
+
+        db = _FakeDB()
+        monkeypatch.setattr(database, "PerceptDB", lambda: db)
+        cli.cmd_security_log(type("Args", (), {"limit": 5, "reason": None})())
+        assert db.closed == 1
+
+    def test_closes_on_error(self, monkeypatch):
+        from src import database
+
+        db = _FakeDB()
+        monkeypatch.setattr(database, "PerceptDB", lambda: db)
+        with pytest.raises(RuntimeError):
+            with cli._db():
+                raise RuntimeError("boom")
+        assert db.closed == 1
+
+
+class TestFormatKw:
+    def test_scores_by_rank(self):
+        rows = [{"conversation_id": "c1", "text": "hello", "rank": -3.2}, {"text": "bye"}]
+        results = cli._format_kw(rows)
+        assert [r["score"] for r in results] == [1.0, 0.5]
+        assert results[0]["conversation_id"] == "c1"
+        assert results[1]["conversation_id"] == ""
+        assert results[0]["source"] == results[0]["chunk_type"] == "keyword"
+        assert "rank" not in results[0]
+
+
+class TestBuf:
+    def test_single_write(self, capsys):
+        p = cli._Buf()
+        p("one")
+        p()
+        p("two")
+        assert capsys.readouterr().out == ""
+        p.flush()
+        assert capsys.readouterr().out == "one\n\ntwo\n"
+        p.flush()
+        assert capsys.readouterr().out == ""
+
+
+class TestCheckHealth:
+    @pytest.fixture
+    def server(self):
+        import json
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/health":
+                    body = json.dumps({"status": "ok", "uptime": 12}).encode()
+                    self.send_response(200)
+                else:
+                    body = b"{}"
+                    self.send_response(404)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        httpd = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+        thread.start()
+        yield httpd
+        httpd.shutdown()
+        httpd.server_close()
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cli._health_cache.clear()
+
+    def test_running(self, server):
+        assert cli.check_health(server.server_address[1]) == {"status": "ok", "uptime": 12}
+
+    def test_cached_within_ttl(self, server, monkeypatch):
+        port = server.server_address[1]
+        assert cli.check_health(port) is not None
+        server.shutdown()
+        server.server_close()
+        assert cli.check_health(port) == {"status": "ok", "uptime": 12}
+        monkeypatch.setattr(cli, "HEALTH_CACHE_TTL", 0)
+        assert cli.check_health(port) is None
+
+    def test_not_running(self):
+        import socket
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        assert cli.check_health(port) is None
+
+
+class TestReadActionFields:
+    def test_fast_path(self, tmp_path):
+        import json
+
+        path = tmp_path / "a.json"
+        path.write_text(json.dumps({"intent": "email", "status": "executed", "timestamp": "2026-02-20T10:00:00",
+                                    "result": {"body": "x" * 1000}}, indent=2))
+        assert cli.read_action_fields(path) == {"intent": "email", "status": "executed",
+                                                "timestamp": "2026-02-20T10:00:00"}
+
+    @pytest.mark.parametrize("data", [
+        {"intent": "email", "status": "failed", "params": {"status": "sent"}, "timestamp": "t"},
+        {"intent": "say \"hi\"", "status": "executed", "timestamp": "t"},
+        {"intent": "email", "status": "pending"},
+        {"intent": "email", "status": "pending", "timestamp": 1700000000},
+    ])
+    def test_falls_back_to_json(self, tmp_path, data):
+        import json
+
+        path = tmp_path / "a.json"
+        path.write_text(json.dumps(data))
+        assert cli.read_action_fields(path) == data
+
+    def test_invalid_json(self, tmp_path):
+        path = tmp_path / "a.json"
+        path.write_text("")
+        with pytest.raises(ValueError):
+            cli.read_action_fields(path)
+
+
+class TestCmdTranscripts:
+    @pytest.fixture
+    def dirs(self, tmp_path, monkeypatch):
+        data, memory = tmp_path / "data", tmp_path / "memory"
+        data.mkdir()
+        memory.mkdir()
+        monkeypatch.setattr(cli, "CONVERSATIONS_DIR", data)
+        monkeypatch.setattr(cli, "MEMORY_CONVERSATIONS_DIR", memory)
+        return data, memory
+
+    def _args(self, search=None, limit=20):
+        return type("Args", (), {"today": False, "search": search, "limit": limit})()
+
+    def test_search_newest_first(self, dirs, capsys):
+        data, memory = dirs
+        files = {
+            data / "2026-02-18_09-00.md": "# Header\nBudget review with Sarah",
+            memory / "2026-02-19_09-00.md": "Roadmap planning",
+            data / "2026-02-20_09-00.md": "Q2 BUDGET numbers",
+            memory / "2026-02-21_09-00.md": "bud",
+        }
+        for i, (path, text) in enumerate(files.items()):
+            path.write_text(text)
+            os.utime(path, (1000 + i, 1000 + i))
+
+        cli.cmd_transcripts(self._args(search="Budget"))
+
+        out = capsys.readouterr().out
+        assert re.findall(r"2026-02-\d\d", out) == ["2026-02-20", "2026-02-18"]
+        assert "Budget review with Sarah" in out
+
+    def test_non_ascii_search(self, dirs, capsys):
+        data, _ = dirs
+        (data / "2026-02-20_09-00.md").write_text("Lunch at the CAFÉ")
+        cli.cmd_transcripts(self._args(search="café"))
+        assert "Lunch at the CAFÉ" in capsys.readouterr().out
+
+
+class TestCmdActions:
+    def test_newest_twenty(self, tmp_path, monkeypatch, capsys):
+        import json
+
+        actions = tmp_path / "actions"
+        actions.mkdir()
+        for i in range(25):
+            path = actions / f"a{i}.json"
+            path.write_text(json.dumps({"status": "executed", "intent": f"intent{i}", "timestamp": ""}))
+            os.utime(path, (1000 + i, 1000 + i))
+        monkeypatch.setattr(cli, "DATA_DIR", tmp_path)
+
+        cli.cmd_actions(None)
+
+        intents = re.findall(r"intent\d+", capsys.readouterr().out)
+        assert intents == [f"intent{i}" for i in range(24, 4, -1)]
+
+
+class TestCmdConfig:
+    def test_compact_json_when_piped(self, tmp_path, monkeypatch, capsys):
+        from src import database
+
+        monkeypatch.setattr(cli, "CONFIG_FILE", tmp_path / "config.json")
+        monkeypatch.setattr(database, "PerceptDB", _FakeDB)
+        cli.save_config({"server": {"port": 8900}})
+
+        cli.cmd_config(type("Args", (), {"action": None, "config_args": [], "legacy_set": None})())
+
+        assert '{"server":{"port":8900}}' in capsys.readouterr().out
+
+
+class TestParser:
+    @pytest.mark.parametrize("argv", [
+        ["status"],
+        ["search", "budget", "--mode", "keyword", "--date", "2026-02-20"],
+        ["config", "set", "webhook_secret", "abc"],
+        ["commitments", "fulfill", "--id", "c1"],
+        ["capture-browser", "watch", "--interval", "5"],
+    ])
+    def test_single_subparser_matches_full_parser(self, argv):
+        command = cli._sniff_subcommand(argv)
+        assert command == argv[0]
+        assert cli._get_parser(command).parse_args(argv) == cli._get_parser().parse_args(argv)
+
+    def test_builds_only_the_requested_subparser(self):
+        sub = next(a for a in cli._get_parser("status")._actions if a.dest == "command")
+        assert list(sub.choices) == ["status"]
+
+    @pytest.mark.parametrize("argv", [[], ["--help"], ["-h", "status"]])
+    def test_no_subcommand(self, argv):
+        assert cli._sniff_subcommand(argv) is None
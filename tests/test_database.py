@@ -3,6 +3,7 @@
 import time
 import json
 import pytest
+from unittest.mock import patch
 from src.database import PerceptDB
 
 
@@ -55,6 +56,12 @@ class TestConversations:
         assert len(db.get_conversations(date="2026-02-21")) == 1
         assert len(db.get_conversations(date="2025-01-01")) == 0
 
+    def test_daily_stats(self, db, sample_conversation_data):
+        db.save_conversation(**sample_conversation_data)
+        db.save_conversation(id="2026-02-21_12-00", timestamp=time.time(), date="2026-02-21", word_count=None)
+        assert db.conversations_daily_stats("2026-02-21") == (2, 200)
+        assert db.conversations_daily_stats("2025-01-01") == (0, 0)
+
     def test_search_conversations(self, db, sample_conversation_data):
         db.save_conversation(**sample_conversation_data)
         assert len(db.get_conversations(search="project")) == 1
@@ -63,6 +70,28 @@ class TestConversations:
     def test_get_nonexistent(self, db):
         assert db.get_conversation("nope") is None
 
+    def test_save_conversations_batch_upserts(self, db, sample_conversation_data):
+        db.save_conversation(**sample_conversation_data)
+        cid = sample_conversation_data["id"]
+        db.save_conversations_batch([
+            {"id": cid, "timestamp": sample_conversation_data["timestamp"],
+             "date": "2026-02-21", "word_count": 300, "summary_file_path": "s.md"},
+            {"id": "other", "timestamp": 1.0, "date": "2026-02-20", "topics": ["x"]},
+        ])
+        conv = db.get_conversation(cid)
+        assert conv["word_count"] == 300
+        assert conv["summary"] == "Brief chat about project."  # preserved via COALESCE
+        assert conv["summary_file_path"] == "s.md"
+        assert db.get_conversation("other")["topics"] == ["x"]
+
+    def test_iter_conversations_matches_get(self, db, sample_conversation_data):
+        for i in range(5):
+            db.save_conversation(id=f"c{i}", timestamp=1000.0 + i, date="2026-02-21",
+                                 speakers=["David"])
+        streamed = list(db.iter_conversations(limit=4, batch_size=2))
+        assert streamed == db.get_conversations(limit=4)
+        assert streamed[0]["speakers"] == ["David"]
+
     def test_get_recent_context(self, db, sample_conversation_data):
         db.save_conversation(**sample_conversation_data)
         ctx = db.get_recent_context(minutes=60)
@@ -90,6 +119,15 @@ class TestSpeakers:
         assert len(stats) == 1
         assert stats[0]["total_words"] == 100
 
+    def test_speakers_version_changes_on_update(self, db):
+        empty = db.speakers_version()
+        db.update_speaker("s1", name="Alice")
+        created = db.speakers_version()
+        assert created != empty
+        with patch("src.database.time.time", return_value=time.time() + 60):
+            db.update_speaker("s1", relationship="colleague")
+        assert db.speakers_version() != created
+
 
 class TestContacts:
     def test_save_and_get(self, db):
@@ -112,6 +150,15 @@ class TestContacts:
         db.delete_contact("c1")
         assert len(db.get_contacts()) == 0
 
+    def test_save_contacts_batch(self, db):
+        db.save_contact("c1", "Alice", email="a@b.com")
+        db.save_contacts_batch([{"id": "c1", "name": "Alice", "phone": "+1"},
+                                {"id": "c2", "name": "Bob"}])
+        contacts = {c["id"]: c for c in db.get_contacts()}
+        assert contacts["c1"]["email"] == "a@b.com"
+        assert contacts["c1"]["phone"] == "+1"
+        assert contacts["c2"]["name"] == "Bob"
+
 
 class TestActions:
     def test_save_action(self, db, sample_conversation_data):
@@ -138,6 +185,11 @@ class TestActions:
         assert len(db.get_actions(status="pending")) == 1
         assert len(db.get_actions(status="executed")) == 1
 
+    def test_iter_actions(self, db):
+        for intent in ("a", "b", "c"):
+            db.save_action(intent=intent, params={"k": intent})
+        assert list(db.iter_actions(batch_size=1)) == db.get_actions()
+
 
 class TestUtterances:
     def test_save_and_get(self, db, sample_conversation_data):
@@ -170,6 +222,28 @@ class TestUtterances:
         assert len(results) >= 1
         assert "fox" in results[0]["text"].lower() or "fox" in results[0].get("highlighted", "").lower()
 
+    def test_fts_substring_search(self, db, sample_conversation_data):
+        db.save_conversation(**sample_conversation_data)
+        db.update_speaker("S0", name="Test")
+        cid = sample_conversation_data["id"]
+        db.save_utterance("u1", cid, "S0", "Meeting with the Kubernetes team", 0, 2)
+        results = db.search_utterances("bernet")
+        assert len(results) == 1
+        assert results[0]["id"] == "u1"
+
+    def test_fts_search_date_filter(self, db, sample_conversation_data):
+        db.save_conversation(**sample_conversation_data)
+        db.save_conversation(**dict(sample_conversation_data, id="other", date="2020-01-01"))
+        db.update_speaker("S0", name="Test")
+        cid = sample_conversation_data["id"]
+        db.save_utterance("u1", cid, "S0", "Kubernetes rollout plan", 0, 2)
+        db.save_utterance("u2", "other", "S0", "Kubernetes cost review", 0, 2)
+        day = sample_conversation_data["date"]
+        assert [r["id"] for r in db.search_utterances("kubernetes", date_filter=day)] == ["u1"]
+        assert [r["id"] for r in db.search_utterances("bernet", date_filter="2020-01-01")] == ["u2"]
+        assert db.search_utterances("kubernetes", date_filter="1999-01-01") == []
+        assert len(db.search_utterances("kubernetes")) == 2
+
 
 class TestEntityMentions:
     def test_save_and_search(self, db, sample_conversation_data):
@@ -180,6 +254,28 @@ class TestEntityMentions:
         assert len(results) == 1
         assert results[0]["entity_name"] == "John Smith"
 
+    def test_save_batch(self, db, sample_conversation_data):
+        db.save_conversation(**sample_conversation_data)
+        cid = sample_conversation_data["id"]
+        db.save_entity_mentions_batch(cid, [("person", "John Smith"), ("org", "Acme Corp")])
+        assert len(db.search_entities("John")) == 1
+        assert len(db.search_entities("Acme")) == 1
+
+    def test_get_for_conversations(self, db, sample_conversation_data):
+        db.save_conversation(**sample_conversation_data)
+        db.save_conversation(**{**sample_conversation_data, "id": "other"})
+        db.save_entity_mention(sample_conversation_data["id"], "person", "John Smith")
+        db.save_entity_mention("other", "org", "Acme Corp")
+        names = {m["entity_name"] for m in db.get_entity_mentions([sample_conversation_data["id"], "other"])}
+        assert names == {"John Smith", "Acme Corp"}
+        assert db.get_entity_mentions([]) == []
+
+    def test_version_changes_on_insert(self, db, sample_conversation_data):
+        db.save_conversation(**sample_conversation_data)
+        before = db.entity_mentions_version()
+        db.save_entity_mention(sample_conversation_data["id"], "person", "John Smith")
+        assert db.entity_mentions_version() != before
+
 
 class TestRelationships:
     def test_save_new(self, db):
@@ -199,6 +295,22 @@ class TestRelationships:
         db.save_relationship("A", "C", "works_on")
         assert len(db.get_relationships(relation_type="works_on")) == 1
 
+    def test_filter_by_person_substring(self, db):
+        db.save_relationship("rob_martinez", "vectorcare_team", "team_member")
+        db.save_relationship("alice", "Rob Martinez", "mentioned_with")
+        db.save_relationship("alice", "bob", "mentioned_with")
+        rels = db.get_relationships(person="rob")
+        assert {(r["source_id"], r["target_id"]) for r in rels} == {
+            ("rob_martinez", "vectorcare_team"), ("alice", "Rob Martinez")}
+
+    def test_filter_by_person_is_literal_and_unicode_aware(self, db):
+        db.save_relationship("rob_martinez", "vectorcare_team", "team_member")
+        db.save_relationship("robXmartinez", "alice", "mentioned_with")
+        db.save_relationship("ÉLODIE", "bob", "mentioned_with")
+        assert [r["source_id"] for r in db.get_relationships(person="rob_martinez")] == ["rob_martinez"]
+        assert [r["source_id"] for r in db.get_relationships(person="élodie")] == ["ÉLODIE"]
+        assert db.get_relationships(person="%") == []
+
     def test_decay(self, db):
         db.save_relationship("A", "B", "mentioned_with")
         # Force last_seen to be old
@@ -214,6 +326,16 @@ class TestRelationships:
         rels = db.get_relationships()
         assert rels[0]["weight"] == 6.0
 
+    def test_save_batch_matches_sequential(self, db):
+        db.save_relationships_batch([
+            ("Alice", "Bob", "mentioned_with"),
+            ("Alice", "Bob", "mentioned_with"),
+            ("Alice", "Acme", "works_on"),
+        ], evidence="conv:1")
+        rels = {(r["target_id"], r["relation_type"]): r for r in db.get_relationships(entity_id="Alice")}
+        assert rels[("Bob", "mentioned_with")]["weight"] == 2.0
+        assert rels[("Acme", "works_on")]["weight"] == 1.0
+
 
 class TestPurge:
     def test_purge_conversation(self, db, sample_conversation_data):
@@ -250,6 +372,24 @@ class TestAnalytics:
         assert analytics["conversation_count"] == 1
         assert analytics["total_words"] == 200
 
+    def test_analytics_bundle_matches_periods(self, db, sample_conversation_data):
+        import datetime as dt
+        now = time.time()
+        today = dt.datetime.fromtimestamp(now).strftime("%Y-%m-%d")
+        db.save_conversation(**sample_conversation_data)
+        db.save_conversation(id="today", timestamp=now, date=today, word_count=50,
+                             segment_count=4, duration_seconds=30.0,
+                             summary_file_path="summaries/today.md")
+        bundle = db.get_analytics_bundle()
+        for period in ("today", "week", "month", "all"):
+            key = "total_words" if period == "all" else f"{period}_words"
+            assert bundle[key] == db.get_analytics(period)["total_words"]
+        assert bundle["conversation_count"] == 2
+        assert bundle["total_duration_s"] == 150.0
+        assert bundle["summary_count"] == 1
+        hour = dt.datetime.fromtimestamp(now).strftime("%H")
+        assert bundle["segments_per_hour"] == {hour: 4}
+
 
 class TestAudit:
     def test_audit(self, populated_db):
@@ -101,6 +101,18 @@ class TestBatchExtraction:
         entities = extractor.extract_from_utterances(utterances, conversation_id="2026-02-21_11-00")
         assert len(entities) > 0
 
+    def test_batched_matches_per_conversation(self, populated_db):
+        extractor = EntityExtractor(db=populated_db, llm_enabled=False)
+        batch = [
+            ("c1", [{"text": "I talked to Dr. Smith about the deal"}, {"text": "Ask Alice Cooper"}]),
+            ("c2", [{"text": "Email bob@example.com about Acme Corp"}]),
+        ]
+        batched = extractor.extract_from_utterances_batched(batch)
+        assert [cid for cid, _ in batched] == ["c1", "c2"]
+        for (cid, utts), (_, entities) in zip(batch, batched):
+            assert entities == extractor.extract_from_utterances(utts, cid)
+        assert extractor._directory is None
+
 
 class TestRelationshipBuilding:
     def test_build_person_person(self, populated_db):
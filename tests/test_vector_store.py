@@ -84,6 +84,53 @@ class TestEmbeddingsAndSearch:
                 assert count == 0
 
 
+class TestIndexAll:
+    def test_index_all_async_batches_across_conversations(self, tmp_path):
+        import asyncio
+        fake_vec = [0.1] * 128
+        with patch("src.vector_store._load_nvidia_key", return_value=None):
+            from src.vector_store import PerceptVectorStore
+            vs = PerceptVectorStore(db_path=str(tmp_path / "v"), nvidia_api_key=None)
+        db = MagicMock()
+        db.get_conversations.return_value = [
+            {"id": "c1", "transcript": "Hello world", "summary": "Greeting"},
+            {"id": "c2", "transcript": "Another talk"},
+            {"id": "c3", "transcript": "   "},
+            {"id": "c4", "transcript": "Already done"},
+        ]
+        embed = MagicMock(side_effect=lambda texts, input_type="passage": [fake_vec] * len(texts))
+        with patch.object(vs, "_indexed_conversation_ids", return_value={"c4"}), \
+             patch.object(vs, "_get_embeddings_batch", embed), \
+             patch.object(vs, "_add_records") as add:
+            result = asyncio.run(vs.index_all_async(db, batch_size=2))
+        assert result == {"total": 4, "indexed": 2, "skipped": 2, "failed": 0}
+        assert embed.call_count == 2  # 3 chunks packed into batches of 2
+        # Each conversation is written as soon as its last batch is embedded
+        writes = [[(r["conversation_id"], r["chunk_type"]) for r in call[0][0]]
+                  for call in add.call_args_list]
+        assert writes == [[("c1", "transcript"), ("c1", "summary")], [("c2", "transcript")]]
+
+    def test_index_all_async_skips_conversations_with_failed_batches(self, tmp_path):
+        import asyncio
+        fake_vec = [0.1] * 128
+        with patch("src.vector_store._load_nvidia_key", return_value=None):
+            from src.vector_store import PerceptVectorStore
+            vs = PerceptVectorStore(db_path=str(tmp_path / "v"), nvidia_api_key=None)
+        db = MagicMock()
+        db.get_conversations.return_value = [
+            {"id": "c1", "transcript": "Hello world", "summary": "Greeting"},
+            {"id": "c2", "transcript": "Another talk"},
+        ]
+        # One chunk per batch; the second (c1's summary) fails
+        embed = MagicMock(side_effect=[[fake_vec], None, [fake_vec]])
+        with patch.object(vs, "_indexed_conversation_ids", return_value=set()), \
+             patch.object(vs, "_get_embeddings_batch", embed), \
+             patch.object(vs, "_add_records") as add:
+            result = asyncio.run(vs.index_all_async(db, batch_size=1))
+        assert result == {"total": 2, "indexed": 1, "skipped": 0, "failed": 1}
+        assert [[r["conversation_id"] for r in call[0][0]] for call in add.call_args_list] == [["c2"]]
+
+
 class TestStats:
     def test_stats_empty(self, tmp_path):
         with patch("src.vector_store._load_nvidia_key", return_value=None):